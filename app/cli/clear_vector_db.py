@@ -6,6 +6,7 @@ import logging
 from qdrant_client import QdrantClient, models
 
 from app.core.settings import get_settings
+from app.pipeline.ingest.pdf.services.vector_store import build_quantization_config
 
 LOGGER = logging.getLogger("clear_vector_db")
 
@@ -15,6 +16,7 @@ def clear_vector_collection(
     collection_name: str,
     recreate: bool,
     vector_size: int,
+    scalar_quantization: bool = False,
 ) -> None:
     client = QdrantClient(url=qdrant_url)
     if client.collection_exists(collection_name):
@@ -30,6 +32,7 @@ def clear_vector_collection(
                 size=vector_size,
                 distance=models.Distance.COSINE,
             ),
+            quantization_config=build_quantization_config(scalar_quantization),
         )
         LOGGER.info(
             "Recreated collection: %s (vector_size=%s)",
@@ -75,6 +78,7 @@ def main() -> None:
         collection_name=args.collection,
         recreate=args.recreate,
         vector_size=args.vector_size,
+        scalar_quantization=get_settings().qdrant_scalar_quantization,
     )
 
 if __name__ == "__main__":
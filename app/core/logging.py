@@ -1,16 +1,52 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 
-def configure_logging(level: str) -> logging.Logger:
-    if not logging.getLogger().handlers:
+_LOG_LISTENER: QueueListener | None = None
+
+
+def configure_logging(level: str) -> tuple[logging.Logger, QueueListener]:
+    global _LOG_LISTENER
+    root = logging.getLogger()
+    if not root.handlers:
         logging.basicConfig(
             level=level,
             format="%(asctime)s %(levelname)s %(name)s %(message)s",
         )
-    return logging.getLogger("api")
+    logger = logging.getLogger("api")
+    if _LOG_LISTENER is not None:
+        return logger, _LOG_LISTENER
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        *(handler for handler in root.handlers if not isinstance(handler, QueueHandler)),
+        respect_handler_level=True,
+    )
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    listener.start()
+    atexit.register(stop_log_listener, listener)
+    _LOG_LISTENER = listener
+    return logger, listener
+
+
+def stop_log_listener(listener: QueueListener) -> None:
+    global _LOG_LISTENER
+    if listener is not _LOG_LISTENER:
+        return
+    _LOG_LISTENER = None
+    atexit.unregister(stop_log_listener)
+    logger = logging.getLogger("api")
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    logger.propagate = True
+    listener.stop()
 
 
 def log_event(
@@ -33,11 +69,13 @@ def log_event(
     }
     if error_code:
         payload["error_code"] = error_code
-    for key, value in fields.items():
-        if value is not None:
-            payload[key] = value
+    payload.update(fields)
+    log_event_fields(logger, payload)
+
 
-    log_line = " ".join(f"{key}={value}" for key, value in payload.items())
+def log_event_fields(logger: logging.Logger, payload: dict[str, Any]) -> None:
+    log_line = " ".join(f"{key}={value}" for key, value in payload.items() if value is not None)
+    status = payload.get("status")
     if status == "error":
         logger.error(log_line)
     elif status == "warning":
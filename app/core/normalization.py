@@ -4,6 +4,9 @@ import re
 
 from app.core.utils import collapse_spaces
 
+MATCH_PUNCTUATION_PATTERN = re.compile(r"[.,'\"()&/\\\-]")
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9\s]")
+
 LEGAL_SUFFIXES = {
     "inc",
     "corporation",
@@ -37,9 +40,10 @@ LEGAL_SUFFIX_PATTERNS: tuple[tuple[str, ...], ...] = (
 def normalize_match_text(value: str, *, remove_non_alnum: bool = True) -> str:
     normalized = value.casefold()
     normalized = normalized.replace("&", " and ")
-    normalized = re.sub(r"[.,'\"()&/\\\-]", " ", normalized)
     if remove_non_alnum:
-        normalized = re.sub(r"[^a-z0-9\s]", " ", normalized)
+        normalized = NON_ALNUM_PATTERN.sub(" ", normalized)
+    else:
+        normalized = MATCH_PUNCTUATION_PATTERN.sub(" ", normalized)
     return collapse_spaces(normalized)
 
 
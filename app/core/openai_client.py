@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import importlib.util
+from functools import lru_cache
+
+import httpx
+from openai import DefaultHttpxClient, OpenAI
+
+from app.core.settings import get_settings
+
+
+@lru_cache(maxsize=4)
+def shared_openai_client(api_key: str) -> OpenAI:
+    settings = get_settings()
+    timeout = httpx.Timeout(
+        settings.openai_timeout_seconds,
+        connect=settings.openai_connect_timeout_seconds,
+    )
+    http_client = DefaultHttpxClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive_connections,
+        ),
+    )
+    return OpenAI(api_key=api_key, http_client=http_client, timeout=timeout)
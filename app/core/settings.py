@@ -112,8 +112,15 @@ class Settings:
     openai_final_max_output_tokens: int
     openai_final_max_answer_chars: int
     openai_final_reasoning_effort: str
+    openai_timeout_seconds: float
+    openai_connect_timeout_seconds: float
+    openai_max_connections: int
+    openai_max_keepalive_connections: int
     qdrant_url: str
     qdrant_collection: str
+    qdrant_prefer_grpc: bool
+    qdrant_grpc_port: int
+    qdrant_scalar_quantization: bool
     pdf_chunk_size_tokens: int
     pdf_chunk_overlap_ratio: float
     pdf_dedup_similarity: float
@@ -123,6 +130,8 @@ class Settings:
     pdf_metadata_total_char_limit: int
     pdf_doc_version: str
     pdf_upload_batch_size: int
+    pdf_upload_parallel: int
+    pdf_llm_concurrency: int
     pdf_input_dir: Path
     pdf_topic_max_output_tokens: int
     pdf_topic_reasoning_effort: str
@@ -219,8 +228,23 @@ class Settings:
                 "OPENAI_FINAL_REASONING_EFFORT",
                 default="minimal",
             ),
+            openai_timeout_seconds=_get_float("OPENAI_TIMEOUT_SECONDS", default=600.0, minimum=1.0),
+            openai_connect_timeout_seconds=_get_float(
+                "OPENAI_CONNECT_TIMEOUT_SECONDS",
+                default=5.0,
+                minimum=0.1,
+            ),
+            openai_max_connections=_get_int("OPENAI_MAX_CONNECTIONS", default=32, minimum=1),
+            openai_max_keepalive_connections=_get_int(
+                "OPENAI_MAX_KEEPALIVE_CONNECTIONS",
+                default=32,
+                minimum=0,
+            ),
             qdrant_url=_get_text("QDRANT_URL", default="http://localhost:6333"),
             qdrant_collection=_get_text("QDRANT_COLLECTION", default="pdf_chunks"),
+            qdrant_prefer_grpc=_get_bool("QDRANT_PREFER_GRPC", default=True),
+            qdrant_grpc_port=_get_int("QDRANT_GRPC_PORT", default=6334, minimum=1),
+            qdrant_scalar_quantization=_get_bool("QDRANT_SCALAR_QUANTIZATION", default=False),
             pdf_chunk_size_tokens=_get_int("PDF_CHUNK_SIZE_TOKENS", default=900, minimum=100),
             pdf_chunk_overlap_ratio=_get_float(
                 "PDF_CHUNK_OVERLAP_RATIO",
@@ -245,6 +269,8 @@ class Settings:
             pdf_metadata_total_char_limit=_get_int("PDF_METADATA_TOTAL_CHAR_LIMIT", default=8000, minimum=200),
             pdf_doc_version=_get_text("PDF_DOC_VERSION", default="v1"),
             pdf_upload_batch_size=_get_int("PDF_UPLOAD_BATCH_SIZE", default=64, minimum=1),
+            pdf_upload_parallel=_get_int("PDF_UPLOAD_PARALLEL", default=1, minimum=1),
+            pdf_llm_concurrency=_get_int("PDF_LLM_CONCURRENCY", default=8, minimum=1),
             pdf_input_dir=Path(_get_text("PDF_INPUT_DIR", default="data/PDF")),
             pdf_topic_max_output_tokens=_get_int("PDF_TOPIC_MAX_OUTPUT_TOKENS", default=300, minimum=1),
             pdf_topic_reasoning_effort=_get_reasoning_effort("PDF_TOPIC_REASONING_EFFORT", default="minimal"),
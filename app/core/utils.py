@@ -5,6 +5,13 @@ import re
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def project_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -36,7 +43,7 @@ def extract_first_json_object(raw_text: str) -> dict[str, Any] | None:
             if depth == 0:
                 snippet = raw_text[start : index + 1]
                 try:
-                    parsed = json.loads(snippet)
+                    parsed = _loads_json(snippet)
                 except json.JSONDecodeError:
                     return None
                 if isinstance(parsed, dict):
@@ -45,5 +52,14 @@ def extract_first_json_object(raw_text: str) -> dict[str, Any] | None:
     return None
 
 
+def _loads_json(text: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def collapse_spaces(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
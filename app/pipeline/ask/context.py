@@ -7,6 +7,13 @@ from app.core.errors import AppError
 from app.pipeline.ask.models import IntentType, RAGBranchResult, SQLBranchResult
 
 
+@dataclass(slots=True)
+class AskDebugInfo:
+    intent_reason: str | None = None
+    resolved_entities: list[dict[str, Any]] = field(default_factory=list)
+    rejected_candidates: list[dict[str, Any]] = field(default_factory=list)
+
+
 @dataclass
 class AskPipelineContext:
     question: str
@@ -15,6 +22,7 @@ class AskPipelineContext:
     company_specific: bool = False
     intent_confidence: float = 0.0
     entities: list[dict[str, Any]] = field(default_factory=list)
+    entity_isins: tuple[str, ...] = ()
     used_sql: bool = False
     used_rag: bool = False
     sql: str | None = None
@@ -23,7 +31,7 @@ class AskPipelineContext:
     sources: list[dict[str, Any]] = field(default_factory=list)
     answer: str = ""
     errors: list[AppError] = field(default_factory=list)
-    debug: dict[str, Any] = field(default_factory=dict)
+    debug: AskDebugInfo = field(default_factory=AskDebugInfo)
     sql_result: SQLBranchResult = field(default_factory=lambda: SQLBranchResult(sql=None, rows_preview=[], success=False))
     rag_result: RAGBranchResult = field(
         default_factory=lambda: RAGBranchResult(sources=[], context_snippets=[], success=False)
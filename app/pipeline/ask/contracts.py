@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 from app.pipeline.ask.context import AskPipelineContext
 from app.pipeline.contracts import Stage
@@ -8,7 +8,6 @@ from app.pipeline.contracts import Stage
 AskStage = Stage[AskPipelineContext]
 
 
-@runtime_checkable
 class IntentStage(Protocol):
     name: str
 
@@ -16,7 +15,6 @@ class IntentStage(Protocol):
         ...
 
 
-@runtime_checkable
 class EntityStage(Protocol):
     name: str
 
@@ -24,7 +22,6 @@ class EntityStage(Protocol):
         ...
 
 
-@runtime_checkable
 class SQLStage(Protocol):
     name: str
 
@@ -32,7 +29,6 @@ class SQLStage(Protocol):
         ...
 
 
-@runtime_checkable
 class RAGStage(Protocol):
     name: str
 
@@ -40,7 +36,6 @@ class RAGStage(Protocol):
         ...
 
 
-@runtime_checkable
 class ComposeStage(Protocol):
     name: str
 
@@ -11,6 +11,7 @@ from app.pipeline.ask.stages.intent import IntentClassificationStage
 from app.pipeline.ask.stages.rag import RAGBranchStage
 from app.pipeline.ask.stages.sql import SQLBranchStage
 from app.pipeline.ask.models import IntentType, PipelineResult, intent_usage
+from app.pipeline.contracts import should_run_stage
 
 COMPANY_HINT_PATTERN = re.compile(r"\b(company|ticker|isin)\b", flags=re.IGNORECASE)
 SQL_SCREENING_HINT_PATTERN = re.compile(
@@ -122,8 +123,10 @@ class AskPipelineOrchestrator:
         if not context.company_specific:
             context.entities = []
 
-        context = self.sql_stage.run(context)
-        context = self.rag_stage.run(context)
+        if should_run_stage(self.sql_stage, context):
+            context = self.sql_stage.run(context)
+        if should_run_stage(self.rag_stage, context):
+            context = self.rag_stage.run(context)
         context = self.compose_stage.run(context)
         return context
 
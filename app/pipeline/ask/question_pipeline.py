@@ -39,6 +39,7 @@ class QuestionPipeline:
             max_limit=settings.sql_max_limit,
         )
         composer_instance = final_composer or FinalResponseComposer()
+        self.sql_executor = sql_executor_instance
 
         self.orchestrator = AskPipelineOrchestrator(
             intent_stage=IntentClassificationStage(router_instance),
@@ -53,3 +54,6 @@ class QuestionPipeline:
 
     def process(self, question: str) -> PipelineResult:
         return self.orchestrator.process(question=question)
+
+    def close(self) -> None:
+        self.sql_executor.close()
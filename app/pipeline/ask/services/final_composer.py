@@ -10,6 +10,7 @@ from typing import Any, Sequence
 from openai import OpenAI
 from pydantic import BaseModel, ConfigDict, ValidationError
 
+from app.core.openai_client import shared_openai_client
 from app.core.settings import get_settings
 from app.core.utils import extract_first_json_object, read_text_file
 
@@ -58,7 +59,7 @@ class FinalResponseComposer:
         api_key = self.settings.openai_api_key
         if not api_key:
             return None
-        self._openai_client = OpenAI(api_key=api_key)
+        self._openai_client = shared_openai_client(api_key)
         return self._openai_client
 
     def compose(
@@ -8,6 +8,7 @@ from typing import Literal
 from openai import OpenAI
 from pydantic import BaseModel, ConfigDict, ValidationError
 
+from app.core.openai_client import shared_openai_client
 from app.core.sqlite_schema import schema_lines_from_db
 from app.core.settings import get_settings
 from app.core.utils import extract_first_json_object, read_text_file
@@ -88,7 +89,7 @@ class IntentRouter:
         api_key = self.settings.openai_api_key
         if not api_key:
             return None
-        self._openai_client = OpenAI(api_key=api_key)
+        self._openai_client = shared_openai_client(api_key)
         return self._openai_client
 
     def classify(self, question: str) -> IntentDecision:
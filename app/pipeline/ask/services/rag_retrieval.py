@@ -9,6 +9,7 @@ from qdrant_client import QdrantClient, models
 from rapidfuzz import fuzz
 
 from app.core.normalization import normalize_match_text
+from app.core.openai_client import shared_openai_client
 from app.core.settings import get_settings
 
 def normalize_text(text: str) -> str:
@@ -251,10 +252,14 @@ def retrieve_chunks_with_mentions_fallback(
         api_key = settings.openai_api_key
         if not api_key:
             raise ValueError("OPENAI_API_KEY is not configured.")
-        openai_client = OpenAI(api_key=api_key)
+        openai_client = shared_openai_client(api_key)
 
     if qdrant_client is None:
-        qdrant_client = QdrantClient(url=qdrant_url)
+        qdrant_client = QdrantClient(
+            url=qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+        )
 
     query_vector = _embed_query(
         openai_client=openai_client,
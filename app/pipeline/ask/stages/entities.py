@@ -16,8 +16,8 @@ class EntityResolutionStage:
 
     def run(self, context: AskPipelineContext) -> AskPipelineContext:
         resolution = self.resolver.resolve(question=context.question)
-        context.debug["resolved_entities"] = [asdict(item) for item in resolution.entities]
-        context.debug["rejected_candidates"] = [asdict(item) for item in resolution.rejected_candidates]
+        context.debug.resolved_entities = [asdict(item) for item in resolution.entities]
+        context.debug.rejected_candidates = [asdict(item) for item in resolution.rejected_candidates]
         if resolution.rejected_candidates:
             context.errors.append(
                 AppError(
@@ -27,4 +27,5 @@ class EntityResolutionStage:
                 )
             )
         context.entities = [asdict(item) for item in resolution.entities]
+        context.entity_isins = tuple(isin for item in context.entities if (isin := item.get("isin")))
         return context
@@ -17,5 +17,5 @@ class IntentClassificationStage:
         context.raw_intent = decision.raw_intent
         context.company_specific = bool(decision.company_specific)
         context.intent_confidence = float(decision.confidence)
-        context.debug["intent_reason"] = decision.reason
+        context.debug.intent_reason = decision.reason
         return context
@@ -10,13 +10,10 @@ from app.pipeline.ask.models import RAGBranchResult
 class RAGBranchStage:
     name = "rag"
 
-    def run(self, context: AskPipelineContext) -> AskPipelineContext:
-        if not context.used_rag:
-            context.rag_result = RAGBranchResult(sources=[], context_snippets=[], success=False)
-            context.sources = []
-            context.rag_context_snippets = []
-            return context
+    def should_run(self, context: AskPipelineContext) -> bool:
+        return context.used_rag
 
+    def run(self, context: AskPipelineContext) -> AskPipelineContext:
         try:
             rag_result = retrieve_rag_context(
                 question=context.question,
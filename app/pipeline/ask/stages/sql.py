@@ -15,13 +15,10 @@ class SQLBranchStage:
         self.generator = generator
         self.executor = executor
 
-    def run(self, context: AskPipelineContext) -> AskPipelineContext:
-        if not context.used_sql:
-            context.sql_result = SQLBranchResult(sql=None, rows_preview=[], success=False)
-            context.sql = None
-            context.sql_rows_preview = []
-            return context
+    def should_run(self, context: AskPipelineContext) -> bool:
+        return context.used_sql
 
+    def run(self, context: AskPipelineContext) -> AskPipelineContext:
         generation = self.generator.generate(
             question=context.question,
             entities=context.entities,
@@ -44,7 +41,7 @@ class SQLBranchStage:
         execution = self.executor.validate_and_execute(
             candidate_sql,
             company_specific=context.company_specific,
-            entity_isins=[item.get("isin", "") for item in context.entities],
+            entity_isins=context.entity_isins,
         )
         if execution.error_code:
             error_code = (
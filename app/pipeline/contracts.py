@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import Protocol, TypeVar, runtime_checkable
+from typing import Protocol, TypeVar
 
 ContextT = TypeVar("ContextT")
 
 
-@runtime_checkable
 class Stage(Protocol[ContextT]):
     name: str
 
     def run(self, context: ContextT) -> ContextT:
         ...
+
+
+def should_run_stage(stage: object, context: object) -> bool:
+    predicate = getattr(stage, "should_run", None)
+    if predicate is None:
+        return True
+    return bool(predicate(context))
@@ -8,6 +8,12 @@ import pandas as pd
 from app.pipeline.ingest.equities.services.upsert_policy import SkippedEquity
 
 
+@dataclass(slots=True)
+class EquitiesDebugInfo:
+    source_rows: int = 0
+    unmapped_columns: list[str] = field(default_factory=list)
+
+
 @dataclass
 class EquitiesIngestContext:
     input_path: Path | None = None
@@ -27,4 +33,4 @@ class EquitiesIngestContext:
     updated_count: int = 0
     skipped_count: int = 0
     skipped: list[SkippedEquity] = field(default_factory=list)
-    debug: dict[str, object] = field(default_factory=dict)
+    debug: EquitiesDebugInfo = field(default_factory=EquitiesDebugInfo)
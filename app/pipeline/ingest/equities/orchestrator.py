@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Sequence
 
+from app.pipeline.contracts import should_run_stage
 from app.pipeline.ingest.contracts import EquitiesIngestStage
 from app.pipeline.ingest.equities.context import EquitiesIngestContext
 
@@ -14,5 +15,7 @@ class EquitiesIngestOrchestrator:
     def run(self, context: EquitiesIngestContext) -> EquitiesIngestContext:
         current = context
         for stage in self.stages:
+            if not should_run_stage(stage, current):
+                continue
             current = stage.run(current)
         return current
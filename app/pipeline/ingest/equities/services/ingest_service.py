@@ -5,6 +5,7 @@ import sqlite3
 
 from app.pipeline.ingest.equities.context import EquitiesIngestContext
 from app.pipeline.ingest.equities.services.normalization import (
+    attach_last_update_timestamps,
     read_source_file,
     resolve_column_mapping,
     row_to_record,
@@ -31,6 +32,7 @@ class EquitiesIngestService:
             context.dataframe = read_source_file(context.input_path)
         except Exception as exc:
             raise ValueError(f"Failed to read source file: {exc}") from exc
+        context.debug.source_rows = len(context.dataframe)
         return context
 
     def map_columns(self, context: EquitiesIngestContext) -> EquitiesIngestContext:
@@ -39,6 +41,7 @@ class EquitiesIngestService:
         mapping = resolve_column_mapping(context.dataframe)
         validate_required_mapping(mapping)
         context.mapping = mapping
+        context.debug.unmapped_columns = [name for name, column in mapping.items() if column is None]
         return context
 
     def normalize_rows(self, context: EquitiesIngestContext) -> EquitiesIngestContext:
@@ -52,6 +55,7 @@ class EquitiesIngestService:
         for row in row_dicts:
             record = row_to_record(row=row, mapping=context.mapping)
             records_to_insert.append(record)
+        attach_last_update_timestamps(records_to_insert)
 
         context.records_to_insert = records_to_insert
         context.skipped_missing = 0
@@ -62,7 +66,7 @@ class EquitiesIngestService:
         if context.db_path is None:
             raise ValueError("db_path is required.")
 
-        with sqlite3.connect(context.db_path) as connection:
+        with sqlite3.connect(context.db_path, cached_statements=256) as connection:
             initialize_database(connection, context.mode)
             ensure_schema_columns(connection)
             outcome = apply_equities_upsert_policy(
@@ -105,3 +109,6 @@ class EquitiesIngestService:
         LOGGER.info("Rows skipped (duplicate ISIN): %s", context.skipped_duplicates)
         if context.skipped_count:
             LOGGER.info("Rows skipped (total): %s", context.skipped_count)
+        LOGGER.debug("Source rows read: %s", context.debug.source_rows)
+        if context.debug.unmapped_columns:
+            LOGGER.debug("Unmapped optional columns: %s", ", ".join(context.debug.unmapped_columns))
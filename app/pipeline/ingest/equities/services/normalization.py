@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import html
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Iterator
 
 import pandas as pd
 
@@ -13,47 +15,57 @@ from app.core.normalization import (
 from app.core.utils import collapse_spaces
 from app.domain.equities.schema import COLUMN_SPECS
 
-NULL_TOKENS = {
-    "",
-    "n/a",
-    "na",
-    "<na>",
-    "nan",
-    "null",
-    "none",
-    "-",
-}
+NULL_TOKENS: frozenset[str] = frozenset(
+    {
+        "",
+        "n/a",
+        "na",
+        "<na>",
+        "nan",
+        "null",
+        "none",
+        "-",
+    }
+)
+
+COMMON_ALIAS_TAILS: frozenset[str] = frozenset(
+    {
+        "group",
+        "holdings",
+        "company",
+        "technologies",
+        "systems",
+        "international",
+        "industries",
+        "financial",
+        "bank",
+        "energy",
+    }
+)
 
-COMMON_ALIAS_TAILS = {
-    "group",
-    "holdings",
-    "company",
-    "technologies",
-    "systems",
-    "international",
-    "industries",
-    "financial",
-    "bank",
-    "energy",
-}
+
+def _unescape_if_needed(text: str) -> str:
+    return html.unescape(text) if "&" in text else text
 
 
 def strip_html(text: str) -> str:
+    if "<" not in text:
+        return text
     return re.sub(r"<[^>]+>", " ", text)
 
 
 def normalize_header(text: str) -> str:
-    return normalize_match_text(html.unescape(text), remove_non_alnum=True)
+    return normalize_match_text(_unescape_if_needed(text), remove_non_alnum=True)
 
 
-def clean_text(value: object) -> str | None:
+def clean_text(value: object, _null: frozenset[str] = NULL_TOKENS) -> str | None:
     if value is None:
         return None
     if pd.isna(value):
         return None
-    text = strip_html(html.unescape(str(value)))
+    text = strip_html(_unescape_if_needed(str(value)))
     text = collapse_spaces(text)
-    if text.casefold() in NULL_TOKENS:
+    if text.casefold() in _null:
         return None
     return text
 
@@ -109,6 +121,7 @@ def clean_date(value: object) -> str | None:
     return timestamp.date().isoformat()
 
 
+@lru_cache(maxsize=8192)
 def normalize_company_name(company_name: str, *, remove_the: bool = True) -> str:
     return normalize_company_name_shared(
         company_name,
@@ -136,47 +149,40 @@ def generate_short_aliases(normalized_name: str) -> list[str]:
     return short_aliases
 
 
-def build_alias_rows(company_name: str, isin: str, ticker: str | None) -> list[tuple[str, str, str, str, str]]:
+def build_alias_rows(company_name: str, isin: str, ticker: str | None) -> Iterator[tuple[str, str, str, str, str]]:
     cleaned_company = clean_text(company_name)
     if cleaned_company is None:
-        return []
+        return
 
-    candidate_rows: list[tuple[str, str, str, str, str]] = []
-
-    def add_alias(alias_text: str, alias_type: str) -> None:
-        cleaned_alias = clean_text(alias_text)
-        if cleaned_alias is None:
-            return
-        normalized_alias = normalize_company_name(cleaned_alias)
-        if not normalized_alias:
-            return
-        candidate_rows.append((normalized_alias, isin, cleaned_alias, cleaned_company, alias_type))
-
-    add_alias(cleaned_company, "primary")
+    candidates: list[tuple[str, str]] = [(cleaned_company, "primary")]
 
     without_the = re.sub(r"^the\s+", "", cleaned_company, flags=re.IGNORECASE).strip()
     if without_the and without_the != cleaned_company:
-        add_alias(without_the, "without_the")
+        candidates.append((without_the, "without_the"))
 
     normalized_company = normalize_company_name(cleaned_company)
     if normalized_company and normalized_company != cleaned_company.casefold():
-        add_alias(normalized_company, "normalized")
+        candidates.append((normalized_company, "normalized"))
 
-    for short_alias in generate_short_aliases(normalized_company):
-        add_alias(short_alias, "short")
+    candidates.extend((short_alias, "short") for short_alias in generate_short_aliases(normalized_company))
+
+    seen: set[str] = set()
+    for alias_text, alias_type in candidates:
+        cleaned_alias = clean_text(alias_text)
+        if cleaned_alias is None:
+            continue
+        normalized_alias = normalize_company_name(cleaned_alias)
+        if not normalized_alias or normalized_alias in seen:
+            continue
+        seen.add(normalized_alias)
+        yield (normalized_alias, isin, cleaned_alias, cleaned_company, alias_type)
 
     if ticker:
         cleaned_ticker = clean_ticker(ticker)
         if cleaned_ticker:
-            candidate_rows.append((cleaned_ticker.casefold(), isin, cleaned_ticker, cleaned_company, "ticker"))
-
-    unique_by_normalized: dict[str, tuple[str, str, str, str, str]] = {}
-    for row in candidate_rows:
-        alias_normalized = row[0]
-        if alias_normalized not in unique_by_normalized:
-            unique_by_normalized[alias_normalized] = row
-
-    return list(unique_by_normalized.values())
+            ticker_normalized = cleaned_ticker.casefold()
+            if ticker_normalized not in seen:
+                yield (ticker_normalized, isin, cleaned_ticker, cleaned_company, "ticker")
 
 
 def read_source_file(input_path: Path) -> pd.DataFrame:
@@ -214,20 +220,36 @@ def validate_required_mapping(mapping: dict[str, str | None]) -> None:
         raise ValueError(f"Missing required source columns after mapping: {missing_label}")
 
 
+_CONVERTERS_BY_VALUE_TYPE: dict[str, Callable[[object], object]] = {
+    "text": clean_text,
+    "real": clean_real,
+    "integer": clean_integer,
+    "date": clean_date,
+}
+
+_CONVERTERS_BY_COLUMN: dict[str, Callable[[object], object]] = {
+    "isin": clean_isin,
+    "ticker": clean_ticker,
+}
+
+
+def _resolve_converter(value_type: str, column_name: str) -> Callable[[object], object]:
+    converter = _CONVERTERS_BY_COLUMN.get(column_name)
+    if converter is not None:
+        return converter
+    return _CONVERTERS_BY_VALUE_TYPE.get(value_type, clean_text)
+
+
+CONVERTER_BY_SPEC: dict[str, Callable[[object], object]] = {
+    spec.name: _resolve_converter(spec.value_type, spec.name) for spec in COLUMN_SPECS
+}
+
+
 def convert_cell(raw_value: object, value_type: str, column_name: str) -> object:
-    if column_name == "isin":
-        return clean_isin(raw_value)
-    if column_name == "ticker":
-        return clean_ticker(raw_value)
-    if value_type == "text":
-        return clean_text(raw_value)
-    if value_type == "real":
-        return clean_real(raw_value)
-    if value_type == "integer":
-        return clean_integer(raw_value)
-    if value_type == "date":
-        return clean_date(raw_value)
-    return clean_text(raw_value)
+    converter = CONVERTER_BY_SPEC.get(column_name)
+    if converter is None:
+        converter = _resolve_converter(value_type, column_name)
+    return converter(raw_value)
 
 
 def row_to_record(
@@ -235,10 +257,10 @@ def row_to_record(
     mapping: dict[str, str | None],
 ) -> dict[str, object]:
     record: dict[str, object] = {}
-    for spec in COLUMN_SPECS:
-        source_column = mapping.get(spec.name)
+    for name, converter in CONVERTER_BY_SPEC.items():
+        source_column = mapping.get(name)
         raw_value = row.get(source_column) if source_column else None
-        record[spec.name] = convert_cell(raw_value, spec.value_type, spec.name)
+        record[name] = converter(raw_value)
 
     company_name = record.get("company_name")
     if isinstance(company_name, str) and company_name:
@@ -247,3 +269,10 @@ def row_to_record(
         record["normalized_company_name"] = None
 
     return record
+
+
+def attach_last_update_timestamps(records: list[dict[str, object]]) -> None:
+    raw_values = pd.Series([record.get("last_update") for record in records], dtype=object)
+    timestamps = pd.to_datetime(raw_values, errors="coerce", format="ISO8601")
+    for record, timestamp in zip(records, timestamps):
+        record["last_update_ts"] = None if pd.isna(timestamp) else timestamp
@@ -2,22 +2,26 @@ from __future__ import annotations
 
 import sqlite3
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Sequence
 
 import pandas as pd
 
 from app.domain.equities.schema import equities_insert_columns
 from app.pipeline.ingest.equities.services.normalization import build_alias_rows
 
+EXECUTEMANY_BATCH_SIZE = 10_000
+UPSERT_SAVEPOINT = "equities_upsert"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SkippedEquity:
     isin: str | None
     reason: str
     row_number: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EquitiesUpsertOutcome:
     added_count: int
     updated_count: int
@@ -54,22 +58,83 @@ def _build_update_statement(columns: Sequence[str]) -> str:
     )
 
 
+INSERT_COLUMNS: tuple[str, ...] = equities_insert_columns()
+UPDATE_COLUMNS: tuple[str, ...] = tuple(column for column in INSERT_COLUMNS if column != "isin")
+_insert_values = itemgetter(*INSERT_COLUMNS)
+_update_values = itemgetter(*UPDATE_COLUMNS)
+INSERT_EQUITY_SQL = _build_insert_statement(INSERT_COLUMNS)
+UPDATE_EQUITY_SQL = _build_update_statement(INSERT_COLUMNS)
+DELETE_ALIASES_SQL = "DELETE FROM company_aliases WHERE isin = ?;"
+INSERT_ALIAS_SQL = """
+    INSERT OR IGNORE INTO company_aliases (
+        alias_normalized,
+        isin,
+        alias,
+        company_name,
+        alias_type
+    ) VALUES (?, ?, ?, ?, ?);
+""".strip()
+SELECT_EXISTING_LAST_UPDATES_SQL = """
+    SELECT isin, last_update
+    FROM equities
+    WHERE isin IS NOT NULL
+      AND isin <> '';
+""".strip()
+SELECT_SECONDARY_INDEXES_SQL = """
+    SELECT name, sql
+    FROM sqlite_master
+    WHERE type = 'index'
+      AND tbl_name IN ('equities', 'company_aliases')
+      AND sql IS NOT NULL;
+""".strip()
+
+
+def _record_values(
+    record: dict[str, object],
+    getter: Callable[[dict[str, object]], tuple[object, ...]],
+    columns: Sequence[str],
+) -> tuple[object, ...]:
+    try:
+        return getter(record)
+    except KeyError:
+        return tuple(record.get(column) for column in columns)
+
+
 def _load_existing_last_updates(connection: sqlite3.Connection) -> dict[str, pd.Timestamp | None]:
-    rows = connection.execute(
-        """
-        SELECT isin, last_update
-        FROM equities
-        WHERE isin IS NOT NULL
-          AND isin <> '';
-        """
-    ).fetchall()
-    existing: dict[str, pd.Timestamp | None] = {}
-    for isin_raw, last_update_raw in rows:
-        isin = str(isin_raw).strip().upper()
-        if not isin:
-            continue
-        existing[isin] = _parse_last_update(last_update_raw)
-    return existing
+    frame = pd.read_sql_query(SELECT_EXISTING_LAST_UPDATES_SQL, connection)
+    if frame.empty:
+        return {}
+
+    isins = frame["isin"].astype(str).str.strip().str.upper()
+    try:
+        parsed = pd.to_datetime(frame["last_update"], errors="coerce", format="mixed")
+    except (TypeError, ValueError):
+        parsed = frame["last_update"].map(_parse_last_update)
+    else:
+        if isinstance(parsed.dtype, pd.DatetimeTZDtype):
+            parsed = parsed.dt.tz_localize(None)
+    last_updates = parsed.astype(object).where(parsed.notna(), None)
+
+    keep = isins != ""
+    return dict(zip(isins[keep], last_updates[keep]))
+
+
+def _drop_secondary_indexes(connection: sqlite3.Connection) -> list[str]:
+    rows = connection.execute(SELECT_SECONDARY_INDEXES_SQL).fetchall()
+    for index_name, _ in rows:
+        connection.execute(f'DROP INDEX IF EXISTS "{index_name}";')
+    return [index_sql for _, index_sql in rows]
+
+
+def _configure_sqlite_for_bulk(connection: sqlite3.Connection) -> None:
+    main_database = connection.execute("PRAGMA database_list;").fetchone()
+    if main_database is None or not main_database[2]:
+        return
+    connection.execute("PRAGMA journal_mode = WAL;")
+    connection.execute("PRAGMA synchronous = NORMAL;")
+    connection.execute("PRAGMA temp_store = MEMORY;")
+    connection.execute("PRAGMA cache_size = -65536;")
+    connection.execute("PRAGMA busy_timeout = 5000;")
 
 
 def apply_equities_upsert_policy(
@@ -78,43 +143,87 @@ def apply_equities_upsert_policy(
     records: Iterable[dict[str, object]],
     mode: str,
     row_number_start: int = 2,
+    configure_pragmas: bool = True,
 ) -> EquitiesUpsertOutcome:
     mode_clean = mode.strip().lower()
     if mode_clean not in {"replace", "append"}:
         raise ValueError("mode must be one of: replace, append")
 
-    columns = equities_insert_columns()
-    insert_statement = _build_insert_statement(columns)
-    update_statement = _build_update_statement(columns)
-    update_columns = [column for column in columns if column != "isin"]
-    alias_insert_statement = """
-        INSERT OR IGNORE INTO company_aliases (
-            alias_normalized,
-            isin,
-            alias,
-            company_name,
-            alias_type
-        ) VALUES (?, ?, ?, ?, ?);
-    """.strip()
+    use_savepoint = connection.in_transaction
+    if configure_pragmas and not use_savepoint:
+        _configure_sqlite_for_bulk(connection)
+    connection.execute(f"SAVEPOINT {UPSERT_SAVEPOINT};" if use_savepoint else "BEGIN IMMEDIATE;")
+    try:
+        deferred_indexes = _drop_secondary_indexes(connection) if mode_clean == "replace" else []
+        outcome = _apply_records(
+            connection=connection,
+            records=records,
+            mode_clean=mode_clean,
+            row_number_start=row_number_start,
+        )
+        for index_sql in deferred_indexes:
+            connection.execute(index_sql)
+    except BaseException:
+        if use_savepoint:
+            connection.execute(f"ROLLBACK TO SAVEPOINT {UPSERT_SAVEPOINT};")
+            connection.execute(f"RELEASE SAVEPOINT {UPSERT_SAVEPOINT};")
+        else:
+            connection.rollback()
+        raise
 
+    if use_savepoint:
+        connection.execute(f"RELEASE SAVEPOINT {UPSERT_SAVEPOINT};")
+    else:
+        connection.commit()
+    return outcome
+
+
+def _apply_records(
+    *,
+    connection: sqlite3.Connection,
+    records: Iterable[dict[str, object]],
+    mode_clean: str,
+    row_number_start: int,
+) -> EquitiesUpsertOutcome:
     existing_last_updates: dict[str, pd.Timestamp | None] = (
         _load_existing_last_updates(connection) if mode_clean == "append" else {}
     )
     seen_in_batch: set[str] = set()
 
+    to_insert: list[tuple[object, ...]] = []
+    to_update: list[tuple[object, ...]] = []
+    aliases_to_delete: list[tuple[str]] = []
+    alias_sources: list[tuple[str, str, str | None]] = []
+    skipped: list[SkippedEquity] = []
+
     added_count = 0
     updated_count = 0
     alias_rows_count = 0
-    skipped: list[SkippedEquity] = []
 
-    records_list = list(records)
-    for row_offset, record in enumerate(records_list):
+    def iter_alias_rows() -> Iterator[tuple[str, str, str, str, str]]:
+        nonlocal alias_rows_count
+        for company_name, isin, ticker in alias_sources:
+            for alias_row in build_alias_rows(company_name=company_name, isin=isin, ticker=ticker):
+                alias_rows_count += 1
+                yield alias_row
+
+    def flush() -> None:
+        nonlocal added_count, updated_count
+        connection.executemany(INSERT_EQUITY_SQL, to_insert)
+        connection.executemany(UPDATE_EQUITY_SQL, to_update)
+        connection.executemany(DELETE_ALIASES_SQL, aliases_to_delete)
+        connection.executemany(INSERT_ALIAS_SQL, iter_alias_rows())
+        added_count += len(to_insert)
+        updated_count += len(to_update)
+        to_insert.clear()
+        to_update.clear()
+        aliases_to_delete.clear()
+        alias_sources.clear()
+
+    for row_offset, record in enumerate(records):
         row_number = row_number_start + row_offset
 
         isin_raw = record.get("isin")
-        company_name_raw = record.get("company_name")
-        normalized_name_raw = record.get("normalized_company_name")
-
         isin = str(isin_raw).strip().upper() if isinstance(isin_raw, str) else None
         if not isin:
             skipped.append(SkippedEquity(isin=None, reason="missing_isin", row_number=row_number))
@@ -124,56 +233,49 @@ def apply_equities_upsert_policy(
             continue
         seen_in_batch.add(isin)
 
+        incoming_last_update = (
+            record["last_update_ts"]
+            if "last_update_ts" in record
+            else _parse_last_update(record.get("last_update"))
+        )
+        is_update = mode_clean == "append" and isin in existing_last_updates
+        if is_update:
+            existing_last_update = existing_last_updates.get(isin)
+            if incoming_last_update is None:
+                skipped.append(SkippedEquity(isin=isin, reason="missing_last_update", row_number=row_number))
+                continue
+            if existing_last_update is not None and incoming_last_update <= existing_last_update:
+                skipped.append(SkippedEquity(isin=isin, reason="stale_last_update", row_number=row_number))
+                continue
+
+        company_name_raw = record.get("company_name")
         company_name = str(company_name_raw).strip() if isinstance(company_name_raw, str) else ""
         if not company_name:
             skipped.append(SkippedEquity(isin=isin, reason="missing_company_name", row_number=row_number))
             continue
 
+        normalized_name_raw = record.get("normalized_company_name")
         normalized_name = str(normalized_name_raw).strip() if isinstance(normalized_name_raw, str) else ""
         if not normalized_name:
             skipped.append(SkippedEquity(isin=isin, reason="missing_normalized_company_name", row_number=row_number))
             continue
 
-        incoming_last_update = _parse_last_update(record.get("last_update"))
-        has_existing = isin in existing_last_updates
-
-        if mode_clean == "append" and has_existing:
-            existing_last_update = existing_last_updates.get(isin)
-            if incoming_last_update is None:
-                skipped.append(SkippedEquity(isin=isin, reason="missing_last_update", row_number=row_number))
-                continue
-            if existing_last_update is not None and incoming_last_update <= existing_last_update:
-                skipped.append(SkippedEquity(isin=isin, reason="stale_last_update", row_number=row_number))
-                continue
-
-            update_values = [record.get(column) for column in update_columns] + [isin]
-            connection.execute(update_statement, tuple(update_values))
-            connection.execute("DELETE FROM company_aliases WHERE isin = ?;", (isin,))
-            alias_rows = build_alias_rows(
-                company_name=company_name,
-                isin=isin,
-                ticker=record.get("ticker") if isinstance(record.get("ticker"), str) else None,
-            )
-            if alias_rows:
-                connection.executemany(alias_insert_statement, alias_rows)
-                alias_rows_count += len(alias_rows)
-            updated_count += 1
+        ticker = record.get("ticker") if isinstance(record.get("ticker"), str) else None
+        if is_update:
+            to_update.append((*_record_values(record, _update_values, UPDATE_COLUMNS), isin))
+            aliases_to_delete.append((isin,))
+            alias_sources.append((company_name, isin, ticker))
             existing_last_updates[isin] = incoming_last_update
-            continue
+        else:
+            to_insert.append(_record_values(record, _insert_values, INSERT_COLUMNS))
+            alias_sources.append((company_name, isin, ticker))
+            if mode_clean == "append":
+                existing_last_updates[isin] = incoming_last_update
 
-        values = tuple(record.get(column) for column in columns)
-        connection.execute(insert_statement, values)
-        alias_rows = build_alias_rows(
-            company_name=company_name,
-            isin=isin,
-            ticker=record.get("ticker") if isinstance(record.get("ticker"), str) else None,
-        )
-        if alias_rows:
-            connection.executemany(alias_insert_statement, alias_rows)
-            alias_rows_count += len(alias_rows)
-        added_count += 1
-        if mode_clean == "append":
-            existing_last_updates[isin] = incoming_last_update
+        if len(alias_sources) >= EXECUTEMANY_BATCH_SIZE:
+            flush()
+
+    flush()
 
     return EquitiesUpsertOutcome(
         added_count=added_count,
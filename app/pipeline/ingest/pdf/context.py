@@ -4,8 +4,22 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from app.pipeline.ingest.pdf.models import ChunkBatch, DocumentMetadata
 
-@dataclass
+
+@dataclass(slots=True)
+class IngestDocumentState:
+    pdf_path: Path
+    pages: list[tuple[int, str]]
+    file_hash: str
+    doc_id: str
+    preview_text: str
+    metadata: DocumentMetadata | None = None
+    chunks: ChunkBatch | None = None
+    points: list[Any] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class PDFIngestContext:
     input_paths: list[Path] = field(default_factory=list)
     metadata_db_path: Path | None = None
@@ -20,16 +34,21 @@ class PDFIngestContext:
     metadata_confidence_threshold: float = 0.70
     doc_version: str = "v1"
     batch_size: int = 64
+    upload_parallel: int = 1
+    scalar_quantization: bool = False
+    llm_concurrency: int = 8
     default_input_dir: Path = Path("data/PDF")
     topic_min_confidence: float = 0.60
     skip_duplicates_by_sha256: bool = False
     delete_skipped_files: bool = False
     fail_on_no_upload: bool = True
+    bulk_ingest: bool = False
+    known_file_hashes: dict[Path, str] = field(default_factory=dict)
 
     topic_classifier: Any | None = None
     normalized_embedding_model: str = ""
     resolved_inputs: list[Path] = field(default_factory=list)
-    documents: list[dict[str, Any]] = field(default_factory=list)
+    documents: list[IngestDocumentState] = field(default_factory=list)
 
     openai_client: Any | None = None
     qdrant_client: Any | None = None
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Iterator, Mapping
 
+FALLBACK_EVIDENCE: Mapping[str, str | None] = MappingProxyType(
+    {"title_line": None, "publisher_line": None, "year_line": None}
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DocumentMetadata:
     title: str | None
     publisher: str | None
@@ -15,7 +22,7 @@ class DocumentMetadata:
     title_source: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChunkRecord:
     point_id: str
     doc_id: str
@@ -29,20 +36,83 @@ class ChunkRecord:
     mentions_tickers: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
+class ChunkBatch:
+    doc_id: str
+    point_ids: list[str] = field(default_factory=list)
+    pages: array = field(default_factory=lambda: array("i"))
+    chunk_indices: array = field(default_factory=lambda: array("i"))
+    texts: list[str] = field(default_factory=list)
+    token_counts: array = field(default_factory=lambda: array("i"))
+    quote_snippets: list[str] = field(default_factory=list)
+    mentions_company_names: list[list[str]] = field(default_factory=list)
+    mentions_company_names_norm: list[list[str]] = field(default_factory=list)
+    mentions_tickers: list[list[str]] = field(default_factory=list)
+    mention_cache_rows: list[tuple[str, str, str, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def extend(self, other: ChunkBatch) -> None:
+        self.point_ids.extend(other.point_ids)
+        self.pages.extend(other.pages)
+        self.chunk_indices.extend(other.chunk_indices)
+        self.texts.extend(other.texts)
+        self.token_counts.extend(other.token_counts)
+        self.quote_snippets.extend(other.quote_snippets)
+        self.mentions_company_names.extend(other.mentions_company_names)
+        self.mentions_company_names_norm.extend(other.mentions_company_names_norm)
+        self.mentions_tickers.extend(other.mentions_tickers)
+        self.mention_cache_rows.extend(other.mention_cache_rows)
+
+    def records(self) -> Iterator[ChunkRecord]:
+        for row in zip(
+            self.point_ids,
+            self.pages,
+            self.chunk_indices,
+            self.texts,
+            self.token_counts,
+            self.quote_snippets,
+            self.mentions_company_names,
+            self.mentions_company_names_norm,
+            self.mentions_tickers,
+        ):
+            point_id, page, chunk_index, text, token_count, quote_snippet, names, names_norm, tickers = row
+            yield ChunkRecord(
+                point_id=point_id,
+                doc_id=self.doc_id,
+                page=page,
+                chunk_index=chunk_index,
+                text=text,
+                token_count=token_count,
+                quote_snippet=quote_snippet,
+                mentions_company_names=names,
+                mentions_company_names_norm=names_norm,
+                mentions_tickers=tickers,
+            )
+
+
+@dataclass(frozen=True, slots=True)
 class MentionCatalog:
     aliases: tuple[tuple[str, str], ...]
     ticker_patterns: tuple[tuple[str, re.Pattern[str]], ...]
+    alias_index: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    max_alias_tokens: int = 0
+    company_norms: dict[str, str] = field(default_factory=dict)
+    combined_ticker_pattern: re.Pattern[bytes] | None = None
+    shadowed_ticker_patterns: tuple[tuple[str, re.Pattern[bytes]], ...] = ()
+    unicode_ticker_patterns: tuple[tuple[str, re.Pattern[str]], ...] = ()
+    version: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IngestSkippedDocument:
     file_name: str
     reason: str
     details: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IngestPDFReport:
     accepted: list[str]
     skipped_documents: list[IngestSkippedDocument]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Sequence
 
+from app.pipeline.contracts import should_run_stage
 from app.pipeline.ingest.contracts import PDFIngestStage
 from app.pipeline.ingest.pdf.context import PDFIngestContext
 
@@ -14,5 +15,7 @@ class PDFIngestOrchestrator:
     def run(self, context: PDFIngestContext) -> PDFIngestContext:
         current = context
         for stage in self.stages:
+            if not should_run_stage(stage, current):
+                continue
             current = stage.run(current)
         return current
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Mapping, Sequence
 
 from app.pipeline.ingest.pdf.context import PDFIngestContext
 from app.pipeline.ingest.pdf.models import IngestPDFReport, IngestSkippedDocument
@@ -10,12 +10,10 @@ from app.pipeline.ingest.pdf.orchestrator import PDFIngestOrchestrator
 from app.pipeline.ingest.pdf.services.ingest_service import PDFIngestService
 from app.pipeline.ingest.pdf.services.topic_classifier import PDFTopicClassifier
 from app.pipeline.ingest.pdf.stages import (
-    ChunkStage,
+    ChunkEmbedUpsertStage,
     DiscoverStage,
-    EmbedStage,
     MetadataExtractStage,
     TopicFilterStage,
-    UpsertStage,
 )
 
 
@@ -39,6 +37,8 @@ class PDFIngestRequest:
     skip_duplicates_by_sha256: bool = False
     delete_skipped_files: bool = False
     fail_on_no_upload: bool = True
+    known_file_hashes: Mapping[Path, str] | None = None
+    bulk_ingest: bool = False
 
 
 class PDFIngestPipeline:
@@ -54,9 +54,7 @@ class PDFIngestPipeline:
                 DiscoverStage(ingest_service),
                 TopicFilterStage(ingest_service),
                 MetadataExtractStage(ingest_service),
-                ChunkStage(ingest_service),
-                EmbedStage(ingest_service),
-                UpsertStage(ingest_service),
+                ChunkEmbedUpsertStage(ingest_service),
             ]
         )
 
@@ -79,6 +77,8 @@ class PDFIngestPipeline:
             skip_duplicates_by_sha256=request.skip_duplicates_by_sha256,
             delete_skipped_files=request.delete_skipped_files,
             fail_on_no_upload=request.fail_on_no_upload,
+            known_file_hashes=dict(request.known_file_hashes or {}),
+            bulk_ingest=request.bulk_ingest,
             topic_classifier=request.topic_classifier,
         )
         completed = context
@@ -95,6 +95,9 @@ class PDFIngestPipeline:
             uploaded_points=completed.uploaded_points,
         )
 
+    def close(self) -> None:
+        self.service.shutdown()
+
 
 def ingest_pdfs(
     input_paths: Sequence[Path] | None,
@@ -136,8 +139,12 @@ def ingest_pdfs(
         skip_duplicates_by_sha256=skip_duplicates_by_sha256,
         delete_skipped_files=delete_skipped_files,
         fail_on_no_upload=fail_on_no_upload,
+        bulk_ingest=True,
     )
-    return pipeline.process(request)
+    try:
+        return pipeline.process(request)
+    finally:
+        pipeline.close()
 
 
 def _normalize_skipped_documents(items: Sequence[object]) -> list[IngestSkippedDocument]:
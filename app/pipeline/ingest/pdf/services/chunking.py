@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import hashlib
 import re
 import uuid
+from functools import lru_cache
 from typing import Sequence
 
 import tiktoken
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from app.core.utils import collapse_spaces
 
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+_POINT_ID_NAMESPACE_HASH = hashlib.sha1(uuid.NAMESPACE_URL.bytes, usedforsecurity=False)
+
 
 def get_tokenizer(model_name: str):
-    normalized = model_name.strip().lower()
+    return _load_tokenizer(model_name.strip().lower())
+
+
+@lru_cache(maxsize=8)
+def _load_tokenizer(normalized_model_name: str):
     try:
-        return tiktoken.encoding_for_model(normalized)
+        return tiktoken.encoding_for_model(normalized_model_name)
     except Exception:
         return tiktoken.get_encoding("cl100k_base")
 
@@ -24,26 +33,41 @@ def split_into_token_chunks(
     chunk_size: int,
     overlap_ratio: float,
 ) -> list[tuple[str, int]]:
-    token_ids = encoding.encode(text)
-    if not token_ids:
-        return []
+    return split_texts_into_token_chunks(
+        texts=[text],
+        encoding=encoding,
+        chunk_size=chunk_size,
+        overlap_ratio=overlap_ratio,
+    )[0]
 
+
+def split_texts_into_token_chunks(
+    texts: Sequence[str],
+    encoding,
+    chunk_size: int,
+    overlap_ratio: float,
+) -> list[list[tuple[str, int]]]:
     overlap_tokens = int(round(chunk_size * overlap_ratio))
     overlap_tokens = max(0, min(overlap_tokens, chunk_size - 1))
     step = max(1, chunk_size - overlap_tokens)
 
-    chunks: list[tuple[str, int]] = []
-    start = 0
-    while start < len(token_ids):
-        end = min(start + chunk_size, len(token_ids))
-        token_slice = token_ids[start:end]
-        chunk_text = collapse_spaces(encoding.decode(token_slice))
+    token_slices: list[list[int]] = []
+    owners: list[int] = []
+    for text_index, token_ids in enumerate(encoding.encode_batch(list(texts))):
+        if not token_ids:
+            continue
+        window_starts = range(0, max(len(token_ids) - chunk_size + step, 1), step)
+        token_slices.extend([token_ids[start : start + chunk_size] for start in window_starts])
+        owners.extend([text_index] * len(window_starts))
+
+    chunks_by_text: list[list[tuple[str, int]]] = [[] for _ in texts]
+    if not token_slices:
+        return chunks_by_text
+    for text_index, raw_text, token_slice in zip(owners, encoding.decode_batch(token_slices), token_slices):
+        chunk_text = collapse_spaces(raw_text)
         if chunk_text:
-            chunks.append((chunk_text, len(token_slice)))
-        if end >= len(token_ids):
-            break
-        start += step
-    return chunks
+            chunks_by_text[text_index].append((chunk_text, len(token_slice)))
+    return chunks_by_text
 
 
 def deduplicate_chunks(
@@ -52,20 +76,22 @@ def deduplicate_chunks(
 ) -> list[tuple[str, int]]:
     unique: list[tuple[str, int]] = []
     normalized_existing: list[str] = []
+    seen_exact: set[str] = set()
+    score_cutoff = similarity_threshold * 100.0
 
     for text, token_count in chunks:
         normalized = collapse_spaces(text.casefold())
-        if not normalized:
+        if not normalized or normalized in seen_exact:
             continue
 
-        is_duplicate = False
-        for previous in normalized_existing:
-            similarity = fuzz.ratio(normalized, previous) / 100.0
-            if similarity >= similarity_threshold:
-                is_duplicate = True
-                break
-
-        if is_duplicate:
+        seen_exact.add(normalized)
+        if normalized_existing and process.extractOne(
+            normalized,
+            normalized_existing,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=score_cutoff,
+        ):
             continue
 
         unique.append((text, token_count))
@@ -75,14 +101,27 @@ def deduplicate_chunks(
 
 
 def build_quote_snippet(chunk_text: str, max_chars: int = 350) -> str:
-    text = collapse_spaces(chunk_text)
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    text = collapse_spaces(chunk_text)[: max_chars * 2]
+    sentences = SENTENCE_SPLIT_PATTERN.split(text, maxsplit=2)
     snippet = " ".join(sentence for sentence in sentences[:2] if sentence)
     if not snippet:
         snippet = text
     return snippet[:max_chars].strip()
 
 
-def point_id_from_chunk(doc_id: str, page: int, chunk_index: int, text: str) -> str:
-    seed = f"{doc_id}|{page}|{chunk_index}|{text}"
-    return str(uuid.uuid5(uuid.NAMESPACE_URL, seed))
+def point_id_base_hasher(doc_id: str):
+    hasher = _POINT_ID_NAMESPACE_HASH.copy()
+    hasher.update(f"{doc_id}|".encode("utf-8"))
+    return hasher
+
+
+def point_id_from_chunk(
+    doc_id: str,
+    page: int,
+    chunk_index: int,
+    text: str,
+    base_hasher=None,
+) -> str:
+    hasher = (base_hasher or point_id_base_hasher(doc_id)).copy()
+    hasher.update(f"{page}|{chunk_index}|{text}".encode("utf-8"))
+    return str(uuid.UUID(bytes=hasher.digest()[:16], version=5))
@@ -9,6 +9,11 @@ from typing import Sequence
 
 from pypdf import PdfReader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.core.settings import get_settings
 from app.core.utils import collapse_spaces
 from app.pipeline.ingest.pdf.models import DocumentMetadata
@@ -35,17 +40,20 @@ DOCUMENTS_TABLE_SQL = """
 
 
 def file_sha256(path: Path) -> str:
-    hasher = hashlib.sha256()
     with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            hasher.update(block)
-    return hasher.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
 
 
 def build_doc_id(file_hash: str, doc_version: str) -> str:
     return f"pdf_{doc_version}_{file_hash[:16]}"
 
 
+def _dump_evidence(evidence: dict[str, object]) -> str:
+    if orjson is not None:
+        return orjson.dumps(evidence).decode("utf-8")
+    return json.dumps(evidence, ensure_ascii=False, separators=(",", ":"))
+
+
 def ensure_documents_table(connection: sqlite3.Connection) -> None:
     connection.execute(DOCUMENTS_TABLE_SQL)
 
@@ -101,7 +109,7 @@ def upsert_document_metadata(
             metadata.confidence,
             metadata.meta_source,
             metadata.title_source,
-            json.dumps(metadata.evidence, ensure_ascii=False),
+            _dump_evidence(metadata.evidence),
         ),
     )
 
@@ -162,3 +170,13 @@ def build_metadata_preview(pages: Sequence[tuple[int, str]], max_pages: int = 3)
         parts.append(block)
         total_chars += len(block)
     return "\n\n".join(parts)
+
+
+def load_pdf_document(
+    pdf_path: Path,
+    file_hash: str | None = None,
+) -> tuple[list[tuple[int, str]], str | None]:
+    pages = extract_pdf_pages(pdf_path)
+    if not pages:
+        return pages, None
+    return pages, file_hash or file_sha256(pdf_path)
@@ -1,47 +1,80 @@
 from __future__ import annotations
 
 import logging
+import os
 import sqlite3
+import threading
+from contextlib import ExitStack, closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterator, TypeVar
 
 from openai import OpenAI
 from qdrant_client import QdrantClient
 
+from app.core.openai_client import shared_openai_client
 from app.core.settings import get_settings
-from app.pipeline.ingest.pdf.context import PDFIngestContext
-from app.pipeline.ingest.pdf.models import ChunkRecord, DocumentMetadata
-from app.pipeline.ingest.pdf.services.chunking import (
-    build_quote_snippet,
-    deduplicate_chunks,
-    get_tokenizer,
-    point_id_from_chunk,
-    split_into_token_chunks,
-)
+from app.pipeline.ingest.pdf.context import IngestDocumentState, PDFIngestContext
+from app.pipeline.ingest.pdf.models import FALLBACK_EVIDENCE, ChunkBatch, DocumentMetadata
+from app.pipeline.ingest.pdf.services.chunking import get_tokenizer
 from app.pipeline.ingest.pdf.services.document_store import (
     build_doc_id,
     build_metadata_preview,
     ensure_documents_table,
-    extract_pdf_pages,
-    file_sha256,
+    load_pdf_document,
     resolve_input_paths,
     upsert_document_metadata,
 )
-from app.pipeline.ingest.pdf.services.mentions import detect_mentions, load_mention_catalog
-from app.pipeline.ingest.pdf.services.metadata_extraction import extract_metadata_with_llm
+from app.pipeline.ingest.pdf.services.mention_cache import (
+    ensure_mention_cache_table,
+    open_mention_cache_reader,
+    store_mention_cache_rows,
+)
+from app.pipeline.ingest.pdf.services.mentions import load_mention_catalog_cached
+from app.pipeline.ingest.pdf.services.metadata_extraction import (
+    build_metadata_cache_key,
+    ensure_metadata_cache_table,
+    extract_metadata_with_llm,
+    load_cached_metadata,
+    store_cached_metadata,
+)
+from app.pipeline.ingest.pdf.services.page_chunker import (
+    PageChunkTask,
+    chunk_pages,
+    chunk_pages_in_worker,
+    init_chunk_worker,
+)
 from app.pipeline.ingest.pdf.services.vector_store import (
-    chunk_records_to_points,
+    EMBEDDING_BATCH_MAX_TOKENS,
+    EMBEDDING_BATCH_SIZE,
+    bulk_ingest_mode,
+    chunk_batch_to_points,
     embed_texts,
     ensure_qdrant_collection,
-    enrich_chunk_payload,
     normalize_embedding_model_name,
     upload_points_in_batches,
 )
 
 LOGGER = logging.getLogger("ingest_pdfs")
 
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+DISCOVERY_MAX_WORKERS = 8
+CHUNK_PAGES_PER_TASK = 8
+STREAM_QUEUE_SIZE = 2
+STREAM_POLL_SECONDS = 0.1
+
 
 class PDFIngestService:
+    def __init__(self) -> None:
+        self._executor_lock = threading.Lock()
+        self._load_executor: ProcessPoolExecutor | None = None
+        self._chunk_executor: ProcessPoolExecutor | None = None
+        self._chunk_executor_key: tuple[str, str, Path | None] | None = None
+
     def discover(self, context: PDFIngestContext) -> PDFIngestContext:
         if context.chunk_size_tokens < 100:
             raise ValueError("chunk_size_tokens must be >= 100")
@@ -70,8 +103,15 @@ class PDFIngestService:
         context.normalized_embedding_model = normalize_embedding_model_name(context.embedding_model)
         context.tokenizer = get_tokenizer(context.normalized_embedding_model)
 
-        context.openai_client = OpenAI(api_key=api_key)
-        context.qdrant_client = QdrantClient(url=context.qdrant_url)
+        context.openai_client = shared_openai_client(api_key)
+        context.qdrant_client = QdrantClient(
+            url=context.qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+        )
+        context.upload_parallel = settings.pdf_upload_parallel
+        context.scalar_quantization = settings.qdrant_scalar_quantization
+        context.llm_concurrency = settings.pdf_llm_concurrency
         try:
             context.qdrant_client.get_collections()
         except Exception as exc:
@@ -82,253 +122,528 @@ class PDFIngestService:
 
         context.metadata_db_path.parent.mkdir(parents=True, exist_ok=True)
         connection = sqlite3.connect(context.metadata_db_path)
+        connection.execute("PRAGMA journal_mode = WAL;")
+        connection.execute("PRAGMA synchronous = NORMAL;")
+        connection.execute("PRAGMA busy_timeout = 5000;")
         ensure_documents_table(connection)
-        context.mention_catalog = load_mention_catalog(connection)
+        ensure_mention_cache_table(connection)
+        ensure_metadata_cache_table(connection)
+        context.mention_catalog = load_mention_catalog_cached(context.metadata_db_path)
         context.db_connection = connection
 
         if not context.mention_catalog.aliases and not context.mention_catalog.ticker_patterns:
             LOGGER.warning("Mention catalog is empty. Mention tagging will produce empty arrays.")
 
-        documents: list[dict[str, Any]] = []
-        for pdf_path in context.resolved_inputs:
+        documents: list[IngestDocumentState] = []
+        known_hashes = {path.resolve(): file_hash for path, file_hash in context.known_file_hashes.items()}
+        loaded_documents = self._load_documents(
+            context.resolved_inputs,
+            [known_hashes.get(pdf_path) for pdf_path in context.resolved_inputs],
+        )
+        for pdf_path, (pages, file_hash) in zip(context.resolved_inputs, loaded_documents):
             LOGGER.info("Processing PDF: %s", pdf_path)
-            pages = extract_pdf_pages(pdf_path)
-            if not pages:
+            if not pages or file_hash is None:
                 LOGGER.warning("No extractable text found in %s. Skipped.", pdf_path.name)
                 self._append_skipped(context, pdf_path.name, reason="unreadable")
                 self._delete_if_needed(context, pdf_path)
                 continue
 
-            file_hash = file_sha256(pdf_path)
             documents.append(
-                {
-                    "pdf_path": pdf_path,
-                    "pages": pages,
-                    "file_hash": file_hash,
-                    "doc_id": build_doc_id(file_hash=file_hash, doc_version=context.doc_version),
-                    "preview_text": build_metadata_preview(pages=pages, max_pages=3),
-                }
+                IngestDocumentState(
+                    pdf_path=pdf_path,
+                    pages=pages,
+                    file_hash=file_hash,
+                    doc_id=build_doc_id(file_hash=file_hash, doc_version=context.doc_version),
+                    preview_text=build_metadata_preview(pages=pages, max_pages=3),
+                )
             )
         context.documents = documents
         return context
 
     def topic_filter(self, context: PDFIngestContext) -> PDFIngestContext:
         connection = self._require_connection(context)
-        filtered: list[dict[str, Any]] = []
+        candidates: list[IngestDocumentState] = []
         for item in context.documents:
-            pdf_path = self._pdf_path(item)
-            file_hash = str(item["file_hash"])
-
             if context.skip_duplicates_by_sha256:
                 existing_doc = connection.execute(
                     "SELECT 1 FROM documents WHERE file_sha256 = ? LIMIT 1;",
-                    (file_hash,),
+                    (item.file_hash,),
                 ).fetchone()
                 if existing_doc is not None:
-                    self._append_skipped(context, pdf_path.name, reason="duplicate")
-                    self._delete_if_needed(context, pdf_path)
+                    self._append_skipped(context, item.pdf_path.name, reason="duplicate")
+                    self._delete_if_needed(context, item.pdf_path)
                     continue
+            candidates.append(item)
 
-            classifier = context.topic_classifier
-            if classifier is not None:
-                decision = classifier.classify(
-                    file_name=pdf_path.name,
-                    preview_text=str(item["preview_text"]),
-                )
-                if (not decision.is_relevant) and decision.confidence >= context.topic_min_confidence:
-                    self._append_skipped(
-                        context,
-                        pdf_path.name,
-                        reason="irrelevant",
-                        details=decision.reason,
-                    )
-                    self._delete_if_needed(context, pdf_path)
-                    continue
+        classifier = context.topic_classifier
+        if classifier is None:
+            context.documents = candidates
+            return context
 
+        decisions = self._map_llm_calls(
+            context,
+            lambda item: classifier.classify(file_name=item.pdf_path.name, preview_text=item.preview_text),
+            candidates,
+        )
+        filtered: list[IngestDocumentState] = []
+        for item, decision in zip(candidates, decisions):
+            if (not decision.is_relevant) and decision.confidence >= context.topic_min_confidence:
+                self._append_skipped(
+                    context,
+                    item.pdf_path.name,
+                    reason="irrelevant",
+                    details=decision.reason,
+                )
+                self._delete_if_needed(context, item.pdf_path)
+                continue
             filtered.append(item)
         context.documents = filtered
         return context
 
     def metadata_extract(self, context: PDFIngestContext) -> PDFIngestContext:
         openai_client = self._require_openai(context)
+        connection = self._require_connection(context)
+        pending: list[tuple[IngestDocumentState, str]] = []
         for item in context.documents:
-            pdf_path = self._pdf_path(item)
-            item["metadata"] = extract_metadata_with_llm(
+            cache_key = build_metadata_cache_key(
+                item.file_hash,
+                context.extractor_model,
+                context.metadata_confidence_threshold,
+            )
+            item.metadata = load_cached_metadata(connection, cache_key, item.pdf_path.name)
+            if item.metadata is None:
+                pending.append((item, cache_key))
+
+        extracted = self._map_llm_calls(
+            context,
+            lambda entry: extract_metadata_with_llm(
                 openai_client=openai_client,
                 extractor_model=context.extractor_model,
-                file_name=pdf_path.name,
-                preview_text=str(item["preview_text"]),
+                file_name=entry[0].pdf_path.name,
+                preview_text=entry[0].preview_text,
                 confidence_threshold=context.metadata_confidence_threshold,
-            )
+            ),
+            pending,
+        )
+        for (item, cache_key), metadata in zip(pending, extracted):
+            item.metadata = metadata
+            store_cached_metadata(connection, cache_key, item.pdf_path.name, metadata)
         return context
 
-    def chunk(self, context: PDFIngestContext) -> PDFIngestContext:
-        tokenizer = context.tokenizer
-        mention_catalog = context.mention_catalog
-        if tokenizer is None:
+    def _map_llm_calls(
+        self,
+        context: PDFIngestContext,
+        call: Callable[[ItemT], ResultT],
+        items: list[ItemT],
+    ) -> list[ResultT]:
+        if len(items) <= 1:
+            return [call(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(context.llm_concurrency, len(items))) as executor:
+            return list(executor.map(call, items))
+
+    def _iter_chunked_documents(
+        self,
+        context: PDFIngestContext,
+    ) -> Iterator[tuple[IngestDocumentState, ChunkBatch]]:
+        if context.tokenizer is None:
             raise ValueError("Tokenizer is not initialized.")
-        if mention_catalog is None:
+        if context.mention_catalog is None:
             raise ValueError("Mention catalog is not initialized.")
 
-        prepared: list[dict[str, Any]] = []
-        for item in context.documents:
-            pdf_path = self._pdf_path(item)
-            doc_id = str(item["doc_id"])
-            pages = list(item["pages"])
-
-            chunk_records: list[ChunkRecord] = []
-            for page_number, page_text in pages:
-                raw_chunks = split_into_token_chunks(
-                    text=page_text,
-                    encoding=tokenizer,
-                    chunk_size=context.chunk_size_tokens,
-                    overlap_ratio=context.chunk_overlap_ratio,
-                )
-                unique_chunks = deduplicate_chunks(
-                    chunks=raw_chunks,
-                    similarity_threshold=context.dedup_similarity,
-                )
-                for chunk_index, (chunk_text, token_count) in enumerate(unique_chunks):
-                    mentions_company_names, mentions_company_names_norm, mentions_tickers = detect_mentions(
-                        chunk_text=chunk_text,
-                        catalog=mention_catalog,
-                    )
-                    chunk_records.append(
-                        ChunkRecord(
-                            point_id=point_id_from_chunk(
-                                doc_id=doc_id,
-                                page=page_number,
-                                chunk_index=chunk_index,
-                                text=chunk_text,
-                            ),
-                            doc_id=doc_id,
-                            page=page_number,
-                            chunk_index=chunk_index,
-                            text=chunk_text,
-                            token_count=token_count,
-                            quote_snippet=build_quote_snippet(chunk_text),
-                            mentions_company_names=mentions_company_names,
-                            mentions_company_names_norm=mentions_company_names_norm,
-                            mentions_tickers=mentions_tickers,
-                        )
+        documents = context.documents
+        tasks: list[PageChunkTask] = []
+        task_owners: list[int] = []
+        for doc_index, item in enumerate(documents):
+            for start in range(0, len(item.pages), CHUNK_PAGES_PER_TASK):
+                tasks.append(
+                    (
+                        item.doc_id,
+                        item.pages[start : start + CHUNK_PAGES_PER_TASK],
+                        context.chunk_size_tokens,
+                        context.chunk_overlap_ratio,
+                        context.dedup_similarity,
                     )
+                )
+                task_owners.append(doc_index)
+
+        batches = [ChunkBatch(doc_id=item.doc_id) for item in documents]
+        pending = [0] * len(documents)
+        for doc_index in task_owners:
+            pending[doc_index] += 1
+        for doc_index, count in enumerate(pending):
+            if count == 0:
+                yield documents[doc_index], batches[doc_index]
+        for doc_index, batch in zip(task_owners, self._run_chunk_tasks(context, tasks)):
+            batches[doc_index].extend(batch)
+            pending[doc_index] -= 1
+            if pending[doc_index] == 0:
+                yield documents[doc_index], batches[doc_index]
+
+    def _store_mention_cache(
+        self,
+        context: PDFIngestContext,
+        connection: sqlite3.Connection,
+        batch: ChunkBatch,
+    ) -> None:
+        rows = batch.mention_cache_rows
+        if not rows or context.mention_catalog is None:
+            return
+        try:
+            store_mention_cache_rows(connection, context.mention_catalog.version, rows)
+        except sqlite3.Error as exc:
+            LOGGER.warning("Failed to cache chunk mentions for %s: %s", batch.doc_id, exc)
+        batch.mention_cache_rows = []
 
-            if not chunk_records:
-                LOGGER.warning("No chunks generated for %s. Skipped upload.", pdf_path.name)
-                self._append_skipped(context, pdf_path.name, reason="unreadable")
-                self._delete_if_needed(context, pdf_path)
-                continue
-
-            item["chunk_records"] = chunk_records
-            prepared.append(item)
-        context.documents = prepared
-        return context
+    def _skip_unchunked(self, context: PDFIngestContext, item: IngestDocumentState) -> None:
+        LOGGER.warning("No chunks generated for %s. Skipped upload.", item.pdf_path.name)
+        self._append_skipped(context, item.pdf_path.name, reason="unreadable")
+        self._delete_if_needed(context, item.pdf_path)
 
-    def embed(self, context: PDFIngestContext) -> PDFIngestContext:
-        openai_client = self._require_openai(context)
-        qdrant_client = self._require_qdrant(context)
-
-        prepared: list[dict[str, Any]] = []
-        for item in context.documents:
-            pdf_path = self._pdf_path(item)
-            chunk_records = list(item["chunk_records"])
-            metadata = item.get("metadata")
-            if not isinstance(metadata, DocumentMetadata):
-                metadata = DocumentMetadata(
-                    title=pdf_path.stem,
-                    publisher="Unknown",
-                    year=None,
-                    confidence=0.0,
-                    evidence={"title_line": None, "publisher_line": None, "year_line": None},
-                    meta_source="filename_fallback",
-                    title_source="filename_fallback",
+    def _run_chunk_tasks(
+        self,
+        context: PDFIngestContext,
+        tasks: list[PageChunkTask],
+    ) -> Iterator[ChunkBatch]:
+        if len(tasks) <= 1 or len(context.documents) <= 1:
+            with closing(open_mention_cache_reader(context.metadata_db_path)) as mention_cache:
+                for doc_id, pages, chunk_size, overlap_ratio, dedup_similarity in tasks:
+                    yield chunk_pages(
+                        doc_id=doc_id,
+                        pages=pages,
+                        encoding=context.tokenizer,
+                        catalog=context.mention_catalog,
+                        chunk_size=chunk_size,
+                        overlap_ratio=overlap_ratio,
+                        dedup_similarity=dedup_similarity,
+                        mention_cache=mention_cache,
+                    )
+            return
+        executor = self._get_chunk_executor(context)
+        try:
+            yield from executor.map(chunk_pages_in_worker, tasks)
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise
+
+    def _get_chunk_executor(self, context: PDFIngestContext) -> ProcessPoolExecutor:
+        catalog = context.mention_catalog
+        if catalog is None:
+            raise ValueError("Mention catalog is not initialized.")
+        key = (context.normalized_embedding_model, catalog.version, context.metadata_db_path)
+        with self._executor_lock:
+            if self._chunk_executor is not None and self._chunk_executor_key != key:
+                self._chunk_executor.shutdown(wait=False)
+                self._chunk_executor = None
+            if self._chunk_executor is None:
+                self._chunk_executor = ProcessPoolExecutor(
+                    max_workers=max(1, (os.cpu_count() or 2) - 1),
+                    initializer=init_chunk_worker,
+                    initargs=(context.normalized_embedding_model, catalog, context.metadata_db_path),
+                )
+                self._chunk_executor_key = key
+            return self._chunk_executor
+
+    def _get_load_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._load_executor is None:
+                self._load_executor = ProcessPoolExecutor(
+                    max_workers=min(DISCOVERY_MAX_WORKERS, os.cpu_count() or 1)
                 )
-                item["metadata"] = metadata
+            return self._load_executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._executor_lock:
+            if executor is self._load_executor:
+                self._load_executor = None
+            if executor is self._chunk_executor:
+                self._chunk_executor = None
+                self._chunk_executor_key = None
+        executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            executors = (self._load_executor, self._chunk_executor)
+            self._load_executor = None
+            self._chunk_executor = None
+            self._chunk_executor_key = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown()
+
+    def _ensure_metadata(self, item: IngestDocumentState) -> None:
+        if item.metadata is not None:
+            return
+        item.metadata = DocumentMetadata(
+            title=item.pdf_path.stem,
+            publisher="Unknown",
+            year=None,
+            confidence=0.0,
+            evidence=dict(FALLBACK_EVIDENCE),
+            meta_source="filename_fallback",
+            title_source="filename_fallback",
+        )
 
+    def _build_points(
+        self,
+        context: PDFIngestContext,
+        qdrant_client: QdrantClient,
+        item: IngestDocumentState,
+        vectors: list[list[float]] | Exception,
+    ) -> list[Any]:
+        if isinstance(vectors, Exception):
+            raise vectors
+        if item.metadata is None:
+            raise ValueError(f"Metadata is not prepared for {item.pdf_path.name}.")
+        ensure_qdrant_collection(
+            qdrant_client=qdrant_client,
+            collection_name=context.qdrant_collection,
+            vector_size=len(vectors[0]),
+            scalar_quantization=context.scalar_quantization,
+        )
+        return chunk_batch_to_points(
+            batch=self._require_chunks(item),
+            vectors=vectors,
+            metadata=item.metadata,
+        )
+
+    def _embed_documents(
+        self,
+        context: PDFIngestContext,
+        openai_client: OpenAI,
+        documents: list[IngestDocumentState],
+    ) -> list[list[list[float]] | Exception]:
+        results: list[list[list[float]] | Exception] = [[] for _ in documents]
+        for group in self._group_for_embedding(documents):
+            batches = [self._require_chunks(documents[index]) for index in group]
             try:
                 vectors = embed_texts(
                     openai_client=openai_client,
                     embedding_model=context.normalized_embedding_model,
-                    texts=[record.text for record in chunk_records],
-                )
-                ensure_qdrant_collection(
-                    qdrant_client=qdrant_client,
-                    collection_name=context.qdrant_collection,
-                    vector_size=len(vectors[0]),
+                    texts=[text for batch in batches for text in batch.texts],
+                    token_counts=[count for batch in batches for count in batch.token_counts],
                 )
-                points = chunk_records_to_points(chunk_records=chunk_records, vectors=vectors)
-                enrich_chunk_payload(points=points, metadata=metadata)
             except Exception as exc:
-                context.failed_docs += 1
-                LOGGER.error("Failed ingest for %s: %s", pdf_path.name, exc)
-                self._append_skipped(
-                    context,
-                    pdf_path.name,
-                    reason="failed_ingest",
-                    details=str(exc),
-                )
-                self._delete_if_needed(context, pdf_path)
+                if len(group) == 1:
+                    results[group[0]] = exc
+                    continue
+                for index, batch in zip(group, batches):
+                    try:
+                        results[index] = embed_texts(
+                            openai_client=openai_client,
+                            embedding_model=context.normalized_embedding_model,
+                            texts=batch.texts,
+                            token_counts=batch.token_counts,
+                        )
+                    except Exception as document_exc:
+                        results[index] = document_exc
                 continue
 
-            item["points"] = points
-            prepared.append(item)
-        context.documents = prepared
-        return context
-
-    def upsert(self, context: PDFIngestContext) -> PDFIngestContext:
-        connection = self._require_connection(context)
+            offset = 0
+            for index, batch in zip(group, batches):
+                count = len(batch)
+                results[index] = vectors[offset : offset + count]
+                offset += count
+        return results
+
+    def _group_for_embedding(self, documents: list[IngestDocumentState]) -> list[list[int]]:
+        groups: list[list[int]] = []
+        current: list[int] = []
+        current_texts = 0
+        current_tokens = 0
+        for index, item in enumerate(documents):
+            batch = self._require_chunks(item)
+            texts = len(batch)
+            tokens = sum(batch.token_counts)
+            if current and (
+                current_texts + texts > EMBEDDING_BATCH_SIZE
+                or current_tokens + tokens > EMBEDDING_BATCH_MAX_TOKENS
+            ):
+                groups.append(current)
+                current, current_texts, current_tokens = [], 0, 0
+            current.append(index)
+            current_texts += texts
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def chunk_embed_upsert(self, context: PDFIngestContext) -> PDFIngestContext:
+        openai_client = self._require_openai(context)
         qdrant_client = self._require_qdrant(context)
+        connection = self._require_connection(context)
 
         for item in context.documents:
-            pdf_path = self._pdf_path(item)
-            metadata = item.get("metadata")
-            if not isinstance(metadata, DocumentMetadata):
-                continue
-            points = item.get("points")
-            if not isinstance(points, list) or not points:
+            self._ensure_metadata(item)
+
+        chunk_queue: Queue[IngestDocumentState | None] = Queue(maxsize=STREAM_QUEUE_SIZE)
+        embed_queue: Queue[tuple[IngestDocumentState, Exception | None] | None] = Queue(
+            maxsize=STREAM_QUEUE_SIZE
+        )
+        stop = threading.Event()
+        uploaded: list[IngestDocumentState] = []
+        bulk_started = False
+
+        if connection.in_transaction:
+            connection.commit()
+        with ExitStack() as bulk_mode, ThreadPoolExecutor(max_workers=2) as executor:
+            producer = executor.submit(self._chunk_producer, context, chunk_queue, stop)
+            embedder = executor.submit(
+                self._embed_worker,
+                context,
+                openai_client,
+                qdrant_client,
+                chunk_queue,
+                embed_queue,
+                stop,
+            )
+            try:
+                while (entry := self._get(embed_queue, stop)) is not None:
+                    item, error = entry
+                    if item.chunks is not None:
+                        self._store_mention_cache(context, connection, item.chunks)
+                        connection.commit()
+                    if error is not None:
+                        self._record_failure(context, item, error)
+                        continue
+                    if not item.chunks:
+                        self._skip_unchunked(context, item)
+                        continue
+                    if context.bulk_ingest and not bulk_started:
+                        bulk_mode.enter_context(bulk_ingest_mode(qdrant_client, context.qdrant_collection))
+                        bulk_started = True
+                    if self._upsert_document(context, connection, qdrant_client, item):
+                        uploaded.append(item)
+                stop.set()
+                producer.result()
+                embedder.result()
+            except BaseException:
+                stop.set()
+                raise
+
+        context.documents = uploaded
+        return context
+
+    def _chunk_producer(
+        self,
+        context: PDFIngestContext,
+        chunk_queue: Queue[IngestDocumentState | None],
+        stop: threading.Event,
+    ) -> None:
+        try:
+            for item, batch in self._iter_chunked_documents(context):
+                item.chunks = batch
+                if not self._put(chunk_queue, item, stop):
+                    return
+        finally:
+            self._put(chunk_queue, None, stop)
+
+    def _embed_worker(
+        self,
+        context: PDFIngestContext,
+        openai_client: OpenAI,
+        qdrant_client: QdrantClient,
+        chunk_queue: Queue[IngestDocumentState | None],
+        embed_queue: Queue[tuple[IngestDocumentState, Exception | None] | None],
+        stop: threading.Event,
+    ) -> None:
+        try:
+            finished = False
+            while not finished:
+                item = self._get(chunk_queue, stop)
+                if item is None:
+                    return
+                group = [item]
+                while True:
+                    try:
+                        queued = chunk_queue.get_nowait()
+                    except Empty:
+                        break
+                    if queued is None:
+                        finished = True
+                        break
+                    group.append(queued)
+
+                embeddable = [member for member in group if member.chunks]
+                embeddings = self._embed_documents(context, openai_client, embeddable)
+                errors: dict[int, Exception] = {}
+                for member, vectors in zip(embeddable, embeddings):
+                    try:
+                        member.points = self._build_points(context, qdrant_client, member, vectors)
+                    except Exception as exc:
+                        errors[id(member)] = exc
+                for member in group:
+                    if not self._put(embed_queue, (member, errors.get(id(member))), stop):
+                        return
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            self._put(embed_queue, None, stop)
+
+    def _put(self, target: Queue[Any], item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=STREAM_POLL_SECONDS)
+            except Full:
                 continue
+            return True
+        return False
 
+    def _get(self, source: Queue[Any], stop: threading.Event) -> Any:
+        while not stop.is_set():
             try:
-                upsert_document_metadata(
-                    connection=connection,
-                    doc_id=str(item["doc_id"]),
-                    pdf_path=pdf_path,
-                    doc_version=context.doc_version,
-                    file_hash=str(item["file_hash"]),
-                    metadata=metadata,
-                )
-                upload_points_in_batches(
-                    qdrant_client=qdrant_client,
-                    collection_name=context.qdrant_collection,
-                    points=points,
-                    batch_size=context.batch_size,
-                )
-                connection.commit()
-            except Exception as exc:
-                context.failed_docs += 1
-                LOGGER.error("Failed ingest for %s: %s", pdf_path.name, exc)
-                self._append_skipped(
-                    context,
-                    pdf_path.name,
-                    reason="failed_ingest",
-                    details=str(exc),
-                )
-                connection.commit()
-                self._delete_if_needed(context, pdf_path)
+                return source.get(timeout=STREAM_POLL_SECONDS)
+            except Empty:
                 continue
+        return None
 
-            context.total_docs += 1
-            context.total_chunks += len(item.get("chunk_records", []))
-            context.uploaded_points += len(points)
-            context.accepted.append(pdf_path.name)
-            LOGGER.info(
-                "Uploaded %s chunks for %s (doc_id=%s, meta_source=%s)",
-                len(points),
-                pdf_path.name,
-                item["doc_id"],
-                metadata.meta_source,
+    def _upsert_document(
+        self,
+        context: PDFIngestContext,
+        connection: sqlite3.Connection,
+        qdrant_client: QdrantClient,
+        item: IngestDocumentState,
+    ) -> bool:
+        pdf_path = item.pdf_path
+        metadata = item.metadata
+        points = item.points
+        if metadata is None or not points:
+            return False
+
+        try:
+            upload_points_in_batches(
+                qdrant_client=qdrant_client,
+                collection_name=context.qdrant_collection,
+                points=points,
+                batch_size=context.batch_size,
+                parallel=context.upload_parallel,
             )
-        return context
+            upsert_document_metadata(
+                connection=connection,
+                doc_id=item.doc_id,
+                pdf_path=pdf_path,
+                doc_version=context.doc_version,
+                file_hash=item.file_hash,
+                metadata=metadata,
+            )
+            connection.commit()
+        except Exception as exc:
+            connection.rollback()
+            self._record_failure(context, item, exc)
+            return False
+
+        context.total_docs += 1
+        context.total_chunks += len(points)
+        context.uploaded_points += len(points)
+        context.accepted.append(pdf_path.name)
+        LOGGER.info(
+            "Uploaded %s chunks for %s (doc_id=%s, meta_source=%s)",
+            len(points),
+            pdf_path.name,
+            item.doc_id,
+            metadata.meta_source,
+        )
+        return True
 
     def finalize(self, context: PDFIngestContext) -> PDFIngestContext:
         LOGGER.info(
@@ -352,6 +667,37 @@ class PDFIngestService:
             connection.close()
         context.db_connection = None
 
+    def _load_documents(
+        self,
+        pdf_paths: list[Path],
+        file_hashes: list[str | None],
+    ) -> Iterator[tuple[list[tuple[int, str]], str | None]]:
+        if len(pdf_paths) <= 1:
+            yield from map(load_pdf_document, pdf_paths, file_hashes)
+            return
+        executor = self._get_load_executor()
+        try:
+            yield from executor.map(load_pdf_document, pdf_paths, file_hashes, chunksize=4)
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise
+
+    def _record_failure(
+        self,
+        context: PDFIngestContext,
+        item: IngestDocumentState,
+        exc: Exception,
+    ) -> None:
+        context.failed_docs += 1
+        LOGGER.error("Failed ingest for %s: %s", item.pdf_path.name, exc)
+        self._append_skipped(
+            context,
+            item.pdf_path.name,
+            reason="failed_ingest",
+            details=str(exc),
+        )
+        self._delete_if_needed(context, item.pdf_path)
+
     def _append_skipped(
         self,
         context: PDFIngestContext,
@@ -382,14 +728,13 @@ class PDFIngestService:
             return context.qdrant_client
         raise ValueError("Qdrant client is not initialized.")
 
+    def _require_chunks(self, item: IngestDocumentState) -> ChunkBatch:
+        if item.chunks is not None:
+            return item.chunks
+        raise ValueError(f"Chunks are not prepared for {item.pdf_path.name}.")
+
     def _require_connection(self, context: PDFIngestContext) -> sqlite3.Connection:
         connection = context.db_connection
         if isinstance(connection, sqlite3.Connection):
             return connection
         raise ValueError("Metadata DB connection is not initialized.")
-
-    def _pdf_path(self, item: dict[str, Any]) -> Path:
-        pdf_path = item.get("pdf_path")
-        if isinstance(pdf_path, Path):
-            return pdf_path
-        raise ValueError("Invalid document payload: pdf_path is required.")
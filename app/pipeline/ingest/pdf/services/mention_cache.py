@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Sequence
+
+MENTION_CACHE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS mention_cache (
+        text_hash TEXT NOT NULL,
+        catalog_version TEXT NOT NULL,
+        companies TEXT NOT NULL,
+        companies_norm TEXT NOT NULL,
+        tickers TEXT NOT NULL,
+        PRIMARY KEY (text_hash, catalog_version)
+    ) WITHOUT ROWID;
+""".strip()
+
+INSERT_MENTION_CACHE_SQL = """
+    INSERT OR IGNORE INTO mention_cache (text_hash, catalog_version, companies, companies_norm, tickers)
+    VALUES (?, ?, ?, ?, ?);
+""".strip()
+
+LOOKUP_BATCH_SIZE = 500
+
+Mentions = tuple[list[str], list[str], list[str]]
+MentionCacheRow = tuple[str, str, str, str]
+
+
+def ensure_mention_cache_table(connection: sqlite3.Connection) -> None:
+    connection.execute(MENTION_CACHE_TABLE_SQL)
+
+
+def open_mention_cache_reader(db_path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def mention_text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def build_mention_cache_row(text_hash: str, mentions: Mentions) -> MentionCacheRow:
+    companies, companies_norm, tickers = mentions
+    return text_hash, json.dumps(companies), json.dumps(companies_norm), json.dumps(tickers)
+
+
+def load_cached_mentions(
+    connection: sqlite3.Connection,
+    catalog_version: str,
+    text_hashes: Sequence[str],
+) -> dict[str, Mentions]:
+    cached: dict[str, Mentions] = {}
+    for start in range(0, len(text_hashes), LOOKUP_BATCH_SIZE):
+        batch = text_hashes[start : start + LOOKUP_BATCH_SIZE]
+        placeholders = ", ".join("?" for _ in batch)
+        rows = connection.execute(
+            f"""
+            SELECT text_hash, companies, companies_norm, tickers
+            FROM mention_cache
+            WHERE catalog_version = ?
+              AND text_hash IN ({placeholders});
+            """,
+            (catalog_version, *batch),
+        ).fetchall()
+        for text_hash, companies, companies_norm, tickers in rows:
+            cached[text_hash] = (json.loads(companies), json.loads(companies_norm), json.loads(tickers))
+    return cached
+
+
+def store_mention_cache_rows(
+    connection: sqlite3.Connection,
+    catalog_version: str,
+    rows: Iterable[MentionCacheRow],
+) -> None:
+    connection.executemany(
+        INSERT_MENTION_CACHE_SQL,
+        ((text_hash, catalog_version, *payload) for text_hash, *payload in rows),
+    )
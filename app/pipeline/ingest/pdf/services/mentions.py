@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import re
 import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable
 
 from app.core.normalization import normalize_match_text
 from app.core.utils import collapse_spaces
 from app.pipeline.ingest.pdf.models import MentionCatalog
 
+MENTION_RULES_VERSION = "1"
+CATALOG_CACHE_SIZE = 4
+
+_CATALOG_CACHE: dict[str, MentionCatalog] = {}
+_CATALOG_CACHE_LOCK = threading.Lock()
+
 
 def normalize_text(text: str) -> str:
     return normalize_match_text(text, remove_non_alnum=True)
@@ -21,6 +32,11 @@ def table_exists(connection: sqlite3.Connection, table_name: str) -> bool:
 
 
 def load_mention_catalog(connection: sqlite3.Connection) -> MentionCatalog:
+    aliases, tickers = load_catalog_sources(connection)
+    return build_mention_catalog(aliases, tickers, build_catalog_version(aliases, tickers))
+
+
+def load_catalog_sources(connection: sqlite3.Connection) -> tuple[list[tuple[str, str]], list[str]]:
     aliases: dict[tuple[str, str], None] = {}
     if table_exists(connection, "company_aliases"):
         rows = connection.execute(
@@ -60,9 +76,7 @@ def load_mention_catalog(connection: sqlite3.Connection) -> MentionCatalog:
                 continue
             aliases[(alias, company)] = None
 
-    sorted_aliases = sorted(aliases.keys(), key=lambda item: len(item[0]), reverse=True)
-
-    ticker_patterns: dict[str, re.Pattern[str]] = {}
+    tickers: dict[str, None] = {}
     if table_exists(connection, "equities"):
         rows = connection.execute(
             """
@@ -76,40 +90,133 @@ def load_mention_catalog(connection: sqlite3.Connection) -> MentionCatalog:
             ticker = collapse_spaces(str(ticker_raw)).upper()
             if len(ticker) < 2:
                 continue
-            pattern = re.compile(rf"(?<![A-Z0-9]){re.escape(ticker)}(?![A-Z0-9])")
-            ticker_patterns.setdefault(ticker, pattern)
-
+            tickers[ticker] = None
+    return list(aliases), list(tickers)
+
+
+def build_mention_catalog(
+    aliases: list[tuple[str, str]],
+    tickers: list[str],
+    version: str,
+) -> MentionCatalog:
+    ticker_patterns = {
+        ticker: re.compile(rf"(?<![A-Z0-9]){re.escape(ticker)}(?![A-Z0-9])") for ticker in tickers
+    }
+    alias_index: dict[str, list[str]] = {}
+    for alias, company in aliases:
+        alias_index.setdefault(alias, []).append(company)
+
+    frozen_index = {alias: tuple(companies) for alias, companies in alias_index.items()}
+    byte_tickers = [ticker for ticker in ticker_patterns if is_byte_matchable(ticker)]
     return MentionCatalog(
-        aliases=tuple(sorted_aliases),
+        aliases=tuple(aliases),
         ticker_patterns=tuple(ticker_patterns.items()),
+        alias_index=frozen_index,
+        max_alias_tokens=max((alias.count(" ") + 1 for alias in frozen_index), default=0),
+        company_norms={company: normalize_text(company) for _, company in aliases},
+        combined_ticker_pattern=build_combined_ticker_pattern(byte_tickers),
+        shadowed_ticker_patterns=tuple(
+            (ticker, compile_ticker_bytes_pattern(ticker)) for ticker in find_shadowed_tickers(byte_tickers)
+        ),
+        unicode_ticker_patterns=tuple(
+            (ticker, pattern) for ticker, pattern in ticker_patterns.items() if not is_byte_matchable(ticker)
+        ),
+        version=version,
     )
 
 
+def build_catalog_version(aliases: Iterable[tuple[str, str]], tickers: Iterable[str]) -> str:
+    digest = hashlib.sha256(MENTION_RULES_VERSION.encode("utf-8"))
+    for alias, company in sorted(aliases):
+        digest.update(f"a\t{alias}\t{company}\n".encode("utf-8"))
+    for ticker in sorted(tickers):
+        digest.update(f"t\t{ticker}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def is_byte_matchable(ticker: str) -> bool:
+    return ticker.isascii() and "?" not in ticker
+
+
+def compile_ticker_bytes_pattern(ticker: str) -> re.Pattern[bytes]:
+    return re.compile(rb"(?<![A-Z0-9])" + re.escape(ticker.encode("ascii")) + rb"(?![A-Z0-9])")
+
+
+def build_combined_ticker_pattern(tickers: Iterable[str]) -> re.Pattern[bytes] | None:
+    ordered = sorted(tickers, key=len, reverse=True)
+    if not ordered:
+        return None
+    alternation = b"|".join(re.escape(ticker.encode("ascii")) for ticker in ordered)
+    return re.compile(rb"(?<![A-Z0-9])(?=(" + alternation + rb")(?![A-Z0-9]))")
+
+
+def find_shadowed_tickers(tickers: Iterable[str]) -> list[str]:
+    ordered = sorted(tickers)
+    shadowed: list[str] = []
+    for index, ticker in enumerate(ordered):
+        for candidate in ordered[index + 1 :]:
+            if not candidate.startswith(ticker):
+                break
+            if not candidate[len(ticker)].isalnum():
+                shadowed.append(ticker)
+                break
+    return shadowed
+
+
+def load_mention_catalog_cached(db_path: Path) -> MentionCatalog:
+    with closing(sqlite3.connect(db_path)) as connection:
+        aliases, tickers = load_catalog_sources(connection)
+    version = build_catalog_version(aliases, tickers)
+    with _CATALOG_CACHE_LOCK:
+        catalog = _CATALOG_CACHE.pop(version, None)
+        if catalog is None:
+            catalog = build_mention_catalog(aliases, tickers, version)
+            while len(_CATALOG_CACHE) >= CATALOG_CACHE_SIZE:
+                _CATALOG_CACHE.pop(next(iter(_CATALOG_CACHE)))
+        _CATALOG_CACHE[version] = catalog
+    return catalog
+
+
 def detect_mentions(chunk_text: str, catalog: MentionCatalog) -> tuple[list[str], list[str], list[str]]:
     if not chunk_text:
         return [], [], []
 
-    normalized_chunk = f" {normalize_text(chunk_text)} "
+    normalized_chunk = normalize_text(chunk_text)
     mentions_company_names: set[str] = set()
 
-    for alias, company_name in catalog.aliases:
-        if f" {alias} " in normalized_chunk:
-            mentions_company_names.add(company_name)
+    alias_index = catalog.alias_index
+    tokens = normalized_chunk.split(" ")
+    token_count = len(tokens)
+    for start in range(token_count):
+        for end in range(start + 1, min(start + catalog.max_alias_tokens, token_count) + 1):
+            companies = alias_index.get(" ".join(tokens[start:end]))
+            if companies:
+                mentions_company_names.update(companies)
 
     mentions_company_names_sorted = sorted(mentions_company_names)
+    company_norms = catalog.company_norms
     mentions_company_names_norm = sorted(
-        {
-            normalize_text(name)
-            for name in mentions_company_names_sorted
-            if normalize_text(name)
-        }
+        {norm for name in mentions_company_names_sorted if (norm := company_norms.get(name))}
     )
 
     uppercase_chunk = chunk_text.upper()
-    mentions_tickers = sorted(
+    found_tickers: set[str] = set()
+    if catalog.combined_ticker_pattern is not None or catalog.shadowed_ticker_patterns:
+        uppercase_bytes = uppercase_chunk.encode("ascii", "replace")
+        if catalog.combined_ticker_pattern is not None:
+            found_tickers.update(
+                match.decode("ascii") for match in catalog.combined_ticker_pattern.findall(uppercase_bytes)
+            )
+        found_tickers.update(
+            ticker
+            for ticker, pattern in catalog.shadowed_ticker_patterns
+            if pattern.search(uppercase_bytes)
+        )
+    found_tickers.update(
         ticker
-        for ticker, pattern in catalog.ticker_patterns
+        for ticker, pattern in catalog.unicode_ticker_patterns
         if pattern.search(uppercase_chunk)
     )
+    mentions_tickers = sorted(found_tickers)
 
     return mentions_company_names_sorted, mentions_company_names_norm, mentions_tickers
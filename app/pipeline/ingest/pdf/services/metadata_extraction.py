@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import re
+import sqlite3
+from dataclasses import asdict
 from functools import lru_cache
 from pathlib import Path
 
@@ -10,15 +14,26 @@ from pydantic import ValidationError
 
 from app.core.settings import get_settings
 from app.core.utils import collapse_spaces, extract_first_json_object, read_text_file
-from app.pipeline.ingest.pdf.models import DocumentMetadata
+from app.pipeline.ingest.pdf.models import FALLBACK_EVIDENCE, DocumentMetadata
 from app.pipeline.ingest.pdf.schemas import MetadataExtractionSchema
 
 LOGGER = logging.getLogger("ingest_pdfs")
 
+FILENAME_SEPARATOR_PATTERN = re.compile(r"[_\-]+")
+YEAR_PATTERN = re.compile(r"(19|20)\d{2}")
+
+METADATA_CACHE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS metadata_cache (
+        cache_key TEXT PRIMARY KEY,
+        payload TEXT NOT NULL,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+""".strip()
+
 
 def prettify_filename(file_name: str) -> str:
     stem = Path(file_name).stem
-    spaced = re.sub(r"[_\-]+", " ", stem)
+    spaced = FILENAME_SEPARATOR_PATTERN.sub(" ", stem)
     spaced = collapse_spaces(spaced)
     if not spaced:
         return "Untitled Document"
@@ -34,7 +49,7 @@ def sanitize_year(raw_year: object) -> int | None:
         converted = int(raw_year)
         return converted if 1900 <= converted <= 2100 else None
     if isinstance(raw_year, str):
-        match = re.search(r"(19|20)\d{2}", raw_year)
+        match = YEAR_PATTERN.search(raw_year)
         if match:
             converted = int(match.group(0))
             return converted if 1900 <= converted <= 2100 else None
@@ -65,6 +80,11 @@ def _load_default_prompt_template() -> str:
     )
 
 
+@lru_cache(maxsize=1)
+def _default_prompt_sha256() -> str:
+    return hashlib.sha256(_load_default_prompt_template().encode("utf-8")).hexdigest()
+
+
 def load_metadata_prompt_template(prompt_path: Path | None = None) -> str:
     if prompt_path is None:
         return _load_default_prompt_template()
@@ -130,6 +150,18 @@ def build_non_schema_reason(response: object) -> str:
     return "; ".join(parts)
 
 
+def _fallback_metadata(title: str) -> DocumentMetadata:
+    return DocumentMetadata(
+        title=title,
+        publisher="Unknown",
+        year=None,
+        confidence=0.0,
+        evidence=dict(FALLBACK_EVIDENCE),
+        meta_source="filename_fallback",
+        title_source="filename_fallback",
+    )
+
+
 def extract_metadata_with_llm(
     openai_client: OpenAI,
     extractor_model: str,
@@ -138,18 +170,8 @@ def extract_metadata_with_llm(
     confidence_threshold: float,
 ) -> DocumentMetadata:
     fallback_title = prettify_filename(file_name)
-    fallback = DocumentMetadata(
-        title=fallback_title,
-        publisher="Unknown",
-        year=None,
-        confidence=0.0,
-        evidence={"title_line": None, "publisher_line": None, "year_line": None},
-        meta_source="filename_fallback",
-        title_source="filename_fallback",
-    )
-
     if not preview_text:
-        return fallback
+        return _fallback_metadata(fallback_title)
 
     prompt_template = load_metadata_prompt_template()
     prompt = build_metadata_prompt(
@@ -173,7 +195,7 @@ def extract_metadata_with_llm(
             )
         except Exception as exc:
             LOGGER.warning("Metadata extractor failed for %s: %s", file_name, exc)
-            return fallback
+            return _fallback_metadata(fallback_title)
 
         incomplete = getattr(response, "incomplete_details", None)
         incomplete_reason = getattr(incomplete, "reason", None)
@@ -188,7 +210,7 @@ def extract_metadata_with_llm(
         break
 
     if response is None:
-        return fallback
+        return _fallback_metadata(fallback_title)
 
     parsed = getattr(response, "output_parsed", None)
     if not isinstance(parsed, MetadataExtractionSchema):
@@ -205,23 +227,23 @@ def extract_metadata_with_llm(
                 reason,
                 preview,
             )
-            return fallback
+            return _fallback_metadata(fallback_title)
 
     title = sanitize_optional_string(parsed.title)
     publisher = sanitize_optional_string(parsed.publisher)
     year = sanitize_year(parsed.year)
     confidence = sanitize_confidence(parsed.confidence)
 
+    missing_all = title is None and publisher is None and year is None
+    if confidence < confidence_threshold or missing_all:
+        return _fallback_metadata(fallback_title)
+
     evidence = {
         "title_line": sanitize_optional_string(parsed.evidence.title_line),
         "publisher_line": sanitize_optional_string(parsed.evidence.publisher_line),
         "year_line": sanitize_optional_string(parsed.evidence.year_line),
     }
 
-    missing_all = title is None and publisher is None and year is None
-    if confidence < confidence_threshold or missing_all:
-        return fallback
-
     meta_source = "llm"
     title_source = "llm"
 
@@ -239,3 +261,54 @@ def extract_metadata_with_llm(
         meta_source=meta_source,
         title_source=title_source,
     )
+
+
+def ensure_metadata_cache_table(connection: sqlite3.Connection) -> None:
+    connection.execute(METADATA_CACHE_TABLE_SQL)
+
+
+def build_metadata_cache_key(file_hash: str, extractor_model: str, confidence_threshold: float) -> str:
+    raw_key = "\x1f".join(
+        (file_hash, extractor_model, f"{confidence_threshold:.6f}", _default_prompt_sha256())
+    )
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+def load_cached_metadata(
+    connection: sqlite3.Connection,
+    cache_key: str,
+    file_name: str,
+) -> DocumentMetadata | None:
+    try:
+        row = connection.execute(
+            "SELECT payload FROM metadata_cache WHERE cache_key = ?;",
+            (cache_key,),
+        ).fetchone()
+    except sqlite3.Error as exc:
+        LOGGER.warning("Metadata cache lookup failed for %s: %s", file_name, exc)
+        return None
+    if row is None:
+        return None
+    try:
+        return DocumentMetadata(**json.loads(row[0]))
+    except (TypeError, ValueError):
+        LOGGER.warning("Ignoring malformed metadata cache entry for %s.", file_name)
+        return None
+
+
+def store_cached_metadata(
+    connection: sqlite3.Connection,
+    cache_key: str,
+    file_name: str,
+    metadata: DocumentMetadata,
+) -> None:
+    if metadata.meta_source == "filename_fallback":
+        return
+    try:
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO metadata_cache (cache_key, payload) VALUES (?, ?);",
+                (cache_key, json.dumps(asdict(metadata), ensure_ascii=False)),
+            )
+    except sqlite3.Error as exc:
+        LOGGER.warning("Metadata cache write failed for %s: %s", file_name, exc)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Sequence
+
+from app.pipeline.ingest.pdf.models import ChunkBatch, MentionCatalog
+from app.pipeline.ingest.pdf.services.chunking import (
+    build_quote_snippet,
+    deduplicate_chunks,
+    get_tokenizer,
+    point_id_base_hasher,
+    point_id_from_chunk,
+    split_texts_into_token_chunks,
+)
+from app.pipeline.ingest.pdf.services.mention_cache import (
+    Mentions,
+    build_mention_cache_row,
+    load_cached_mentions,
+    mention_text_hash,
+    open_mention_cache_reader,
+)
+from app.pipeline.ingest.pdf.services.mentions import detect_mentions
+
+PageChunkTask = tuple[str, Sequence[tuple[int, str]], int, float, float]
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def chunk_pages(
+    *,
+    doc_id: str,
+    pages: Sequence[tuple[int, str]],
+    encoding,
+    catalog: MentionCatalog,
+    chunk_size: int,
+    overlap_ratio: float,
+    dedup_similarity: float,
+    mention_cache: sqlite3.Connection | None = None,
+) -> ChunkBatch:
+    raw_chunks_by_page = split_texts_into_token_chunks(
+        texts=[page_text for _, page_text in pages],
+        encoding=encoding,
+        chunk_size=chunk_size,
+        overlap_ratio=overlap_ratio,
+    )
+    base_hasher = point_id_base_hasher(doc_id)
+    batch = ChunkBatch(doc_id=doc_id)
+    for (page_number, _), raw_chunks in zip(pages, raw_chunks_by_page):
+        unique_chunks = deduplicate_chunks(
+            chunks=raw_chunks,
+            similarity_threshold=dedup_similarity,
+        )
+        for chunk_index, (chunk_text, token_count) in enumerate(unique_chunks):
+            batch.point_ids.append(
+                point_id_from_chunk(
+                    doc_id=doc_id,
+                    page=page_number,
+                    chunk_index=chunk_index,
+                    text=chunk_text,
+                    base_hasher=base_hasher,
+                )
+            )
+            batch.pages.append(page_number)
+            batch.chunk_indices.append(chunk_index)
+            batch.texts.append(chunk_text)
+            batch.token_counts.append(token_count)
+            batch.quote_snippets.append(build_quote_snippet(chunk_text))
+
+    text_hashes: list[str | None] = [None] * len(batch)
+    cached: dict[str, Mentions] = {}
+    if mention_cache is not None and catalog.version:
+        hashes = [mention_text_hash(text) for text in batch.texts]
+        try:
+            cached = load_cached_mentions(mention_cache, catalog.version, hashes)
+        except sqlite3.Error:
+            pass
+        else:
+            text_hashes = hashes
+
+    for chunk_text, text_hash in zip(batch.texts, text_hashes):
+        mentions = cached.get(text_hash) if text_hash is not None else None
+        if mentions is None:
+            mentions = detect_mentions(chunk_text=chunk_text, catalog=catalog)
+            if text_hash is not None:
+                batch.mention_cache_rows.append(build_mention_cache_row(text_hash, mentions))
+        mentions_company_names, mentions_company_names_norm, mentions_tickers = mentions
+        batch.mentions_company_names.append(mentions_company_names)
+        batch.mentions_company_names_norm.append(mentions_company_names_norm)
+        batch.mentions_tickers.append(mentions_tickers)
+    return batch
+
+
+def init_chunk_worker(
+    model_name: str,
+    catalog: MentionCatalog,
+    mention_cache_path: Path | None = None,
+) -> None:
+    _WORKER_STATE["encoding"] = get_tokenizer(model_name)
+    _WORKER_STATE["catalog"] = catalog
+    _WORKER_STATE["mention_cache"] = (
+        open_mention_cache_reader(mention_cache_path) if mention_cache_path is not None else None
+    )
+
+
+def chunk_pages_in_worker(task: PageChunkTask) -> ChunkBatch:
+    doc_id, pages, chunk_size, overlap_ratio, dedup_similarity = task
+    return chunk_pages(
+        doc_id=doc_id,
+        pages=pages,
+        encoding=_WORKER_STATE["encoding"],
+        catalog=_WORKER_STATE["catalog"],
+        chunk_size=chunk_size,
+        overlap_ratio=overlap_ratio,
+        dedup_similarity=dedup_similarity,
+        mention_cache=_WORKER_STATE["mention_cache"],
+    )
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from openai import OpenAI
 from pydantic import BaseModel, ConfigDict, ValidationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.core.openai_client import shared_openai_client
 from app.core.settings import get_settings
 from app.core.utils import collapse_spaces, extract_first_json_object, read_text_file
 
+TOPIC_DECISION_CACHE_SIZE = 1024
+
 @dataclass(frozen=True)
 class TopicDecision:
     is_relevant: bool
@@ -27,12 +39,23 @@ class TopicDecisionSchema(BaseModel):
 def _load_prompt(prompt_path: Path | None = None) -> str:
     settings = get_settings()
     target = prompt_path or settings.upload_topic_prompt_path
+    return _read_prompt(target)
+
+
+@lru_cache(maxsize=8)
+def _read_prompt(target: Path) -> str:
     return read_text_file(
         target,
         missing_message="Topic classifier prompt not found: {path}",
     )
 
 
+def _dumps_payload(payload: dict[str, str]) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
 def _normalize_confidence(value: float) -> float:
     return min(1.0, max(0.0, float(value)))
 
@@ -51,6 +74,8 @@ class PDFTopicClassifier:
         self.max_output_tokens = self.settings.pdf_topic_max_output_tokens
         self.reasoning_effort = self.settings.pdf_topic_reasoning_effort
         self._openai_client = openai_client
+        self._decisions: OrderedDict[bytes, TopicDecision] = OrderedDict()
+        self._decisions_lock = threading.Lock()
 
     def _client(self) -> OpenAI | None:
         if self._openai_client is not None:
@@ -58,7 +83,7 @@ class PDFTopicClassifier:
         api_key = self.settings.openai_api_key
         if not api_key:
             return None
-        self._openai_client = OpenAI(api_key=api_key)
+        self._openai_client = shared_openai_client(api_key)
         return self._openai_client
 
     def classify(self, *, file_name: str, preview_text: str) -> TopicDecision:
@@ -74,6 +99,16 @@ class PDFTopicClassifier:
             "file_name": file_name,
             "preview_text": normalized_preview[:8000],
         }
+        cache_key = hashlib.blake2b(
+            "\x1f".join((self.model, file_name, payload["preview_text"])).encode("utf-8"),
+            digest_size=16,
+        ).digest()
+        with self._decisions_lock:
+            cached = self._decisions.get(cache_key)
+            if cached is not None:
+                self._decisions.move_to_end(cache_key)
+                return cached
+
         try:
             response = client.responses.parse(
                 model=self.model,
@@ -81,7 +116,7 @@ class PDFTopicClassifier:
                 reasoning={"effort": self.reasoning_effort},
                 input=[
                     {"role": "system", "content": self.prompt},
-                    {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+                    {"role": "user", "content": _dumps_payload(payload)},
                 ],
                 text_format=TopicDecisionSchema,
             )
@@ -105,8 +140,13 @@ class PDFTopicClassifier:
                 reason=f"Topic check fallback: non-schema output (status={status}).",
             )
 
-        return TopicDecision(
+        decision = TopicDecision(
             is_relevant=parsed.is_relevant,
             confidence=_normalize_confidence(parsed.confidence),
             reason=collapse_spaces(parsed.reason) or "No reason.",
         )
+        with self._decisions_lock:
+            self._decisions[cache_key] = decision
+            if len(self._decisions) > TOPIC_DECISION_CACHE_SIZE:
+                self._decisions.popitem(last=False)
+        return decision
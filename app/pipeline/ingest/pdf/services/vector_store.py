@@ -1,28 +1,104 @@
 from __future__ import annotations
 
-from typing import Sequence
-
-from openai import OpenAI
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+from openai import OpenAI, RateLimitError
 from qdrant_client import QdrantClient, models
 
-from app.pipeline.ingest.pdf.models import ChunkRecord, DocumentMetadata
+from app.pipeline.ingest.pdf.models import ChunkBatch, DocumentMetadata
+from app.pipeline.ingest.pdf.services.chunking import get_tokenizer
+
+LOGGER = logging.getLogger("ingest_pdfs")
+
+EMBEDDING_BATCH_SIZE = 2048
+EMBEDDING_BATCH_MAX_TOKENS = 250_000
+EMBEDDING_MAX_PARALLEL = 4
+EMBEDDING_RATE_LIMIT_RETRIES = 5
+EMBEDDING_RETRY_BASE_SECONDS = 1.0
+UPLOAD_MAX_RETRIES = 3
+DEFAULT_INDEXING_THRESHOLD = 20_000
+
+_BULK_INGEST_LOCK = threading.Lock()
+_BULK_INGEST_DEPTH: dict[str, int] = {}
 
 
 def embed_texts(
     openai_client: OpenAI,
     embedding_model: str,
     texts: Sequence[str],
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    *,
+    token_counts: Sequence[int] | None = None,
+    max_tokens_per_batch: int = EMBEDDING_BATCH_MAX_TOKENS,
+    max_parallel: int = EMBEDDING_MAX_PARALLEL,
 ) -> list[list[float]]:
     if not texts:
         return []
+    if token_counts is None:
+        token_counts = [len(ids) for ids in get_tokenizer(embedding_model).encode_batch(list(texts))]
+
+    order = sorted(range(len(texts)), key=token_counts.__getitem__)
+    batches = pack_embedding_batches(order, token_counts, batch_size, max_tokens_per_batch)
+
+    def embed_batch(batch: list[int]) -> tuple[list[int], list[list[float]]]:
+        return batch, _create_embeddings(openai_client, embedding_model, [texts[index] for index in batch])
+
+    vectors: list[list[float]] = [[] for _ in texts]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(batches)))) as executor:
+        for batch, batch_vectors in executor.map(embed_batch, batches):
+            for index, vector in zip(batch, batch_vectors, strict=True):
+                vectors[index] = vector
+    return vectors
+
+
+def pack_embedding_batches(
+    order: Sequence[int],
+    token_counts: Sequence[int],
+    batch_size: int,
+    max_tokens_per_batch: int,
+) -> list[list[int]]:
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for index in order:
+        tokens = token_counts[index]
+        if current and (len(current) >= batch_size or current_tokens + tokens > max_tokens_per_batch):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _create_embeddings(openai_client: OpenAI, embedding_model: str, inputs: list[str]) -> list[list[float]]:
+    for attempt in range(EMBEDDING_RATE_LIMIT_RETRIES + 1):
+        try:
+            response = openai_client.embeddings.create(model=embedding_model, input=inputs)
+        except RateLimitError as exc:
+            if attempt == EMBEDDING_RATE_LIMIT_RETRIES:
+                raise RuntimeError(f"Failed to create embeddings: {exc}") from exc
+            time.sleep(_retry_after_seconds(exc, attempt))
+            continue
+        except Exception as exc:
+            raise RuntimeError(f"Failed to create embeddings: {exc}") from exc
+        return [item.embedding for item in response.data]
+    raise RuntimeError("Failed to create embeddings: retries exhausted")
+
+
+def _retry_after_seconds(exc: RateLimitError, attempt: int) -> float:
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
     try:
-        response = openai_client.embeddings.create(
-            model=embedding_model,
-            input=list(texts),
-        )
-    except Exception as exc:
-        raise RuntimeError(f"Failed to create embeddings: {exc}") from exc
-    return [item.embedding for item in response.data]
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return EMBEDDING_RETRY_BASE_SECONDS * (2**attempt)
 
 
 def get_collection_vector_size(collection_info: models.CollectionInfo) -> int | None:
@@ -43,6 +119,7 @@ def ensure_qdrant_collection(
     qdrant_client: QdrantClient,
     collection_name: str,
     vector_size: int,
+    scalar_quantization: bool = False,
 ) -> None:
     if qdrant_client.collection_exists(collection_name):
         info = qdrant_client.get_collection(collection_name)
@@ -57,56 +134,115 @@ def ensure_qdrant_collection(
     qdrant_client.create_collection(
         collection_name=collection_name,
         vectors_config=models.VectorParams(size=vector_size, distance=models.Distance.COSINE),
+        quantization_config=build_quantization_config(scalar_quantization),
     )
 
 
-def chunk_records_to_points(
-    chunk_records: Sequence[ChunkRecord],
+def build_quantization_config(scalar_quantization: bool) -> models.ScalarQuantization | None:
+    if not scalar_quantization:
+        return None
+    return models.ScalarQuantization(
+        scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, always_ram=True),
+    )
+
+
+@contextmanager
+def bulk_ingest_mode(
+    qdrant_client: QdrantClient,
+    collection_name: str,
+    indexing_threshold: int = DEFAULT_INDEXING_THRESHOLD,
+) -> Iterator[None]:
+    with _BULK_INGEST_LOCK:
+        depth = _BULK_INGEST_DEPTH.get(collection_name, 0)
+        if depth == 0:
+            _set_indexing_threshold(qdrant_client, collection_name, 0)
+        _BULK_INGEST_DEPTH[collection_name] = depth + 1
+    try:
+        yield
+    finally:
+        with _BULK_INGEST_LOCK:
+            depth = _BULK_INGEST_DEPTH.pop(collection_name) - 1
+            if depth:
+                _BULK_INGEST_DEPTH[collection_name] = depth
+            else:
+                _set_indexing_threshold(qdrant_client, collection_name, indexing_threshold)
+
+
+def _set_indexing_threshold(qdrant_client: QdrantClient, collection_name: str, threshold: int) -> None:
+    try:
+        qdrant_client.update_collection(
+            collection_name=collection_name,
+            optimizer_config=models.OptimizersConfigDiff(indexing_threshold=threshold),
+        )
+    except Exception as exc:
+        LOGGER.warning("Could not set indexing_threshold=%s on %s: %s", threshold, collection_name, exc)
+
+
+def chunk_batch_to_points(
+    batch: ChunkBatch,
     vectors: Sequence[Sequence[float]],
+    metadata: DocumentMetadata,
 ) -> list[models.PointStruct]:
+    doc_id = batch.doc_id
+    title = metadata.title
+    publisher = metadata.publisher
+    year = metadata.year
+    meta_source = metadata.meta_source
     points: list[models.PointStruct] = []
-    for record, vector in zip(chunk_records, vectors, strict=True):
+    columns = zip(
+        batch.point_ids,
+        batch.pages,
+        batch.chunk_indices,
+        batch.texts,
+        batch.quote_snippets,
+        batch.token_counts,
+        batch.mentions_company_names,
+        batch.mentions_company_names_norm,
+        batch.mentions_tickers,
+        vectors,
+        strict=True,
+    )
+    for row in columns:
+        point_id, page, chunk_index, text, quote_snippet, token_count, names, names_norm, tickers, vector = row
         payload = {
-            "doc_id": record.doc_id,
-            "page": record.page,
-            "chunk_index": record.chunk_index,
-            "text": record.text,
-            "quote_snippet": record.quote_snippet,
-            "token_count": record.token_count,
-            "mentions_company_names": record.mentions_company_names,
-            "mentions_company_names_norm": record.mentions_company_names_norm,
-            "mentions_tickers": record.mentions_tickers,
+            "doc_id": doc_id,
+            "page": page,
+            "chunk_index": chunk_index,
+            "text": text,
+            "quote_snippet": quote_snippet,
+            "token_count": token_count,
+            "mentions_company_names": names,
+            "mentions_company_names_norm": names_norm,
+            "mentions_tickers": tickers,
+            "title": title,
+            "publisher": publisher,
+            "year": year,
+            "meta_source": meta_source,
         }
-        points.append(models.PointStruct(id=record.point_id, vector=list(vector), payload=payload))
+        if not isinstance(vector, list):
+            vector = list(vector)
+        points.append(models.PointStruct(id=point_id, vector=vector, payload=payload))
     return points
 
 
-def enrich_chunk_payload(
-    points: list[models.PointStruct],
-    metadata: DocumentMetadata,
-) -> None:
-    for point in points:
-        payload = point.payload if isinstance(point.payload, dict) else {}
-        payload["title"] = metadata.title
-        payload["publisher"] = metadata.publisher
-        payload["year"] = metadata.year
-        payload["meta_source"] = metadata.meta_source
-        point.payload = payload
-
-
 def upload_points_in_batches(
     qdrant_client: QdrantClient,
     collection_name: str,
     points: Sequence[models.PointStruct],
     batch_size: int,
+    parallel: int = 1,
 ) -> None:
-    for start in range(0, len(points), batch_size):
-        batch = points[start : start + batch_size]
-        qdrant_client.upsert(
-            collection_name=collection_name,
-            points=batch,
-            wait=True,
-        )
+    if not points:
+        return
+    batch_count = -(-len(points) // batch_size)
+    qdrant_client.upload_points(
+        collection_name=collection_name,
+        points=points,
+        batch_size=batch_size,
+        parallel=max(1, min(parallel, batch_count)),
+        max_retries=UPLOAD_MAX_RETRIES,
+        wait=True,
+    )
 
 
 def normalize_embedding_model_name(model_name: str) -> str:
@@ -1,15 +1,11 @@
-from app.pipeline.ingest.pdf.stages.chunk import ChunkStage
+from app.pipeline.ingest.pdf.stages.chunk_embed_upsert import ChunkEmbedUpsertStage
 from app.pipeline.ingest.pdf.stages.discover import DiscoverStage
-from app.pipeline.ingest.pdf.stages.embed import EmbedStage
 from app.pipeline.ingest.pdf.stages.metadata_extract import MetadataExtractStage
 from app.pipeline.ingest.pdf.stages.topic_filter import TopicFilterStage
-from app.pipeline.ingest.pdf.stages.upsert import UpsertStage
 
 __all__ = [
-    "ChunkStage",
+    "ChunkEmbedUpsertStage",
     "DiscoverStage",
-    "EmbedStage",
     "MetadataExtractStage",
     "TopicFilterStage",
-    "UpsertStage",
 ]
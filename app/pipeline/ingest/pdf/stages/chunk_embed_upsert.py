@@ -4,11 +4,11 @@ from app.pipeline.ingest.pdf.context import PDFIngestContext
 from app.pipeline.ingest.pdf.services.ingest_service import PDFIngestService
 
 
-class ChunkStage:
-    name = "chunk"
+class ChunkEmbedUpsertStage:
+    name = "chunk_embed_upsert"
 
     def __init__(self, service: PDFIngestService) -> None:
         self.service = service
 
     def run(self, context: PDFIngestContext) -> PDFIngestContext:
-        return self.service.chunk(context)
+        return self.service.chunk_embed_upsert(context)
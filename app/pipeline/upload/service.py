@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import secrets
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import BinaryIO, Sequence
 
 from app.core.settings import get_settings
 from app.pipeline.ingest.equities.pipeline import EquitiesIngestPipeline
@@ -13,10 +16,19 @@ from app.pipeline.ingest.pdf.pipeline import PDFIngestPipeline, PDFIngestRequest
 from app.pipeline.ingest.pdf.services.topic_classifier import PDFTopicClassifier
 
 
-@dataclass(frozen=True)
-class UploadedBinary:
+UPLOAD_COPY_BUFFER_BYTES = 1 << 20
+UNIQUE_FILE_ATTEMPTS = 8
+UNSAFE_FILE_NAME_PATTERN = re.compile(r"[^A-Za-z0-9._-]")
+SAFE_FILE_NAME_TABLE = str.maketrans(
+    {char: "_" for char in map(chr, range(128)) if not (char.isalnum() or char in "._-")}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class UploadedStream:
     file_name: str
-    content: bytes
+    stream: BinaryIO
+    size_hint: int | None = None
 
 
 @dataclass(frozen=True)
@@ -43,22 +55,45 @@ class EquitiesUploadSummary:
 
 def _sanitize_file_name(file_name: str, *, fallback: str) -> str:
     candidate = Path(file_name or "").name
-    candidate = re.sub(r"[^A-Za-z0-9._-]", "_", candidate).strip("._")
+    if candidate.isascii():
+        candidate = candidate.translate(SAFE_FILE_NAME_TABLE).strip("._")
+    else:
+        candidate = UNSAFE_FILE_NAME_PATTERN.sub("_", candidate).strip("._")
     if not candidate:
         return fallback
     return candidate
 
 
-def _unique_file_path(base_dir: Path, file_name: str) -> Path:
+def _stream_size(item: UploadedStream) -> int:
+    if item.size_hint is not None:
+        return item.size_hint
+    item.stream.seek(0, 2)
+    size = item.stream.tell()
+    item.stream.seek(0)
+    return size
+
+
+def _write_stream(item: UploadedStream, file_descriptor: int) -> str:
+    hasher = hashlib.sha256()
+    buffer = bytearray(UPLOAD_COPY_BUFFER_BYTES)
+    view = memoryview(buffer)
+    item.stream.seek(0)
+    with os.fdopen(file_descriptor, "wb") as handle:
+        while size := item.stream.readinto(view):
+            hasher.update(view[:size])
+            handle.write(view[:size])
+    return hasher.hexdigest()
+
+
+def _unique_file_path(base_dir: Path, file_name: str) -> tuple[Path, int]:
     target = base_dir / file_name
-    if not target.exists():
-        return target
-    stem = target.stem
-    suffix = target.suffix
-    for index in range(1, 10_000):
-        candidate = base_dir / f"{stem}_{index}{suffix}"
-        if not candidate.exists():
-            return candidate
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    candidate = target
+    for _ in range(UNIQUE_FILE_ATTEMPTS):
+        try:
+            return candidate, os.open(candidate, flags, 0o644)
+        except FileExistsError:
+            candidate = base_dir / f"{target.stem}_{secrets.token_hex(3)}{target.suffix}"
     raise RuntimeError(f"Failed to allocate unique file path for {file_name}.")
 
 
@@ -86,7 +121,10 @@ class UploadService:
         self.max_equities_file_size_bytes = self.settings.api_upload_equities_max_file_bytes
         self.topic_min_confidence = self.settings.pdf_topic_min_confidence
 
-    def upload_pdfs(self, files: Sequence[UploadedBinary]) -> PDFUploadSummary:
+    def close(self) -> None:
+        self.pdf_ingest_pipeline.close()
+
+    def upload_pdfs(self, files: Sequence[UploadedStream]) -> PDFUploadSummary:
         payloads = list(files)
         if not payloads:
             raise ValueError("At least one PDF file is required.")
@@ -98,6 +136,7 @@ class UploadService:
 
         skipped_documents: list[SkippedDocument] = []
         ingest_queue: list[Path] = []
+        file_hashes: dict[Path, str] = {}
         for item in payloads:
             safe_name = _sanitize_file_name(item.file_name, fallback="upload.pdf")
             if not safe_name.casefold().endswith(".pdf"):
@@ -106,7 +145,7 @@ class UploadService:
                 )
                 continue
 
-            file_size = len(item.content)
+            file_size = _stream_size(item)
             if file_size > self.max_pdf_file_size_bytes:
                 skipped_documents.append(
                     SkippedDocument(
@@ -117,8 +156,8 @@ class UploadService:
                 )
                 continue
 
-            target_path = _unique_file_path(self.upload_pdf_dir, safe_name)
-            target_path.write_bytes(item.content)
+            target_path, file_descriptor = _unique_file_path(self.upload_pdf_dir, safe_name)
+            file_hashes[target_path] = _write_stream(item, file_descriptor)
             ingest_queue.append(target_path)
 
         if not ingest_queue:
@@ -127,6 +166,7 @@ class UploadService:
         try:
             request = PDFIngestRequest(
                 input_paths=ingest_queue,
+                known_file_hashes=file_hashes,
                 metadata_db_path=self.db_path,
                 qdrant_url=self.settings.qdrant_url,
                 qdrant_collection=self.settings.qdrant_collection,
@@ -168,19 +208,18 @@ class UploadService:
             skipped_documents=skipped_documents,
         )
 
-    def upload_equities(self, file: UploadedBinary) -> EquitiesUploadSummary:
+    def upload_equities(self, file: UploadedStream) -> EquitiesUploadSummary:
         safe_name = _sanitize_file_name(file.file_name, fallback="upload.xlsx")
         if not safe_name.casefold().endswith(".xlsx"):
             raise ValueError("Invalid equities file format. Only .xlsx is supported.")
-        if len(file.content) > self.max_equities_file_size_bytes:
+        if _stream_size(file) > self.max_equities_file_size_bytes:
             raise ValueError(f"Equities file exceeds {self.max_equities_file_size_bytes} bytes.")
 
         self.upload_equities_dir.mkdir(parents=True, exist_ok=True)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        target_path = _unique_file_path(self.upload_equities_dir, safe_name)
-        target_path.write_bytes(file.content)
-
+        target_path, file_descriptor = _unique_file_path(self.upload_equities_dir, safe_name)
         try:
+            _write_stream(file, file_descriptor)
             completed = self.equities_ingest_pipeline.process(
                 input_path=target_path,
                 db_path=self.db_path,
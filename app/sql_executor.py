@@ -2,27 +2,31 @@ from __future__ import annotations
 
 import re
 import sqlite3
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Callable, Sequence
 
 from app.core.sqlite_schema import table_column_names
 
 DEFAULT_DB_PATH = Path("db/equities.db")
-
-FORBIDDEN_SQL_PATTERN = re.compile(
-    r"\b(insert|update|delete|alter|drop|create|attach|detach|pragma|vacuum|replace|truncate)\b",
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL_SECONDS = 300.0
+
+GUARDRAIL_PATTERN = re.compile(
+    r"(?P<statement_end>;)"
+    r"|\b(?P<forbidden>insert|update|delete|alter|drop|create|attach|detach|pragma|vacuum|replace|truncate)\b"
+    r"|\b(?:from|join)\s+(?=(?P<table>[`\"\[]?[a-zA-Z_][\w$]*(?:\.[a-zA-Z_][\w$]*)?[`\"\]]?))"
+    r"|\b(?P<limit>limit)\b(?P<limit_value>\s+\d+\b)?"
+    r"|\b(?P<where>where)\b"
+    r"|\b(?P<boundary>group\s+by|order\s+by|offset)\b",
     flags=re.IGNORECASE,
 )
-TABLE_REF_PATTERN = re.compile(r"\b(?:from|join)\s+([`\"\[]?[a-zA-Z_][\w$]*(?:\.[a-zA-Z_][\w$]*)?[`\"\]]?)", re.IGNORECASE)
-LIMIT_PATTERN = re.compile(r"\blimit\s+\d+\b", flags=re.IGNORECASE)
-WHERE_PATTERN = re.compile(r"\bwhere\b", flags=re.IGNORECASE)
-CLAUSE_BOUNDARY_PATTERNS = (
-    re.compile(r"\bgroup\s+by\b", flags=re.IGNORECASE),
-    re.compile(r"\border\s+by\b", flags=re.IGNORECASE),
-    re.compile(r"\blimit\b", flags=re.IGNORECASE),
-    re.compile(r"\boffset\b", flags=re.IGNORECASE),
-)
+SELECT_PATTERN = re.compile(r"^\s*select\b", flags=re.IGNORECASE)
+FENCE_PREFIX_PATTERN = re.compile(r"^```[a-zA-Z0-9_+-]*\s*")
+FENCE_SUFFIX_PATTERN = re.compile(r"\s*```$")
 
 DENIED_ACTIONS = {
     sqlite3.SQLITE_INSERT,
@@ -45,6 +49,40 @@ class SQLExecutionResult:
     error_message: str | None
 
 
+@dataclass
+class GuardrailScan:
+    has_statement_end: bool = False
+    forbidden_keyword: str | None = None
+    tables: set[str] = field(default_factory=set)
+    has_limit_value: bool = False
+    where_position: int | None = None
+    boundary_position: int | None = None
+
+
+def _scan_guardrails(sql: str) -> GuardrailScan:
+    scan = GuardrailScan()
+    for match in GUARDRAIL_PATTERN.finditer(sql):
+        kind = match.lastgroup
+        if kind == "statement_end":
+            scan.has_statement_end = True
+        elif kind == "forbidden":
+            if scan.forbidden_keyword is None:
+                scan.forbidden_keyword = match.group("forbidden")
+        elif kind == "table":
+            table = _normalize_identifier(match.group("table"))
+            if table:
+                scan.tables.add(table)
+        elif kind == "where":
+            if scan.where_position is None:
+                scan.where_position = match.start()
+        else:
+            if match.group("limit_value") is not None:
+                scan.has_limit_value = True
+            if scan.boundary_position is None:
+                scan.boundary_position = match.start()
+    return scan
+
+
 def _normalize_identifier(identifier: str) -> str:
     normalized = identifier.strip().strip("`\"[]")
     if "." in normalized:
@@ -56,6 +94,14 @@ def _escape_sql_literal(value: str) -> str:
     return value.replace("'", "''")
 
 
+def _copy_result(result: SQLExecutionResult) -> SQLExecutionResult:
+    return replace(result, rows_preview=[dict(row) for row in result.rows_preview])
+
+
+def _canonical_isins(entity_isins: Sequence[str]) -> tuple[str, ...]:
+    return tuple(sorted({str(isin).strip().upper() for isin in entity_isins if str(isin).strip()}))
+
+
 class SQLExecutor:
     def __init__(
         self,
@@ -69,6 +115,14 @@ class SQLExecutor:
         self.max_limit = max(1, max_limit)
         if not self.db_path.exists():
             raise FileNotFoundError(f"Equities DB not found: {self.db_path}")
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._result_cache: OrderedDict[tuple[str, bool, tuple[str, ...]], tuple[float, SQLExecutionResult]] = (
+            OrderedDict()
+        )
+        self._result_cache_lock = threading.Lock()
+        self._result_cache_version: tuple[int, ...] | None = None
 
     def validate_and_execute(
         self,
@@ -78,6 +132,27 @@ class SQLExecutor:
         entity_isins: Sequence[str],
     ) -> SQLExecutionResult:
         normalized = self._normalize_sql(sql)
+        normalized_isins = _canonical_isins(entity_isins) if company_specific else ()
+        cache_key = (normalized, company_specific, normalized_isins)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+        result = self._validate_and_execute(
+            normalized,
+            company_specific=company_specific,
+            entity_isins=normalized_isins,
+        )
+        if result.error_code != "SQL_EXECUTION_FAILED":
+            self._store_cached_result(cache_key, result)
+        return result
+
+    def _validate_and_execute(
+        self,
+        normalized: str,
+        *,
+        company_specific: bool,
+        entity_isins: tuple[str, ...],
+    ) -> SQLExecutionResult:
         if not normalized:
             return SQLExecutionResult(
                 sql=None,
@@ -86,7 +161,8 @@ class SQLExecutor:
                 error_message="Generated SQL is empty.",
             )
 
-        if ";" in normalized:
+        scan = _scan_guardrails(normalized)
+        if scan.has_statement_end:
             return SQLExecutionResult(
                 sql=normalized,
                 rows_preview=[],
@@ -94,7 +170,7 @@ class SQLExecutor:
                 error_message="Only a single SELECT statement is allowed.",
             )
 
-        if not re.match(r"^\s*select\b", normalized, flags=re.IGNORECASE):
+        if not SELECT_PATTERN.match(normalized):
             return SQLExecutionResult(
                 sql=normalized,
                 rows_preview=[],
@@ -102,24 +178,22 @@ class SQLExecutor:
                 error_message="Only SELECT statements are allowed.",
             )
 
-        forbidden_match = FORBIDDEN_SQL_PATTERN.search(normalized)
-        if forbidden_match:
+        if scan.forbidden_keyword is not None:
             return SQLExecutionResult(
                 sql=normalized,
                 rows_preview=[],
                 error_code="GUARDRAIL_FORBIDDEN_KEYWORD",
-                error_message=f"Forbidden SQL keyword: {forbidden_match.group(1)}.",
+                error_message=f"Forbidden SQL keyword: {scan.forbidden_keyword}.",
             )
 
-        referenced_tables = self._extract_tables(normalized)
-        if not referenced_tables:
+        if not scan.tables:
             return SQLExecutionResult(
                 sql=normalized,
                 rows_preview=[],
                 error_code="GUARDRAIL_TABLE_REQUIRED",
                 error_message="SQL must reference the equities table.",
             )
-        disallowed = sorted(table for table in referenced_tables if table != "equities")
+        disallowed = sorted(table for table in scan.tables if table != "equities")
         if disallowed:
             return SQLExecutionResult(
                 sql=normalized,
@@ -129,40 +203,35 @@ class SQLExecutor:
             )
 
         guarded_sql = normalized
+        executable_sql = normalized
+        params: tuple[str, ...] = ()
         if company_specific:
-            normalized_isins = sorted(
-                {
-                    str(isin).strip().upper()
-                    for isin in entity_isins
-                    if str(isin).strip()
-                }
-            )
-            if not normalized_isins:
+            if not entity_isins:
                 return SQLExecutionResult(
                     sql=guarded_sql,
                     rows_preview=[],
                     error_code="GUARDRAIL_MISSING_ENTITY_ISIN",
                     error_message="Company-specific SQL requires non-empty entity ISIN list.",
                 )
-            guarded_sql = self._inject_isin_filter(guarded_sql, normalized_isins)
-            if guarded_sql is None:
+            injected = self._inject_isin_filter(guarded_sql, entity_isins, scan)
+            if injected is None:
                 return SQLExecutionResult(
                     sql=normalized,
                     rows_preview=[],
                     error_code="GUARDRAIL_ISIN_FILTER_FAILED",
                     error_message="Failed to enforce mandatory ISIN filter for company-specific SQL.",
                 )
+            guarded_sql, executable_sql = injected
+            params = entity_isins
 
-        if not LIMIT_PATTERN.search(guarded_sql):
+        if not scan.has_limit_value:
             guarded_sql = f"{guarded_sql} LIMIT {self.max_limit}"
+            executable_sql = f"{executable_sql} LIMIT {self.max_limit}"
 
         try:
-            with sqlite3.connect(self.db_path) as connection:
-                connection.row_factory = sqlite3.Row
-                allowed_columns = self._load_columns(connection)
-                connection.set_authorizer(self._build_authorizer(allowed_columns))
-                connection.execute(f"EXPLAIN QUERY PLAN {guarded_sql}").fetchall()
-                rows = connection.execute(guarded_sql).fetchmany(self.preview_limit)
+            connection = self._get_connection()
+            connection.execute(f"EXPLAIN QUERY PLAN {executable_sql}", params).fetchall()
+            rows = connection.execute(executable_sql, params).fetchmany(self.preview_limit)
         except sqlite3.DatabaseError as exc:
             return SQLExecutionResult(
                 sql=guarded_sql,
@@ -179,38 +248,105 @@ class SQLExecutor:
             error_message=None,
         )
 
+    def _get_cached_result(self, key: tuple[str, bool, tuple[str, ...]]) -> SQLExecutionResult | None:
+        version = self._database_version()
+        now = time.monotonic()
+        with self._result_cache_lock:
+            if version != self._result_cache_version:
+                self._result_cache.clear()
+                self._result_cache_version = version
+                return None
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= now:
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+            return _copy_result(result)
+
+    def _store_cached_result(self, key: tuple[str, bool, tuple[str, ...]], result: SQLExecutionResult) -> None:
+        with self._result_cache_lock:
+            self._result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL_SECONDS, _copy_result(result))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _database_version(self) -> tuple[int, ...]:
+        version: list[int] = []
+        for path in (self.db_path, self.db_path.with_name(f"{self.db_path.name}-wal")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                version.extend((0, 0))
+                continue
+            version.extend((stat.st_mtime_ns, stat.st_size))
+        return tuple(version)
+
     def _normalize_sql(self, sql: str) -> str:
         cleaned = (sql or "").strip()
         if cleaned.startswith("```"):
-            cleaned = re.sub(r"^```[a-zA-Z0-9_+-]*\s*", "", cleaned)
-            cleaned = re.sub(r"\s*```$", "", cleaned)
+            cleaned = FENCE_PREFIX_PATTERN.sub("", cleaned)
+            cleaned = FENCE_SUFFIX_PATTERN.sub("", cleaned)
         cleaned = cleaned.strip()
         cleaned = cleaned[:-1].strip() if cleaned.endswith(";") else cleaned
         return cleaned
 
-    def _extract_tables(self, sql: str) -> set[str]:
-        tables: set[str] = set()
-        for matched in TABLE_REF_PATTERN.findall(sql):
-            normalized = _normalize_identifier(matched)
-            if normalized:
-                tables.add(normalized)
-        return tables
-
-    def _inject_isin_filter(self, sql: str, entity_isins: Sequence[str]) -> str | None:
+    def _inject_isin_filter(
+        self,
+        sql: str,
+        entity_isins: Sequence[str],
+        scan: GuardrailScan,
+    ) -> tuple[str, str] | None:
         if not entity_isins:
             return None
 
-        condition = "isin IN (" + ", ".join(f"'{_escape_sql_literal(isin)}'" for isin in entity_isins) + ")"
-        boundary = len(sql)
-        for pattern in CLAUSE_BOUNDARY_PATTERNS:
-            match = pattern.search(sql)
-            if match and match.start() < boundary:
-                boundary = match.start()
-
-        where_match = WHERE_PATTERN.search(sql)
-        if where_match and where_match.start() < boundary:
-            return f"{sql[:boundary]} AND {condition} {sql[boundary:]}".strip()
-        return f"{sql[:boundary]} WHERE {condition} {sql[boundary:]}".strip()
+        literal_condition = "isin IN (" + ", ".join(f"'{_escape_sql_literal(isin)}'" for isin in entity_isins) + ")"
+        bound_condition = "isin IN (" + ", ".join("?" for _ in entity_isins) + ")"
+        boundary = len(sql) if scan.boundary_position is None else scan.boundary_position
+        where_position = scan.where_position
+        keyword = "AND" if where_position is not None and where_position < boundary else "WHERE"
+        head, tail = sql[:boundary], sql[boundary:]
+        return (
+            f"{head} {keyword} {literal_condition} {tail}".strip(),
+            f"{head} {keyword} {bound_condition} {tail}".strip(),
+        )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            connection.execute("PRAGMA query_only = ON;")
+            connection.execute("PRAGMA temp_store = MEMORY;")
+            connection.row_factory = sqlite3.Row
+            with self._connections_lock:
+                self._connections.append(connection)
+            local.connection = connection
+            local.schema_version = None
+            local.authorizer = None
+
+        connection.set_authorizer(None)
+        schema_version = connection.execute("PRAGMA schema_version;").fetchone()[0]
+        if schema_version != local.schema_version:
+            local.authorizer = self._build_authorizer(self._load_columns(connection))
+            local.schema_version = schema_version
+        connection.set_authorizer(local.authorizer)
+        return connection
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
 
     def _load_columns(self, connection: sqlite3.Connection) -> set[str]:
         allowed = {name.lower() for name in table_column_names(connection, "equities")}
@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import time
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, Request, Response
 
 from app.core.errors import ErrorCode
-from app.core.logging import configure_logging, log_event
+from app.core.logging import configure_logging, log_event, stop_log_listener
 from app.core.settings import get_settings
+from app.dependencies import build_question_pipeline, build_upload_service
 from app.web_api.routes.ask import build_ask_router
 from app.web_api.routes.upload import build_upload_router
 
@@ -26,6 +28,38 @@ def _has_multipart_support() -> bool:
             return False
 
 
+def _build_services(app: FastAPI) -> None:
+    if app.state.pipeline is None:
+        try:
+            app.state.pipeline = build_question_pipeline(db_path=app.state.db_path)
+        except Exception as exc:
+            app.state.logger.warning("Question pipeline is not ready at startup error=%s", exc)
+    if app.state.upload_service is None and app.state.multipart_supported:
+        try:
+            app.state.upload_service = build_upload_service(db_path=app.state.db_path)
+        except Exception as exc:
+            app.state.logger.warning("Upload service is not ready at startup error=%s", exc)
+
+
+def _close_services(app: FastAPI) -> None:
+    for service in (app.state.upload_service, app.state.pipeline):
+        close_service = getattr(service, "close", None)
+        if close_service is not None:
+            close_service()
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    _build_services(app)
+    try:
+        yield
+    finally:
+        try:
+            _close_services(app)
+        finally:
+            stop_log_listener(app.state.log_listener)
+
+
 def create_app(
     *,
     db_path: Path = Path("db/equities.db"),
@@ -34,7 +68,11 @@ def create_app(
     debug_response_default: bool | None = None,
 ) -> FastAPI:
     settings = get_settings()
-    app = FastAPI(title="Stock Investment Research Assistant API", version="0.1.0")
+    app = FastAPI(
+        title="Stock Investment Research Assistant API",
+        version="0.1.0",
+        lifespan=_lifespan,
+    )
     app.state.settings = settings
     app.state.db_path = db_path
     app.state.pipeline = pipeline
@@ -44,7 +82,7 @@ def create_app(
         if debug_response_default is None
         else debug_response_default
     )
-    app.state.logger = configure_logging(settings.api_log_level)
+    app.state.logger, app.state.log_listener = configure_logging(settings.api_log_level)
     app.state.multipart_supported = _has_multipart_support()
 
     @app.middleware("http")
@@ -1,103 +1,125 @@
 from __future__ import annotations
 
-import re
-from typing import Any
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
+from app.core.utils import collapse_spaces
 from app.web_api.schemas import (
     AskResponse,
+    SourceItem,
     UploadEquitiesResponse,
     UploadPDFResponse,
     UploadSkippedDocumentResponse,
     UploadSkippedEquityResponse,
 )
 
+if TYPE_CHECKING:
+    from app.pipeline.ask.models import PipelineResult
+
+SKIPPED_DOCUMENT_FIELDS = attrgetter("file_name", "reason", "details")
+SKIPPED_EQUITY_FIELDS = attrgetter("isin", "reason", "row_number")
+
 
 def compact_sql(sql: str | None, *, max_chars: int = 260) -> str:
     if not sql:
         return "-"
-    compact = re.sub(r"\s+", " ", sql).strip()
+    compact = collapse_spaces(sql)
     if len(compact) > max_chars:
         return compact[: max_chars - 3].rstrip() + "..."
     return compact
 
 
 def entity_log_value(entities: list[dict[str, Any]]) -> str:
-    values: list[str] = []
-    for item in entities:
-        isin = str(item.get("isin", "")).strip() or "-"
-        confidence = item.get("confidence")
-        confidence_text = "-" if confidence is None else str(confidence)
-        values.append(f"{isin}:{confidence_text}")
-    return ",".join(values) if values else "-"
+    return ",".join(map(_entity_log_item, entities)) or "-"
+
+
+def _entity_log_item(item: dict[str, Any]) -> str:
+    isin = str(item.get("isin", "")).strip() or "-"
+    confidence = item.get("confidence")
+    return f"{isin}:{'-' if confidence is None else confidence}"
 
 
 def source_log_value(sources: list[dict[str, Any]]) -> str:
-    values: list[str] = []
-    for item in sources:
-        title = str(item.get("title", "")).strip() or "unknown"
-        page = item.get("page")
-        if page is None:
-            values.append(title)
-        else:
-            values.append(f"{title}|p{page}")
-    return ",".join(values) if values else "-"
+    return ",".join(map(_source_log_item, sources)) or "-"
+
+
+def _source_log_item(item: dict[str, Any]) -> str:
+    title = str(item.get("title", "")).strip() or "unknown"
+    page = item.get("page")
+    return title if page is None else f"{title}|p{page}"
+
 
+def to_source_items(sources: list[Any]) -> list[SourceItem]:
+    return [
+        item if isinstance(item, SourceItem) else SourceItem.model_construct(**item)
+        for item in sources
+    ]
 
-def read_field(payload: Any, name: str, default: Any = None) -> Any:
-    if isinstance(payload, dict):
-        return payload.get(name, default)
-    return getattr(payload, name, default)
+
+def build_response(result: PipelineResult | dict[str, Any], *, include_debug: bool) -> AskResponse:
+    if isinstance(result, dict):
+        return _build_from_dict(result, include_debug=include_debug)
+    return _build_from_obj(result, include_debug=include_debug)
+
+
+def _build_from_dict(result: dict[str, Any], *, include_debug: bool) -> AskResponse:
+    if not include_debug:
+        return AskResponse.model_construct(
+            question=result.get("question", ""),
+            answer=result.get("answer", ""),
+            sources=to_source_items(result.get("sources", [])),
+        )
+    return AskResponse.model_construct(
+        question=result.get("question", ""),
+        answer=result.get("answer", ""),
+        sources=to_source_items(result.get("sources", [])),
+        entities=result.get("entities", []),
+        used_sql=result.get("used_sql", False),
+        used_rag=result.get("used_rag", False),
+        sql=result.get("sql"),
+        sql_rows_preview=result.get("sql_rows_preview", []),
+        errors=result.get("errors", []),
+    )
 
 
-def build_response(result: Any, *, include_debug: bool) -> AskResponse:
+def _build_from_obj(result: PipelineResult, *, include_debug: bool) -> AskResponse:
     if not include_debug:
-        return AskResponse(
-            question=read_field(result, "question", ""),
-            answer=read_field(result, "answer", ""),
-            sources=read_field(result, "sources", []),
+        return AskResponse.model_construct(
+            question=result.question,
+            answer=result.answer,
+            sources=to_source_items(result.sources),
         )
-    return AskResponse(
-        question=read_field(result, "question", ""),
-        answer=read_field(result, "answer", ""),
-        sources=read_field(result, "sources", []),
-        entities=read_field(result, "entities", []),
-        used_sql=read_field(result, "used_sql", False),
-        used_rag=read_field(result, "used_rag", False),
-        sql=read_field(result, "sql"),
-        sql_rows_preview=read_field(result, "sql_rows_preview", []),
-        errors=read_field(result, "errors", []),
+    return AskResponse.model_construct(
+        question=result.question,
+        answer=result.answer,
+        sources=to_source_items(result.sources),
+        entities=result.entities,
+        used_sql=result.used_sql,
+        used_rag=result.used_rag,
+        sql=result.sql,
+        sql_rows_preview=result.sql_rows_preview,
+        errors=result.errors,
     )
 
 
 def to_upload_pdf_response(summary: Any) -> UploadPDFResponse:
-    accepted = list(getattr(summary, "accepted", []))
-    skipped_documents = list(getattr(summary, "skipped_documents", []))
-    return UploadPDFResponse(
-        accepted=accepted,
+    return UploadPDFResponse.model_construct(
+        accepted=getattr(summary, "accepted", []),
         skipped_documents=[
-            UploadSkippedDocumentResponse(
-                file_name=getattr(item, "file_name", ""),
-                reason=getattr(item, "reason", "unknown"),
-                details=getattr(item, "details", None),
-            )
-            for item in skipped_documents
+            UploadSkippedDocumentResponse.model_construct(file_name=file_name, reason=reason, details=details)
+            for file_name, reason, details in map(SKIPPED_DOCUMENT_FIELDS, getattr(summary, "skipped_documents", []))
         ],
     )
 
 
 def to_upload_equities_response(summary: Any) -> UploadEquitiesResponse:
-    skipped_items = list(getattr(summary, "skipped", []))
-    return UploadEquitiesResponse(
+    return UploadEquitiesResponse.model_construct(
         file_name=getattr(summary, "file_name", ""),
         added_count=int(getattr(summary, "added_count", 0)),
         updated_count=int(getattr(summary, "updated_count", 0)),
         skipped_count=int(getattr(summary, "skipped_count", 0)),
         skipped=[
-            UploadSkippedEquityResponse(
-                isin=getattr(item, "isin", None),
-                reason=getattr(item, "reason", "unknown"),
-                row_number=getattr(item, "row_number", None),
-            )
-            for item in skipped_items
+            UploadSkippedEquityResponse.model_construct(isin=isin, reason=reason, row_number=row_number)
+            for isin, reason, row_number in map(SKIPPED_EQUITY_FIELDS, getattr(summary, "skipped", []))
         ],
     )
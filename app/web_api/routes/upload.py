@@ -2,55 +2,79 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, BinaryIO
 
-from fastapi import APIRouter, File, HTTPException, Request, UploadFile
+from fastapi import APIRouter, File, HTTPException, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.errors import ErrorCode
-from app.core.logging import log_event
+from app.core.logging import log_event, log_event_fields
 from app.dependencies import build_upload_service
 from app.web_api.mappers import to_upload_equities_response, to_upload_pdf_response
+from app.web_api.responses import PydanticResponse
 from app.web_api.schemas import UploadEquitiesResponse, UploadPDFResponse
 
 
-@dataclass(frozen=True)
-class UploadedBinaryPayload:
+UPLOAD_PDFS_OK_LOG_FIELDS: dict[str, Any] = {
+    "request_id": "-",
+    "component": "api",
+    "operation": "upload_pdfs",
+    "status": "ok",
+    "duration_ms": 0,
+}
+UPLOAD_EQUITIES_OK_LOG_FIELDS: dict[str, Any] = {
+    "request_id": "-",
+    "component": "api",
+    "operation": "upload_equities",
+    "status": "ok",
+    "duration_ms": 0,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class UploadedStreamPayload:
     file_name: str
-    content: bytes
+    stream: BinaryIO
+    size_hint: int | None = None
 
 
 def build_upload_router(*, multipart_supported: bool) -> APIRouter:
     router = APIRouter()
+    upload_service_holder: list[Any] = [None]
 
     def _ensure_upload_service(request: Request) -> Any:
-        upload_service = getattr(request.app.state, "upload_service", None)
+        upload_service = upload_service_holder[0]
         if upload_service is not None:
             return upload_service
-        db_path = getattr(request.app.state, "db_path", None)
-        upload_service = build_upload_service(db_path=db_path)
-        request.app.state.upload_service = upload_service
+        upload_service = getattr(request.app.state, "upload_service", None)
+        if upload_service is None:
+            db_path = getattr(request.app.state, "db_path", None)
+            upload_service = build_upload_service(db_path=db_path)
+            request.app.state.upload_service = upload_service
+        upload_service_holder[0] = upload_service
         return upload_service
 
     if multipart_supported:
         @router.post("/upload/pdfs", response_model=UploadPDFResponse, response_model_exclude_none=True)
-        def upload_pdfs(
+        async def upload_pdfs(
             request: Request,
             files: list[UploadFile] = File(..., description="Up to 20 PDF files."),
-        ) -> UploadPDFResponse:
+        ) -> Response:
             started = time.perf_counter()
             if not files:
                 raise HTTPException(status_code=400, detail="At least one PDF file is required.")
-            payloads: list[UploadedBinaryPayload] = []
+            payloads: list[UploadedStreamPayload] = []
             for item in files:
                 payloads.append(
-                    UploadedBinaryPayload(
+                    UploadedStreamPayload(
                         file_name=item.filename or "upload.pdf",
-                        content=item.file.read(),
+                        stream=item.file,
+                        size_hint=item.size,
                     )
                 )
 
             try:
-                summary = _ensure_upload_service(request).upload_pdfs(payloads)
+                summary = await run_in_threadpool(lambda: _ensure_upload_service(request).upload_pdfs(payloads))
             except ValueError as exc:
                 log_event(
                     request.app.state.logger,
@@ -75,31 +99,32 @@ def build_upload_router(*, multipart_supported: bool) -> APIRouter:
                 )
                 raise HTTPException(status_code=500, detail="Failed to upload PDF documents.") from exc
 
-            log_event(
+            log_event_fields(
                 request.app.state.logger,
-                request_id=getattr(request.state, "request_id", None),
-                component="api",
-                operation="upload_pdfs",
-                status="ok",
-                duration_ms=int((time.perf_counter() - started) * 1000),
-                accepted=len(summary.accepted),
-                skipped=len(summary.skipped_documents),
+                UPLOAD_PDFS_OK_LOG_FIELDS
+                | {
+                    "request_id": getattr(request.state, "request_id", None) or "-",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "accepted": len(summary.accepted),
+                    "skipped": len(summary.skipped_documents),
+                },
             )
-            return to_upload_pdf_response(summary)
+            return PydanticResponse(to_upload_pdf_response(summary))
 
         @router.post("/upload/equities", response_model=UploadEquitiesResponse, response_model_exclude_none=True)
-        def upload_equities(
+        async def upload_equities(
             request: Request,
             file: UploadFile = File(..., description="Single XLSX file."),
-        ) -> UploadEquitiesResponse:
+        ) -> Response:
             started = time.perf_counter()
-            payload = UploadedBinaryPayload(
+            payload = UploadedStreamPayload(
                 file_name=file.filename or "upload.xlsx",
-                content=file.file.read(),
+                stream=file.file,
+                size_hint=file.size,
             )
 
             try:
-                summary = _ensure_upload_service(request).upload_equities(payload)
+                summary = await run_in_threadpool(lambda: _ensure_upload_service(request).upload_equities(payload))
             except ValueError as exc:
                 log_event(
                     request.app.state.logger,
@@ -128,19 +153,19 @@ def build_upload_router(*, multipart_supported: bool) -> APIRouter:
                 )
                 raise HTTPException(status_code=500, detail="Failed to upload equities file.") from exc
 
-            log_event(
+            log_event_fields(
                 request.app.state.logger,
-                request_id=getattr(request.state, "request_id", None),
-                component="api",
-                operation="upload_equities",
-                status="ok",
-                duration_ms=int((time.perf_counter() - started) * 1000),
-                file=summary.file_name,
-                added=summary.added_count,
-                updated=summary.updated_count,
-                skipped=summary.skipped_count,
+                UPLOAD_EQUITIES_OK_LOG_FIELDS
+                | {
+                    "request_id": getattr(request.state, "request_id", None) or "-",
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "file": summary.file_name,
+                    "added": summary.added_count,
+                    "updated": summary.updated_count,
+                    "skipped": summary.skipped_count,
+                },
             )
-            return to_upload_equities_response(summary)
+            return PydanticResponse(to_upload_equities_response(summary))
     else:
         @router.post("/upload/pdfs", response_model=UploadPDFResponse, response_model_exclude_none=True)
         def upload_pdfs_unavailable() -> UploadPDFResponse:
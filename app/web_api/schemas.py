@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.core.utils import collapse_spaces
+
+QUESTION_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=QUESTION_CACHE_SIZE)
+def _normalize_question(value: str) -> str:
+    normalized = collapse_spaces(value)
+    if not normalized:
+        raise ValueError("question must not be empty")
+    return normalized
 
 
 class AskRequest(BaseModel):
@@ -11,13 +24,14 @@ class AskRequest(BaseModel):
     @field_validator("question")
     @classmethod
     def validate_question(cls, value: str) -> str:
-        normalized = " ".join(value.split()).strip()
-        if not normalized:
-            raise ValueError("question must not be empty")
-        return normalized
+        return _normalize_question(value)
+
+
+class ResponseSchema(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
 
 
-class SourceItem(BaseModel):
+class SourceItem(ResponseSchema):
     title: str | None = None
     publisher: str | None = None
     year: int | None = None
@@ -25,7 +39,7 @@ class SourceItem(BaseModel):
     quote_snippet: str | None = None
 
 
-class AskResponse(BaseModel):
+class AskResponse(ResponseSchema):
     question: str
     answer: str
     sources: list[SourceItem] = Field(default_factory=list)
@@ -37,24 +51,24 @@ class AskResponse(BaseModel):
     errors: list[dict[str, Any]] | None = None
 
 
-class UploadSkippedDocumentResponse(BaseModel):
+class UploadSkippedDocumentResponse(ResponseSchema):
     file_name: str
     reason: str
     details: str | None = None
 
 
-class UploadPDFResponse(BaseModel):
+class UploadPDFResponse(ResponseSchema):
     accepted: list[str] = Field(default_factory=list)
     skipped_documents: list[UploadSkippedDocumentResponse] = Field(default_factory=list)
 
 
-class UploadSkippedEquityResponse(BaseModel):
+class UploadSkippedEquityResponse(ResponseSchema):
     isin: str | None = None
     reason: str
     row_number: int | None = None
 
 
-class UploadEquitiesResponse(BaseModel):
+class UploadEquitiesResponse(ResponseSchema):
     file_name: str
     added_count: int
     updated_count: int
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from app.pipeline.ingest.equities.services.normalization import build_alias_rows
+
+
+@pytest.mark.parametrize(
+    ("company_name", "isin", "ticker", "expected"),
+    [
+        (
+            "The Coca-Cola Company",
+            "US1912161007",
+            "KO",
+            [
+                ("coca cola company", "US1912161007", "The Coca-Cola Company", "The Coca-Cola Company", "primary"),
+                ("coca cola", "US1912161007", "coca cola", "The Coca-Cola Company", "short"),
+                ("ko", "US1912161007", "KO", "The Coca-Cola Company", "ticker"),
+            ],
+        ),
+        (
+            "Apple Inc.",
+            "US0378331005",
+            "AAPL",
+            [
+                ("apple", "US0378331005", "Apple Inc.", "Apple Inc.", "primary"),
+                ("aapl", "US0378331005", "AAPL", "Apple Inc.", "ticker"),
+            ],
+        ),
+        (
+            "Alphabet Inc",
+            "US02079K3059",
+            "inc",
+            [
+                ("alphabet", "US02079K3059", "Alphabet Inc", "Alphabet Inc", "primary"),
+                ("inc", "US02079K3059", "INC", "Alphabet Inc", "ticker"),
+            ],
+        ),
+        (
+            "Banco Santander, S.A.",
+            "ES0113900J37",
+            None,
+            [("banco santander", "ES0113900J37", "Banco Santander, S.A.", "Banco Santander, S.A.", "primary")],
+        ),
+        (
+            "Meta Platforms",
+            "US30303M1027",
+            "meta platforms",
+            [("meta platforms", "US30303M1027", "Meta Platforms", "Meta Platforms", "primary")],
+        ),
+        ("  ", "US0000000000", "X", []),
+    ],
+)
+def test_build_alias_rows_keeps_first_alias_per_normalized_text(
+    company_name: str,
+    isin: str,
+    ticker: str | None,
+    expected: list[tuple[str, str, str, str, str]],
+) -> None:
+    assert list(build_alias_rows(company_name, isin, ticker)) == expected
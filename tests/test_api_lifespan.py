@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from app.web_api import main
+
+
+class ClosableService:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_lifespan_closes_services_and_log_listener(monkeypatch: pytest.MonkeyPatch) -> None:
+    stopped = []
+    monkeypatch.setattr(main, "stop_log_listener", stopped.append)
+    pipeline = ClosableService()
+    upload_service = ClosableService()
+    app = main.create_app(pipeline=pipeline, upload_service=upload_service)
+
+    with TestClient(app):
+        assert app.state.pipeline is pipeline
+        assert not pipeline.closed
+
+    assert pipeline.closed
+    assert upload_service.closed
+    assert stopped == [app.state.log_listener]
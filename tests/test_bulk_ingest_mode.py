@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from app.pipeline.ingest.pdf.services.vector_store import DEFAULT_INDEXING_THRESHOLD, bulk_ingest_mode
+
+
+class RecordingQdrantClient:
+    def __init__(self) -> None:
+        self.thresholds: list[tuple[str, int]] = []
+
+    def update_collection(self, *, collection_name, optimizer_config) -> None:
+        self.thresholds.append((collection_name, optimizer_config.indexing_threshold))
+
+
+def test_overlapping_runs_pause_once_and_restore_configured_threshold() -> None:
+    client = RecordingQdrantClient()
+
+    first = bulk_ingest_mode(client, "docs")
+    second = bulk_ingest_mode(client, "docs")
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    assert client.thresholds == [("docs", 0)]
+    second.__exit__(None, None, None)
+
+    assert client.thresholds == [("docs", 0), ("docs", DEFAULT_INDEXING_THRESHOLD)]
+
+
+def test_threshold_is_restored_when_ingest_fails() -> None:
+    client = RecordingQdrantClient()
+
+    with pytest.raises(RuntimeError):
+        with bulk_ingest_mode(client, "docs", indexing_threshold=1000):
+            raise RuntimeError("upload failed")
+
+    assert client.thresholds == [("docs", 0), ("docs", 1000)]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("qdrant_client")
+
+from app.pipeline.ingest.pdf.context import IngestDocumentState, PDFIngestContext
+from app.pipeline.ingest.pdf.models import ChunkBatch
+from app.pipeline.ingest.pdf.services.ingest_service import STREAM_QUEUE_SIZE, PDFIngestService
+
+DOCUMENT_COUNT = STREAM_QUEUE_SIZE * 3 + 2
+
+
+class StubIngestService(PDFIngestService):
+    def __init__(
+        self,
+        *,
+        empty: set[str] = frozenset(),
+        embed_errors: set[str] = frozenset(),
+        crash_in: str | None = None,
+    ) -> None:
+        super().__init__()
+        self.empty = empty
+        self.embed_errors = embed_errors
+        self.crash_in = crash_in
+        self.produced: list[str] = []
+        self.upserted: list[str] = []
+
+    def _require_openai(self, context: PDFIngestContext) -> object:
+        return object()
+
+    def _require_qdrant(self, context: PDFIngestContext) -> object:
+        return object()
+
+    def _iter_chunked_documents(self, context: PDFIngestContext):
+        for item in context.documents:
+            if self.crash_in == "producer" and self.produced:
+                raise RuntimeError("producer failed")
+            self.produced.append(item.doc_id)
+            batch = ChunkBatch(doc_id=item.doc_id)
+            if item.doc_id not in self.empty:
+                batch.point_ids.append(f"{item.doc_id}-0")
+                batch.texts.append(f"text of {item.doc_id}")
+                batch.token_counts.append(3)
+            yield item, batch
+
+    def _embed_documents(self, context, openai_client, documents):
+        if self.crash_in == "embedder":
+            raise RuntimeError("embedder failed")
+        return [
+            ValueError("embedding failed") if item.doc_id in self.embed_errors else [[0.0, 1.0]]
+            for item in documents
+        ]
+
+    def _build_points(self, context, qdrant_client, item, vectors):
+        if isinstance(vectors, Exception):
+            raise vectors
+        return list(item.chunks.point_ids)
+
+    def _upsert_document(self, context, connection, qdrant_client, item) -> bool:
+        if self.crash_in == "consumer":
+            raise RuntimeError("consumer failed")
+        self.upserted.append(item.doc_id)
+        return True
+
+
+def _context(tmp_path: Path) -> PDFIngestContext:
+    return PDFIngestContext(
+        db_connection=sqlite3.connect(":memory:", check_same_thread=False),
+        documents=[
+            IngestDocumentState(
+                pdf_path=tmp_path / f"doc{index}.pdf",
+                pages=[],
+                file_hash=f"hash{index}",
+                doc_id=f"doc{index}",
+                preview_text="",
+            )
+            for index in range(DOCUMENT_COUNT)
+        ],
+    )
+
+
+def _run(service: StubIngestService, context: PDFIngestContext) -> BaseException | None:
+    outcome: list[BaseException | None] = []
+
+    def target() -> None:
+        try:
+            service.chunk_embed_upsert(context)
+        except BaseException as exc:
+            outcome.append(exc)
+        else:
+            outcome.append(None)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "chunk_embed_upsert did not stop"
+    return outcome[0]
+
+
+def test_streams_documents_in_order_and_records_skips(tmp_path: Path) -> None:
+    service = StubIngestService(empty={"doc1"}, embed_errors={"doc3"})
+    context = _context(tmp_path)
+
+    assert _run(service, context) is None
+
+    expected = [f"doc{index}" for index in range(DOCUMENT_COUNT) if index not in (1, 3)]
+    assert service.upserted == expected
+    assert [item.doc_id for item in context.documents] == expected
+    assert [(entry["file_name"], entry["reason"]) for entry in context.skipped_documents] == [
+        ("doc1.pdf", "unreadable"),
+        ("doc3.pdf", "failed_ingest"),
+    ]
+    assert context.failed_docs == 1
+    assert all(item.metadata is not None for item in context.documents)
+
+
+@pytest.mark.parametrize("crash_in", ["producer", "embedder", "consumer"])
+def test_failure_in_any_stage_stops_the_pipeline(tmp_path: Path, crash_in: str) -> None:
+    service = StubIngestService(crash_in=crash_in)
+    context = _context(tmp_path)
+
+    error = _run(service, context)
+
+    assert isinstance(error, RuntimeError)
+    assert str(error) == f"{crash_in} failed"
+    assert len(service.produced) < DOCUMENT_COUNT
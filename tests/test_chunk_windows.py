@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import re
+import uuid
+
+import pytest
+
+pytest.importorskip("tiktoken")
+pytest.importorskip("rapidfuzz")
+
+from app.core.utils import collapse_spaces
+from app.pipeline.ingest.pdf.services.chunking import (
+    point_id_base_hasher,
+    point_id_from_chunk,
+    split_into_token_chunks,
+    split_texts_into_token_chunks,
+)
+
+TOKEN_PATTERN = re.compile(r"\s*\S+|\s+")
+
+
+class WordEncoding:
+    def __init__(self) -> None:
+        self.vocab: list[str] = []
+        self.ids: dict[str, int] = {}
+
+    def encode(self, text: str) -> list[int]:
+        token_ids = []
+        for token in TOKEN_PATTERN.findall(text):
+            if token not in self.ids:
+                self.ids[token] = len(self.vocab)
+                self.vocab.append(token)
+            token_ids.append(self.ids[token])
+        return token_ids
+
+    def decode(self, token_ids: list[int]) -> str:
+        return "".join(self.vocab[token_id] for token_id in token_ids)
+
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        return [self.encode(text) for text in texts]
+
+    def decode_batch(self, batch: list[list[int]]) -> list[str]:
+        return [self.decode(token_ids) for token_ids in batch]
+
+
+def previous_split_into_token_chunks(text: str, encoding, chunk_size: int, overlap_ratio: float):
+    token_ids = encoding.encode(text)
+    if not token_ids:
+        return []
+    overlap_tokens = int(round(chunk_size * overlap_ratio))
+    overlap_tokens = max(0, min(overlap_tokens, chunk_size - 1))
+    step = max(1, chunk_size - overlap_tokens)
+    chunks = []
+    start = 0
+    while start < len(token_ids):
+        end = min(start + chunk_size, len(token_ids))
+        token_slice = token_ids[start:end]
+        chunk_text = collapse_spaces(encoding.decode(token_slice))
+        if chunk_text:
+            chunks.append((chunk_text, len(token_slice)))
+        if end >= len(token_ids):
+            break
+        start += step
+    return chunks
+
+
+def _text(length: int) -> str:
+    return " ".join(f"w{index}" if index % 7 else "   " for index in range(length))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 8])
+@pytest.mark.parametrize("overlap_ratio", [0.0, 0.15, 0.5, 0.99])
+def test_token_windows_match_previous_loop(chunk_size: int, overlap_ratio: float) -> None:
+    encoding = WordEncoding()
+    texts = [_text(length) for length in range(30)]
+
+    expected = [previous_split_into_token_chunks(text, encoding, chunk_size, overlap_ratio) for text in texts]
+
+    assert split_texts_into_token_chunks(texts, encoding, chunk_size, overlap_ratio) == expected
+    assert [split_into_token_chunks(text, encoding, chunk_size, overlap_ratio) for text in texts] == expected
+
+
+@pytest.mark.parametrize(
+    ("doc_id", "page", "chunk_index", "text"),
+    [
+        ("pdf_v1_0123456789abcdef", 1, 0, "Revenue grew 5%."),
+        ("pdf_v1_0123456789abcdef", 12, 3, "Zürich | Genève — 2024"),
+        ("doc|with|pipes", 0, 0, ""),
+    ],
+)
+def test_point_ids_match_uuid5(doc_id: str, page: int, chunk_index: int, text: str) -> None:
+    expected = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{doc_id}|{page}|{chunk_index}|{text}"))
+    base_hasher = point_id_base_hasher(doc_id)
+
+    assert point_id_from_chunk(doc_id, page, chunk_index, text) == expected
+    assert point_id_from_chunk(doc_id, page, chunk_index, text, base_hasher) == expected
+    assert point_id_from_chunk(doc_id, page, chunk_index, text, base_hasher) == expected
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.pipeline.ingest.pdf.models import MentionCatalog
+from app.pipeline.ingest.pdf.services.mentions import build_mention_catalog, detect_mentions, normalize_text
+
+ALIASES = [
+    ("apple", "Apple Inc."),
+    ("bank of america", "Bank of America Corp"),
+    ("america movil", "America Movil SAB"),
+    ("nestle", "Nestle SA"),
+    ("nestle", "Nestle India Ltd"),
+    ("credit suisse group", "Credit Suisse Group AG"),
+    ("suisse group", "Suisse Group Holdings"),
+    ("zurich insurance", "Zürich Insurance Group AG"),
+]
+TICKERS = ["AAPL", "BAC", "BRK", "BRK.A", "BRK.B", "NESN", "A1", "ÄBC", "NOVN-X", "NOVN"]
+WORDS = [
+    "apple",
+    "Apple's",
+    "bank",
+    "of",
+    "America",
+    "movil",
+    "Nestlé",
+    "nestle",
+    "credit",
+    "Suisse",
+    "group",
+    "Zurich",
+    "insurance",
+    "AAPL",
+    "aapl,",
+    "(BAC)",
+    "BRK.A",
+    "brk.b",
+    "BRK-A",
+    "xBRK",
+    "BRK.",
+    "NESN.",
+    "A1B",
+    "ä",
+    "Äbc",
+    "ÄBRK",
+    "NOVN-X",
+    "NOVN-",
+    "straße",
+    "–",
+    "\n",
+    "2024",
+]
+
+
+def previous_detect_mentions(chunk_text: str, catalog: MentionCatalog) -> tuple[list[str], list[str], list[str]]:
+    if not chunk_text:
+        return [], [], []
+    normalized_chunk = f" {normalize_text(chunk_text)} "
+    names = sorted({company for alias, company in catalog.aliases if f" {alias} " in normalized_chunk})
+    names_norm = sorted({normalize_text(name) for name in names if normalize_text(name)})
+    uppercase_chunk = chunk_text.upper()
+    tickers = sorted(ticker for ticker, pattern in catalog.ticker_patterns if pattern.search(uppercase_chunk))
+    return names, names_norm, tickers
+
+
+@pytest.fixture(scope="module")
+def catalog() -> MentionCatalog:
+    return build_mention_catalog(ALIASES, TICKERS, "test")
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", ([], [], [])),
+        (
+            "Bank of America Movil and Credit Suisse Group",
+            (
+                ["America Movil SAB", "Bank of America Corp", "Credit Suisse Group AG", "Suisse Group Holdings"],
+                ["america movil sab", "bank of america corp", "credit suisse group ag", "suisse group holdings"],
+                [],
+            ),
+        ),
+        (
+            "Nestle (NESN) vs brk.a, BRK-B and ÄBC",
+            (["Nestle India Ltd", "Nestle SA"], ["nestle india ltd", "nestle sa"], ["BRK", "BRK.A", "NESN", "ÄBC"]),
+        ),
+        ("BRK.A/BRK.B xAAPL A1B NOVN-X", ([], [], ["BRK", "BRK.A", "BRK.B", "NOVN", "NOVN-X"])),
+    ],
+)
+def test_detect_mentions_examples(
+    catalog: MentionCatalog,
+    text: str,
+    expected: tuple[list[str], list[str], list[str]],
+) -> None:
+    assert detect_mentions(text, catalog) == expected
+    assert previous_detect_mentions(text, catalog) == expected
+
+
+def test_detect_mentions_matches_previous_scan(catalog: MentionCatalog) -> None:
+    rng = random.Random(20240601)
+    for _ in range(2000):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12)))
+        assert detect_mentions(text, catalog) == previous_detect_mentions(text, catalog), text
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from app.pipeline.ingest.equities.services.storage import ensure_schema_columns, initialize_database
+from app.pipeline.ingest.equities.services import upsert_policy
+from app.pipeline.ingest.equities.services.upsert_policy import apply_equities_upsert_policy
+
+
+def _record(isin: str | None, company_name: str, last_update: str | None, ticker: str | None = None) -> dict[str, object]:
+    return {
+        "isin": isin,
+        "company_name": company_name,
+        "normalized_company_name": company_name.lower() or None,
+        "last_update": last_update,
+        "ticker": ticker,
+    }
+
+
+def _apply(connection: sqlite3.Connection, records: list[dict[str, object]], mode: str):
+    initialize_database(connection, mode)
+    ensure_schema_columns(connection)
+    outcome = apply_equities_upsert_policy(connection=connection, records=records, mode=mode)
+    connection.commit()
+    return outcome
+
+
+@pytest.fixture(autouse=True, params=[1, upsert_policy.EXECUTEMANY_BATCH_SIZE])
+def batch_size(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> int:
+    monkeypatch.setattr(upsert_policy, "EXECUTEMANY_BATCH_SIZE", request.param)
+    return request.param
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def test_replace_mode_counts(connection: sqlite3.Connection) -> None:
+    outcome = _apply(
+        connection,
+        [
+            _record("US0001", "Apple Inc", "2024-01-01", "AAPL"),
+            _record("US0002", "Microsoft Corp", "2024-01-01", "MSFT"),
+            _record(None, "No Isin", "2024-01-01"),
+            _record("US0001", "Apple Duplicate", "2024-01-01"),
+            _record("US0003", "", "2024-01-01"),
+            _record("US0004", "Alphabet Inc", None, "GOOGL"),
+        ],
+        "replace",
+    )
+
+    assert (outcome.added_count, outcome.updated_count, outcome.alias_rows) == (3, 0, 6)
+    assert [(item.isin, item.reason, item.row_number) for item in outcome.skipped] == [
+        (None, "missing_isin", 4),
+        ("US0001", "duplicate_in_file", 5),
+        ("US0003", "missing_company_name", 6),
+    ]
+
+
+def test_append_mode_counts(connection: sqlite3.Connection) -> None:
+    _apply(
+        connection,
+        [
+            _record("US0001", "Apple Inc", "2024-01-01", "AAPL"),
+            _record("US0002", "Microsoft Corp", "2024-01-01", "MSFT"),
+            _record("US0004", "Alphabet Inc", None, "GOOGL"),
+        ],
+        "replace",
+    )
+
+    outcome = _apply(
+        connection,
+        [
+            _record("US0001", "Apple Inc", "2024-02-01", "AAPL"),
+            _record("US0002", "Microsoft Corp", "2023-12-01", "MSFT"),
+            _record("US0004", "Alphabet Inc", None),
+            _record("US0005", "Nvidia Corp", "2024-02-01", "NVDA"),
+            _record("US0007", "", "2023-01-01"),
+            _record("US0006", "Amazon Com Inc", "2024-02-01", "AMZN"),
+            _record("US0001", "", "2023-01-01"),
+        ],
+        "append",
+    )
+
+    assert (outcome.added_count, outcome.updated_count, outcome.alias_rows) == (2, 1, 6)
+    assert [(item.isin, item.reason, item.row_number) for item in outcome.skipped] == [
+        ("US0002", "stale_last_update", 3),
+        ("US0004", "missing_last_update", 4),
+        ("US0007", "missing_company_name", 6),
+        ("US0001", "duplicate_in_file", 8),
+    ]
+    assert connection.execute("SELECT isin, company_name, last_update FROM equities ORDER BY isin;").fetchall() == [
+        ("US0001", "Apple Inc", "2024-02-01"),
+        ("US0002", "Microsoft Corp", "2024-01-01"),
+        ("US0004", "Alphabet Inc", None),
+        ("US0005", "Nvidia Corp", "2024-02-01"),
+        ("US0006", "Amazon Com Inc", "2024-02-01"),
+    ]
+    assert connection.execute("SELECT COUNT(*) FROM company_aliases;").fetchone() == (10,)
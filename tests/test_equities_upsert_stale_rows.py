@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from app.pipeline.ingest.equities.services.storage import ensure_schema_columns, initialize_database
+from app.pipeline.ingest.equities.services.upsert_policy import apply_equities_upsert_policy
+
+
+def _record(isin: str | None, company_name: str, last_update: str | None, ticker: str | None = None) -> dict[str, object]:
+    return {
+        "isin": isin,
+        "company_name": company_name,
+        "normalized_company_name": company_name.lower() or None,
+        "last_update": last_update,
+        "ticker": ticker,
+    }
+
+
+def _apply(connection: sqlite3.Connection, records: list[dict[str, object]], mode: str):
+    initialize_database(connection, mode)
+    ensure_schema_columns(connection)
+    outcome = apply_equities_upsert_policy(connection=connection, records=records, mode=mode)
+    connection.commit()
+    return outcome
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def test_append_mode_skips_stale_invalid_row(connection: sqlite3.Connection) -> None:
+    _apply(connection, [_record("US0005", "Nvidia Corp", "2024-02-01", "NVDA")], "replace")
+
+    outcome = _apply(connection, [_record("US0005", "", "2020-01-01")], "append")
+
+    assert (outcome.added_count, outcome.updated_count, outcome.alias_rows) == (0, 0, 0)
+    assert [(item.isin, item.reason, item.row_number) for item in outcome.skipped] == [
+        ("US0005", "stale_last_update", 2),
+    ]
+    assert connection.execute("SELECT company_name FROM equities;").fetchall() == [("Nvidia Corp",)]
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from app.pipeline.ingest.pdf.services import document_store, topic_classifier
+
+PAYLOAD = {"title": "Zürich Insurance", "text": "Q1 \"results\""}
+EXPECTED = '{"title":"Zürich Insurance","text":"Q1 \\"results\\""}'
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_dumps_match_orjson_output(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(topic_classifier, "orjson", None)
+        monkeypatch.setattr(document_store, "orjson", None)
+    assert topic_classifier._dumps_payload(PAYLOAD) == EXPECTED
+    assert document_store._dump_evidence(PAYLOAD) == EXPECTED
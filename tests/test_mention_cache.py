@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tiktoken")
+pytest.importorskip("rapidfuzz")
+
+from app.pipeline.ingest.pdf.services import mention_cache
+from app.pipeline.ingest.pdf.services.mention_cache import (
+    build_mention_cache_row,
+    ensure_mention_cache_table,
+    load_cached_mentions,
+    mention_text_hash,
+    open_mention_cache_reader,
+    store_mention_cache_rows,
+)
+from app.pipeline.ingest.pdf.services.mentions import build_mention_catalog
+from app.pipeline.ingest.pdf.services.page_chunker import chunk_pages
+
+PAGES = [
+    (1, "Apple Inc reported results. AAPL rose while Nestle held steady."),
+    (2, "Nothing to see here."),
+    (3, "NESN and Apple were both mentioned again."),
+]
+
+
+class SpaceEncoding:
+    def encode_batch(self, texts: list[str]) -> list[list[str]]:
+        return [text.split(" ") if text else [] for text in texts]
+
+    def decode_batch(self, batch: list[list[str]]) -> list[str]:
+        return [" ".join(tokens) for tokens in batch]
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "metadata.db"
+    with sqlite3.connect(path) as connection:
+        ensure_mention_cache_table(connection)
+    return path
+
+
+def _chunk(catalog, mention_cache=None):
+    return chunk_pages(
+        doc_id="doc",
+        pages=PAGES,
+        encoding=SpaceEncoding(),
+        catalog=catalog,
+        chunk_size=4,
+        overlap_ratio=0.25,
+        dedup_similarity=0.95,
+        mention_cache=mention_cache,
+    )
+
+
+def _mentions(batch):
+    return list(zip(batch.mentions_company_names, batch.mentions_company_names_norm, batch.mentions_tickers))
+
+
+def test_rows_round_trip_per_catalog_version(db_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(mention_cache, "LOOKUP_BATCH_SIZE", 2)
+    mentions = {
+        mention_text_hash(f"text {index}"): ([f"Company {index}"], [f"company {index}"], ["AB"] if index % 2 else [])
+        for index in range(5)
+    }
+    with sqlite3.connect(db_path) as connection:
+        store_mention_cache_rows(
+            connection,
+            "v1",
+            [build_mention_cache_row(text_hash, value) for text_hash, value in mentions.items()],
+        )
+        first_hash = next(iter(mentions))
+        store_mention_cache_rows(connection, "v1", [build_mention_cache_row(first_hash, ([], [], []))])
+
+        assert load_cached_mentions(connection, "v1", [*mentions, "missing"]) == mentions
+        assert load_cached_mentions(connection, "v2", list(mentions)) == {}
+
+
+def test_cached_chunking_matches_uncached(db_path: Path) -> None:
+    catalog = build_mention_catalog([("apple", "Apple Inc"), ("nestle", "Nestle SA")], ["AAPL", "NESN"], "v1")
+    uncached = _chunk(catalog)
+
+    with closing(open_mention_cache_reader(db_path)) as reader:
+        first = _chunk(catalog, reader)
+    with sqlite3.connect(db_path) as connection:
+        store_mention_cache_rows(connection, catalog.version, first.mention_cache_rows)
+    with closing(open_mention_cache_reader(db_path)) as reader:
+        second = _chunk(catalog, reader)
+
+    assert any(uncached.mentions_company_names)
+    assert any(uncached.mentions_tickers)
+    assert _mentions(first) == _mentions(uncached)
+    assert _mentions(second) == _mentions(uncached)
+    assert len(first.mention_cache_rows) == len(uncached)
+    assert second.mention_cache_rows == []
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+pytest.importorskip("openai")
+
+from app.pipeline.ingest.pdf.models import DocumentMetadata
+from app.pipeline.ingest.pdf.services.metadata_extraction import (
+    build_metadata_cache_key,
+    ensure_metadata_cache_table,
+    load_cached_metadata,
+    store_cached_metadata,
+)
+
+
+def _metadata(meta_source: str = "llm") -> DocumentMetadata:
+    return DocumentMetadata(
+        title="Annual Report 2023",
+        publisher="Zürich Insurance",
+        year=2023,
+        confidence=0.91,
+        evidence={"title_line": "Annual Report 2023", "publisher_line": None, "year_line": "2023"},
+        meta_source=meta_source,
+        title_source="llm",
+    )
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    ensure_metadata_cache_table(connection)
+    yield connection
+    connection.close()
+
+
+def test_cache_key_depends_on_every_input() -> None:
+    key = build_metadata_cache_key("hash", "gpt-4o-mini", 0.7)
+
+    assert key == build_metadata_cache_key("hash", "gpt-4o-mini", 0.7)
+    assert len(
+        {
+            key,
+            build_metadata_cache_key("other", "gpt-4o-mini", 0.7),
+            build_metadata_cache_key("hash", "gpt-4o", 0.7),
+            build_metadata_cache_key("hash", "gpt-4o-mini", 0.8),
+        }
+    ) == 4
+
+
+def test_metadata_round_trips(connection: sqlite3.Connection) -> None:
+    store_cached_metadata(connection, "key", "a.pdf", _metadata())
+
+    assert load_cached_metadata(connection, "key", "a.pdf") == _metadata()
+    assert load_cached_metadata(connection, "missing", "a.pdf") is None
+
+
+def test_filename_fallback_is_not_cached(connection: sqlite3.Connection) -> None:
+    store_cached_metadata(connection, "key", "a.pdf", _metadata("filename_fallback"))
+
+    assert load_cached_metadata(connection, "key", "a.pdf") is None
+
+
+def test_malformed_entry_is_ignored(connection: sqlite3.Connection) -> None:
+    connection.execute("INSERT INTO metadata_cache (cache_key, payload) VALUES ('key', '{\"title\": 1}');")
+
+    assert load_cached_metadata(connection, "key", "a.pdf") is None
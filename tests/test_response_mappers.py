@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pydantic")
+
+from app.pipeline.ask.models import PipelineResult
+from app.pipeline.ingest.equities.services.upsert_policy import SkippedEquity
+from app.pipeline.ingest.pdf.models import IngestSkippedDocument
+from app.web_api.mappers import build_response, to_upload_equities_response, to_upload_pdf_response
+from app.web_api.schemas import (
+    AskResponse,
+    UploadEquitiesResponse,
+    UploadPDFResponse,
+    UploadSkippedDocumentResponse,
+    UploadSkippedEquityResponse,
+)
+
+SOURCES = [
+    {"title": "Outlook 2024", "publisher": "Pictet", "year": 2024, "page": 3, "quote_snippet": "Rates fall."},
+    {"title": None, "publisher": None, "year": None, "page": None, "quote_snippet": None},
+]
+PIPELINE_RESULT = PipelineResult(
+    question="What is Apple's PE?",
+    intent="hybrid",
+    raw_intent="hybrid",
+    company_specific=True,
+    intent_confidence=0.9,
+    entities=[{"isin": "US0378331005", "confidence": 0.98}],
+    used_sql=True,
+    used_rag=True,
+    sql="select pe from equities",
+    sql_rows_preview=[{"pe": 28.5}],
+    answer="Apple trades at 28.5x earnings.",
+    sources=SOURCES,
+    errors=[],
+)
+FALLBACK_RESULT = {
+    "question": "What is Apple's PE?",
+    "answer": "I'm unable to process this request right now. Please try again.",
+    "sources": [],
+    "entities": [],
+    "used_sql": False,
+    "used_rag": False,
+    "sql": None,
+    "sql_rows_preview": [],
+    "errors": [{"code": "API_RUNTIME_ERROR", "message": "Unexpected API failure."}],
+}
+
+
+def _read_field(payload: Any, name: str, default: Any = None) -> Any:
+    if isinstance(payload, dict):
+        return payload.get(name, default)
+    return getattr(payload, name, default)
+
+
+def previous_build_response(result: Any, *, include_debug: bool) -> AskResponse:
+    if not include_debug:
+        return AskResponse(
+            question=_read_field(result, "question", ""),
+            answer=_read_field(result, "answer", ""),
+            sources=_read_field(result, "sources", []),
+        )
+    return AskResponse(
+        question=_read_field(result, "question", ""),
+        answer=_read_field(result, "answer", ""),
+        sources=_read_field(result, "sources", []),
+        entities=_read_field(result, "entities", []),
+        used_sql=_read_field(result, "used_sql", False),
+        used_rag=_read_field(result, "used_rag", False),
+        sql=_read_field(result, "sql"),
+        sql_rows_preview=_read_field(result, "sql_rows_preview", []),
+        errors=_read_field(result, "errors", []),
+    )
+
+
+@pytest.mark.parametrize("result", [PIPELINE_RESULT, FALLBACK_RESULT], ids=["pipeline", "fallback"])
+@pytest.mark.parametrize("include_debug", [False, True])
+def test_ask_response_matches_validated_model(result: Any, include_debug: bool) -> None:
+    response = build_response(result, include_debug=include_debug)
+    expected = previous_build_response(result, include_debug=include_debug)
+
+    assert response == expected
+    assert response.model_dump_json(exclude_none=True) == expected.model_dump_json(exclude_none=True)
+
+
+def test_upload_pdf_response_matches_validated_model() -> None:
+    summary = SimpleNamespace(
+        accepted=["a.pdf"],
+        skipped_documents=[
+            IngestSkippedDocument(file_name="b.pdf", reason="duplicate"),
+            IngestSkippedDocument(file_name="c.pdf", reason="failed_ingest", details="timeout"),
+        ],
+    )
+    expected = UploadPDFResponse(
+        accepted=["a.pdf"],
+        skipped_documents=[
+            UploadSkippedDocumentResponse(file_name="b.pdf", reason="duplicate"),
+            UploadSkippedDocumentResponse(file_name="c.pdf", reason="failed_ingest", details="timeout"),
+        ],
+    )
+
+    response = to_upload_pdf_response(summary)
+
+    assert response == expected
+    assert response.model_dump_json(exclude_none=True) == expected.model_dump_json(exclude_none=True)
+
+
+def test_upload_equities_response_matches_validated_model() -> None:
+    summary = SimpleNamespace(
+        file_name="equities.xlsx",
+        added_count=2,
+        updated_count=1,
+        skipped_count=2,
+        skipped=[
+            SkippedEquity(isin=None, reason="missing_isin", row_number=4),
+            SkippedEquity(isin="US1", reason="stale_last_update"),
+        ],
+    )
+    expected = UploadEquitiesResponse(
+        file_name="equities.xlsx",
+        added_count=2,
+        updated_count=1,
+        skipped_count=2,
+        skipped=[
+            UploadSkippedEquityResponse(isin=None, reason="missing_isin", row_number=4),
+            UploadSkippedEquityResponse(isin="US1", reason="stale_last_update"),
+        ],
+    )
+
+    response = to_upload_equities_response(summary)
+
+    assert response == expected
+    assert response.model_dump_json(exclude_none=True) == expected.model_dump_json(exclude_none=True)
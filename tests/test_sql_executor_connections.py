@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.sql_executor import SQLExecutor
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "equities.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE equities (isin TEXT, company_name TEXT);")
+    connection.execute("INSERT INTO equities VALUES ('US1', 'A');")
+    connection.commit()
+    connection.close()
+    return path
+
+
+def _run_query(executor: SQLExecutor, sql: str) -> None:
+    result = executor.validate_and_execute(sql, company_specific=False, entity_isins=[])
+    assert result.error_code is None
+
+
+def test_read_path_leaves_journal_mode_alone(db_path: Path) -> None:
+    executor = SQLExecutor(db_path=db_path)
+    _run_query(executor, "select isin from equities")
+    executor.close()
+
+    connection = sqlite3.connect(db_path)
+    assert connection.execute("PRAGMA journal_mode;").fetchone() == ("delete",)
+    connection.close()
+
+
+def test_connection_is_read_only(db_path: Path) -> None:
+    executor = SQLExecutor(db_path=db_path)
+    connection = executor._get_connection()
+    connection.set_authorizer(None)
+
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute("INSERT INTO equities VALUES ('US2', 'B');")
+    executor.close()
+
+
+def test_close_closes_connections_from_all_threads(db_path: Path) -> None:
+    executor = SQLExecutor(db_path=db_path)
+    threads = [
+        threading.Thread(target=_run_query, args=(executor, f"select isin from equities limit {index + 1}"))
+        for index in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    connections = list(executor._connections)
+
+    executor.close()
+
+    assert len(connections) == 3
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1;")
+    _run_query(executor, "select company_name from equities")
+    executor.close()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.sql_executor import GuardrailScan, SQLExecutor, _scan_guardrails
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "equities.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE equities (isin TEXT, company_name TEXT, pe REAL);")
+    connection.executemany(
+        "INSERT INTO equities VALUES (?, ?, ?);",
+        [("US1", "O'Co", 1.0), ("US2", "B", 2.0), ("US3", "C", 3.0)],
+    )
+    connection.execute("CREATE TABLE secret (x TEXT);")
+    connection.commit()
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def executor(db_path: Path):
+    sql_executor = SQLExecutor(db_path=db_path)
+    yield sql_executor
+    sql_executor.close()
+
+
+@pytest.mark.parametrize(
+    ("sql", "error_code", "error_message"),
+    [
+        ("", "SQL_EMPTY", "Generated SQL is empty."),
+        (
+            "select isin from equities; select 1",
+            "GUARDRAIL_MULTI_STATEMENT",
+            "Only a single SELECT statement is allowed.",
+        ),
+        ("delete from equities", "GUARDRAIL_SELECT_ONLY", "Only SELECT statements are allowed."),
+        (
+            "select isin from equities where isin in (select 1) union select 1 from equities group by 1 "
+            "having count(*) > 0 and 1 = (select 1) -- drop",
+            "GUARDRAIL_FORBIDDEN_KEYWORD",
+            "Forbidden SQL keyword: drop.",
+        ),
+        (
+            "SELECT isin FROM equities WHERE pe > 0 -- Update",
+            "GUARDRAIL_FORBIDDEN_KEYWORD",
+            "Forbidden SQL keyword: Update.",
+        ),
+        (
+            "SELECT isin FROM equities WHERE update_flag = 1",
+            "SQL_EXECUTION_FAILED",
+            "no such column: update_flag",
+        ),
+        ("select 1", "GUARDRAIL_TABLE_REQUIRED", "SQL must reference the equities table."),
+        ("select x from other", "GUARDRAIL_TABLE_NOT_ALLOWED", "Only table 'equities' is allowed. Found: other."),
+        (
+            'select isin from equities where isin in (select x from "secret")',
+            "GUARDRAIL_TABLE_NOT_ALLOWED",
+            "Only table 'equities' is allowed. Found: secret.",
+        ),
+        (
+            "select e.isin from main.equities e join [Other] o on 1 = 1",
+            "GUARDRAIL_TABLE_NOT_ALLOWED",
+            "Only table 'equities' is allowed. Found: other.",
+        ),
+    ],
+)
+def test_guardrails_reject_unsafe_sql(executor: SQLExecutor, sql: str, error_code: str, error_message: str) -> None:
+    result = executor.validate_and_execute(sql, company_specific=False, entity_isins=[])
+
+    assert result.error_code == error_code
+    assert result.error_message == error_message
+    assert result.rows_preview == []
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected_sql", "expected_rows"),
+    [
+        (
+            "select * from equities",
+            "select * from equities LIMIT 50",
+            [
+                {"isin": "US1", "company_name": "O'Co", "pe": 1.0},
+                {"isin": "US2", "company_name": "B", "pe": 2.0},
+                {"isin": "US3", "company_name": "C", "pe": 3.0},
+            ],
+        ),
+        (
+            "```sql\nselect isin from equities limit 2;```",
+            "select isin from equities limit 2",
+            [{"isin": "US1"}, {"isin": "US2"}],
+        ),
+        (
+            "select isin from equities order by pe desc limit 1 offset 1",
+            "select isin from equities order by pe desc limit 1 offset 1",
+            [{"isin": "US2"}],
+        ),
+    ],
+)
+def test_guardrails_allow_single_select(
+    executor: SQLExecutor,
+    sql: str,
+    expected_sql: str,
+    expected_rows: list[dict[str, object]],
+) -> None:
+    result = executor.validate_and_execute(sql, company_specific=False, entity_isins=[])
+
+    assert result.error_code is None
+    assert result.sql == expected_sql
+    assert result.rows_preview == expected_rows
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        (
+            "select isin from equities where pe > 1 group by isin order by pe limit 3",
+            GuardrailScan(tables={"equities"}, has_limit_value=True, where_position=26, boundary_position=39),
+        ),
+        (
+            'select a.isin from "Equities" a join main.Other b on 1 = 1; drop table x',
+            GuardrailScan(has_statement_end=True, forbidden_keyword="drop", tables={"equities", "other"}),
+        ),
+        (
+            "select isin from equities limit",
+            GuardrailScan(tables={"equities"}, boundary_position=26),
+        ),
+        (
+            "select pragma_x from equities offset 2",
+            GuardrailScan(tables={"equities"}, boundary_position=30),
+        ),
+    ],
+)
+def test_scan_guardrails(sql: str, expected: GuardrailScan) -> None:
+    assert _scan_guardrails(sql) == expected
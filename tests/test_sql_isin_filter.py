@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.sql_executor import SQLExecutor, _scan_guardrails
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "equities.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE equities (isin TEXT, company_name TEXT, pe REAL);")
+    connection.executemany(
+        "INSERT INTO equities VALUES (?, ?, ?);",
+        [("US1", "O'Co", 1.0), ("US2", "B", 2.0), ("US3", "C", 3.0)],
+    )
+    connection.execute("CREATE TABLE secret (x TEXT);")
+    connection.commit()
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def executor(db_path: Path):
+    sql_executor = SQLExecutor(db_path=db_path)
+    yield sql_executor
+    sql_executor.close()
+
+
+@pytest.mark.parametrize(
+    ("sql", "entity_isins", "expected_sql", "expected_rows"),
+    [
+        (
+            "select company_name from equities where pe > 1 order by pe",
+            ["us2", "US3"],
+            "select company_name from equities where pe > 1  AND isin IN ('US2', 'US3') order by pe LIMIT 50",
+            [{"company_name": "B"}, {"company_name": "C"}],
+        ),
+        (
+            "select company_name from equities",
+            [" US1 ", "US1", ""],
+            "select company_name from equities WHERE isin IN ('US1') LIMIT 50",
+            [{"company_name": "O'Co"}],
+        ),
+        (
+            "select isin, count(*) as n from equities group by isin limit 5",
+            ["US3", "US1"],
+            "select isin, count(*) as n from equities  WHERE isin IN ('US1', 'US3') group by isin limit 5",
+            [{"isin": "US1", "n": 1}, {"isin": "US3", "n": 1}],
+        ),
+        (
+            "select company_name from equities where isin = 'US1'",
+            ["O'X"],
+            "select company_name from equities where isin = 'US1' AND isin IN ('O''X') LIMIT 50",
+            [],
+        ),
+    ],
+)
+def test_company_specific_sql_gets_isin_filter(
+    executor: SQLExecutor,
+    sql: str,
+    entity_isins: list[str],
+    expected_sql: str,
+    expected_rows: list[dict[str, object]],
+) -> None:
+    result = executor.validate_and_execute(sql, company_specific=True, entity_isins=entity_isins)
+
+    assert result.error_code is None
+    assert result.sql == expected_sql
+    assert result.rows_preview == expected_rows
+
+
+def test_company_specific_sql_requires_isins(executor: SQLExecutor) -> None:
+    result = executor.validate_and_execute("select isin from equities", company_specific=True, entity_isins=[" "])
+
+    assert result.error_code == "GUARDRAIL_MISSING_ENTITY_ISIN"
+    assert result.sql == "select isin from equities"
+
+
+@pytest.mark.parametrize(
+    ("sql", "entity_isins", "expected"),
+    [
+        (
+            "select isin from equities",
+            ("US1",),
+            ("select isin from equities WHERE isin IN ('US1')", "select isin from equities WHERE isin IN (?)"),
+        ),
+        (
+            "select isin from equities where pe > 1 order by pe",
+            ("US1", "O'X"),
+            (
+                "select isin from equities where pe > 1  AND isin IN ('US1', 'O''X') order by pe",
+                "select isin from equities where pe > 1  AND isin IN (?, ?) order by pe",
+            ),
+        ),
+        (
+            "select isin from equities group by isin",
+            ("US1",),
+            (
+                "select isin from equities  WHERE isin IN ('US1') group by isin",
+                "select isin from equities  WHERE isin IN (?) group by isin",
+            ),
+        ),
+        ("select isin from equities", (), None),
+    ],
+)
+def test_inject_isin_filter(
+    executor: SQLExecutor,
+    sql: str,
+    entity_isins: tuple[str, ...],
+    expected: tuple[str, str] | None,
+) -> None:
+    assert executor._inject_isin_filter(sql, entity_isins, _scan_guardrails(sql)) == expected
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.sql_executor import SQLExecutor
+
+SQL = "select isin, pe from equities limit 1"
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "equities.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE equities (isin TEXT, company_name TEXT, pe REAL);")
+    connection.execute("INSERT INTO equities VALUES ('US1', 'A', 1.0);")
+    connection.commit()
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def executor(db_path: Path):
+    sql_executor = SQLExecutor(db_path=db_path)
+    yield sql_executor
+    sql_executor.close()
+
+
+def _run(executor: SQLExecutor, sql: str = SQL):
+    return executor.validate_and_execute(sql, company_specific=False, entity_isins=[])
+
+
+def test_results_follow_schema_changes(executor: SQLExecutor, db_path: Path) -> None:
+    first = _run(executor, "select * from equities limit 1")
+    connection = sqlite3.connect(db_path)
+    connection.execute("ALTER TABLE equities ADD COLUMN sector TEXT;")
+    connection.commit()
+    connection.close()
+
+    second = _run(executor, "select * from equities limit 1")
+
+    assert first.rows_preview == [{"isin": "US1", "company_name": "A", "pe": 1.0}]
+    assert second.rows_preview == [{"isin": "US1", "company_name": "A", "pe": 1.0, "sector": None}]
+
+
+def test_cached_results_are_not_shared(executor: SQLExecutor) -> None:
+    first = _run(executor)
+    first.rows_preview[0]["pe"] = 99.0
+    first.rows_preview.append({"isin": "US9", "pe": 9.0})
+
+    second = _run(executor)
+    second.rows_preview.clear()
+
+    assert _run(executor).rows_preview == [{"isin": "US1", "pe": 1.0}]
+
+
+def test_execution_failures_are_not_cached(executor: SQLExecutor, monkeypatch: pytest.MonkeyPatch) -> None:
+    get_connection = executor._get_connection
+    calls = []
+
+    def flaky_connection() -> sqlite3.Connection:
+        calls.append(None)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        return get_connection()
+
+    monkeypatch.setattr(executor, "_get_connection", flaky_connection)
+
+    failed = _run(executor)
+    retried = _run(executor)
+
+    assert failed.error_code == "SQL_EXECUTION_FAILED"
+    assert retried.error_code is None
+    assert retried.rows_preview == [{"isin": "US1", "pe": 1.0}]